@@ -0,0 +1,57 @@
+# accounts/backends.py
+"""
+E-posta ile giriş.
+
+Kullanıcı ``LOWER(email) = %s`` ile aranır (auth_user üzerinde
+``auth_user_email_lower_idx`` fonksiyonel index'i, migration 0004); şirket ve
+öğrenci profili aynı sorguda LEFT JOIN ile gelir, login_view hesap türünü
+ek sorgu yapmadan belirler. Kullanıcı adıyla giriş (admin)
+AUTHENTICATION_BACKENDS'te ikinci sıradaki ModelBackend'e bırakılır.
+Oturumdaki kullanıcı da aynı şekilde yüklenir (accounts.identity).
+"""
+from asgiref.sync import sync_to_async
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.models import User
+from django.db.models.functions import Lower
+
+from .identity import identity_queryset, load_identity
+
+EMAIL_INDEX_NAME = "auth_user_email_lower_idx"
+
+
+def users_by_email(email: str):
+    return (
+        identity_queryset()
+        .alias(email_lower=Lower("email"))
+        .filter(email_lower=(email or "").strip().lower())
+        .order_by("id")
+    )
+
+
+class EmailBackend(ModelBackend):
+    def authenticate(self, request, username=None, password=None, email=None, **kwargs):
+        # Kullanıcı adıyla giriş listedeki ModelBackend'de; burada da denemek
+        # başarısız girişte parolayı iki kez hash'lerdi
+        if email is None or password is None:
+            return None
+
+        # Aynı e-postalı birden çok hesapta ilki kullanılır (eski davranış)
+        matches = list(users_by_email(email)[:2])
+        if not matches:
+            # Var olmayan e-posta ile var olan arasındaki süre farkını azalt
+            User().set_password(password)
+            return None
+        user = matches[0]
+        if user.check_password(password) and self.user_can_authenticate(user):
+            user.has_duplicate_email = len(matches) > 1
+            return user
+        return None
+
+    def get_user(self, user_id):
+        # AuthenticationMiddleware her istekte çağırır
+        user = load_identity(user_id)
+        return user if user is not None and self.user_can_authenticate(user) else None
+
+    async def aget_user(self, user_id):
+        # ModelBackend.aget_user ilişkileri yüklemez; request.auser() da aynı yoldan
+        return await sync_to_async(self.get_user)(user_id)
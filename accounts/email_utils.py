@@ -1,6 +1,5 @@
 # profiles/email_utils.py
-from django.conf import settings
-from django.core.mail import EmailMultiAlternatives
+from .outbox import enqueue_email
 
 def build_company_verification_subject(company_name: str | None = None) -> str:
     base = "lazyIntern | Company email verification"
@@ -35,11 +34,8 @@ def build_company_verification_bodies(code: str, company_name: str | None = None
     """
     return text_body, html_body
 
-def send_company_verification_email(to_email: str, code: str, company_name: str | None = None) -> int:
+def queue_company_verification_email(to_email: str, code: str, company_name: str | None = None):
+    """Maili outbox'a yazar; gönderimi `send_outbox` worker'ı yapar (accounts.outbox)."""
     subject = build_company_verification_subject(company_name)
     text_body, html_body = build_company_verification_bodies(code, company_name)
-    from_email = getattr(settings, "DEFAULT_FROM_EMAIL", "no-reply@lazyintern.local")
-
-    msg = EmailMultiAlternatives(subject, text_body, from_email, [to_email])
-    msg.attach_alternative(html_body, "text/html")
-    return msg.send(fail_silently=False)
+    return enqueue_email(subject, text_body, [to_email], html_body=html_body)
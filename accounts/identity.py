@@ -0,0 +1,70 @@
+# accounts/identity.py
+"""
+İstek kimliği: oturumdaki kullanıcı, şirketi ve öğrenci profiliyle birlikte.
+
+AuthenticationMiddleware ``request.user``'ı EmailBackend.get_user ile
+yükler; kullanıcı ``company`` ve ``profile`` LEFT JOIN'leriyle tek sorguda
+gelir. View'lar ``request.user.company`` / ``user_company(request.user)``
+ile ek sorgu yapmadan hesap türünü bilir (öğrencide şirket None olarak
+önbelleklidir, DoesNotExist sorgusu atılmaz).
+
+IDENTITY_CACHE_TIMEOUT > 0 ise yüklenen kimlik kullanıcı id'siyle cache'te
+kısa süre tutulur; User / Profile / Company kaydedilip silindiğinde
+(accounts.signals) anahtar silinir. Oturum doğrulaması (parola hash'i)
+her istekte cache'teki kullanıcıyla yapılmaya devam eder. ``update()`` ile
+yapılan toplu yazımlar (completion_score, updated_at) sinyal göndermediği
+için bu alanlar cache'te en fazla timeout kadar eski kalabilir; kimlik
+yönlendirme ve yetki içindir, bu alanlar için profil ayrıca yüklenmelidir.
+"""
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+
+
+def identity_queryset():
+    return User._default_manager.select_related("company", "profile")
+
+
+def identity_cache_key(user_id) -> str:
+    return f"accounts:identity:{user_id}"
+
+
+def identity_cache_timeout() -> int:
+    return getattr(settings, "IDENTITY_CACHE_TIMEOUT", 0)
+
+
+def load_identity(user_id):
+    timeout = identity_cache_timeout()
+    if timeout:
+        user = cache.get(identity_cache_key(user_id))
+        if user is not None:
+            return user
+    user = identity_queryset().filter(pk=user_id).first()
+    if user is not None and timeout:
+        cache.set(identity_cache_key(user_id), user, timeout)
+    return user
+
+
+def invalidate_identity(user_id) -> None:
+    if user_id and identity_cache_timeout():
+        cache.delete(identity_cache_key(user_id))
+
+
+async def arequest_user(request):
+    """
+    Async view'larda ``request.auser()``; ``request.user`` da aynı nesneye
+    bağlanır (şablonlar ve sync kod kullanıcıyı yeniden sorgulamaz).
+    """
+    user = await request.auser()
+    request.user = user
+    return user
+
+
+def user_company(user):
+    """Kimlikle yüklenmiş şirket ya da None (sorgu yapmaz)."""
+    return getattr(user, "company", None)
+
+
+def user_profile(user):
+    """Kimlikle yüklenmiş öğrenci profili ya da None (sorgu yapmaz)."""
+    return getattr(user, "profile", None)
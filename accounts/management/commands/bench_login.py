@@ -0,0 +1,106 @@
+import random
+import time
+
+from django.contrib.auth import authenticate
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import override_settings
+
+from accounts.identity import user_company, user_profile
+from profiles.models import Company, Profile
+
+FAST_HASHER = "django.contrib.auth.hashers.MD5PasswordHasher"
+PASSWORD = "bench-password"
+PREFIX = "bench-login-"
+
+
+def _legacy_login(email, user_type):
+    """Eski login_view akışı (session yazımı hariç)."""
+    users = User.objects.filter(email__iexact=email)
+    if not users.exists():
+        return None
+    users.count()
+    user_obj = users.first()
+    user = authenticate(username=user_obj.username, password=PASSWORD)
+    if user is None:
+        return None
+    has_company = Company.objects.filter(user=user).exists()
+    if user_type == "student" and not has_company:
+        Profile.objects.get_or_create(user=user)
+    elif user_type == "company" and has_company:
+        Company.objects.filter(user=user).first().slug
+    return user
+
+
+def _email_login(email, user_type):
+    user = authenticate(email=email, password=PASSWORD)
+    if user is None:
+        return None
+    company = user_company(user)
+    if user_type == "student" and company is None and user_profile(user) is None:
+        Profile.objects.get_or_create(user=user)
+    elif user_type == "company" and company is not None:
+        company.slug
+    return user
+
+
+class Command(BaseCommand):
+    help = (
+        "login_view kimlik doğrulama yolunu (eski iexact + ayrı sorgular / EmailBackend) "
+        "sorgu sayısı ve saniyedeki giriş açısından karşılaştırır. Parola hash'i "
+        "varsayılan olarak hızlı hasher ile ölçülür (sadece veritabanı maliyeti). "
+        "Veri geçici olarak üretilir ve transaction geri alınır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, nargs="+", default=[10_000, 100_000])
+        parser.add_argument("--logins", type=int, default=2000)
+        parser.add_argument("--real-hasher", action="store_true", help="Ayarlardaki PASSWORD_HASHERS ile ölç")
+
+    def handle(self, *args, **options):
+        hashers = None if options["real_hasher"] else [FAST_HASHER]
+        with override_settings(**({"PASSWORD_HASHERS": hashers} if hashers else {})):
+            self.stdout.write(f"{'users':>8} {'path':<8} {'queries/login':>13} {'logins/s':>9}")
+            for size in options["users"]:
+                with transaction.atomic():
+                    emails = self._seed(size)
+                    rng = random.Random(7)
+                    sample = [rng.choice(emails) for _ in range(options["logins"])]
+                    for name, login in (("legacy", _legacy_login), ("email", _email_login)):
+                        queries, rate = self._run(login, sample)
+                        self.stdout.write(f"{size:>8} {name:<8} {queries:>13.1f} {rate:>9.0f}")
+                    transaction.set_rollback(True)
+
+    @staticmethod
+    def _seed(size):
+        password = make_password(PASSWORD)
+        # Gerçekçi veri: karışık büyük/küçük harfli e-postalar
+        User.objects.bulk_create(
+            [User(username=f"{PREFIX}{i}", email=f"Bench.Login{i}@Example.com", password=password) for i in range(size)],
+            batch_size=5000,
+        )
+        users = list(User.objects.filter(username__startswith=PREFIX).order_by("id").values_list("id", "username"))
+        companies = users[: size // 10]
+        Company.objects.bulk_create(
+            [Company(user_id=uid, name=username, slug=username) for uid, username in companies], batch_size=5000
+        )
+        Profile.objects.bulk_create([Profile(user_id=uid) for uid, _ in users[size // 10:]], batch_size=5000)
+        return [(f"bench.login{i}@example.com", "company" if i < size // 10 else "student") for i in range(size)]
+
+    @staticmethod
+    def _run(login, sample):
+        # CaptureQueriesContext 9000 sorguda kesilir; sayaç yeter
+        count = [0]
+
+        def counter(execute, sql, params, many, context):
+            count[0] += 1
+            return execute(sql, params, many, context)
+
+        start = time.perf_counter()
+        with connection.execute_wrapper(counter):
+            for email, user_type in sample:
+                assert login(email, user_type) is not None
+        elapsed = time.perf_counter() - start
+        return count[0] / len(sample), len(sample) / elapsed
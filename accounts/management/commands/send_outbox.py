@@ -0,0 +1,51 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from accounts.outbox import OUTBOX_BATCH_SIZE, OutboxWorker, purge_sent
+
+PURGE_EVERY = 3600  # saniye
+
+
+class Command(BaseCommand):
+    help = (
+        "E-posta outbox'ını (accounts.outbox) tek SMTP bağlantısıyla gönderir. "
+        "Varsayılan olarak sürekli çalışır; --once kuyruğu bir kez boşaltıp çıkar."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true")
+        parser.add_argument("--batch-size", type=int, default=OUTBOX_BATCH_SIZE)
+        parser.add_argument("--poll-interval", type=float, default=2.0, help="Kuyruk boşken bekleme (saniye)")
+        parser.add_argument("--purge-sent-days", type=int, default=7, help="Bundan eski gönderilmiş satırları sil")
+
+    def handle(self, *args, **options):
+        worker = OutboxWorker(batch_size=options["batch_size"])
+        keep = timedelta(days=options["purge_sent_days"])
+        last_purge = 0.0
+        try:
+            while True:
+                if time.monotonic() - last_purge >= PURGE_EVERY:
+                    purged = purge_sent(keep)
+                    if purged:
+                        self.stdout.write(f"{purged} sent emails purged")
+                    last_purge = time.monotonic()
+
+                stats = worker.drain()
+                if any(stats.values()):
+                    self.stdout.write(
+                        self.style.SUCCESS(f"{stats['sent']} sent, {stats['retried']} retried, {stats['dead']} dead")
+                    )
+                if options["once"]:
+                    break
+                if not any(stats.values()):
+                    # Boşta bağlantı açık tutulmaz (sunucu zaman aşımı)
+                    worker.close()
+                    close_old_connections()
+                    time.sleep(options["poll_interval"])
+        except KeyboardInterrupt:
+            pass
+        finally:
+            worker.close()
@@ -0,0 +1,34 @@
+from django.db import migrations, models
+from django.db.models.functions import Lower
+
+from accounts.backends import EMAIL_INDEX_NAME
+
+
+def _index():
+    return models.Index(Lower("email"), name=EMAIL_INDEX_NAME)
+
+
+def add_email_index(apps, schema_editor):
+    # auth_user başka uygulamanın tablosu; AddIndex yerine şema editörü kullanılır.
+    # Fonksiyonel index desteklemeyen sürümlerde (MySQL < 8.0.13) atlanır.
+    if not schema_editor.connection.features.supports_expression_indexes:
+        return
+    schema_editor.add_index(apps.get_model("auth", "User"), _index())
+
+
+def remove_email_index(apps, schema_editor):
+    if not schema_editor.connection.features.supports_expression_indexes:
+        return
+    schema_editor.remove_index(apps.get_model("auth", "User"), _index())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_outbox_email'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_email_index, remove_email_index),
+    ]
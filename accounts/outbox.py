@@ -0,0 +1,166 @@
+# accounts/outbox.py
+"""
+Veritabanı tabanlı e-posta kuyruğu.
+
+İstekler maili göndermez, ``enqueue_email`` ile OutboxEmail satırı yazar
+(SMTP yavaşsa gunicorn worker'ı EMAIL_TIMEOUT boyunca beklemez).
+``send_outbox`` komutu (Procfile worker'ı) ya da App Engine'de cron.yaml'ın
+çağırdığı ``outbox_drain`` uç noktası kuyruğu boşaltır:
+
+* Zamanı gelmiş satırlar ``batch_size``'lık parçalar halinde alınır
+  (destekleyen veritabanında SELECT ... FOR UPDATE SKIP LOCKED; birden çok
+  worker aynı satırı almaz). Alınan satırın deneme sayısı artırılır ve
+  ``next_attempt_at`` CLAIM_LEASE kadar ileri atılır; worker gönderim
+  sırasında çökerse satır kira bitince yeniden denenir.
+* Tüm parçalar tek, açık tutulan bir SMTP bağlantısı üzerinden gönderilir;
+  bağlantı hatasında bir sonraki mesaj için yeniden açılır.
+* ``send_messages`` 0 dönerse mesaj gönderilmemiştir; geçici hata sayılır.
+* Geçici hatalar üstel geri çekilmeyle (RETRY_BASE_DELAY * 2^(n-1), en çok
+  RETRY_MAX_DELAY, ±%20) yeniden planlanır. Kalıcı hatalar (alıcı/gönderen
+  reddi) ve EMAIL_OUTBOX_MAX_ATTEMPTS'a ulaşan satırlar ``dead`` olur;
+  admin'den yeniden kuyruğa alınabilir.
+"""
+import random
+import smtplib
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import OutboxEmail
+
+OUTBOX_BATCH_SIZE = 50
+CLAIM_LEASE = timedelta(minutes=5)
+RETRY_BASE_DELAY = 30  # saniye
+RETRY_MAX_DELAY = 3600
+
+# Yeniden denemek sonucu değiştirmez
+PERMANENT_ERRORS = (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused)
+
+
+def enqueue_email(subject, body, to, from_email=None, html_body="") -> OutboxEmail:
+    return OutboxEmail.objects.create(
+        subject=subject[:255],
+        body=body,
+        html_body=html_body or "",
+        from_email=from_email or getattr(settings, "DEFAULT_FROM_EMAIL", "no-reply@lazyintern.local"),
+        to=list(to),
+    )
+
+
+def max_attempts() -> int:
+    return getattr(settings, "EMAIL_OUTBOX_MAX_ATTEMPTS", 6)
+
+
+def retry_delay(attempts: int) -> timedelta:
+    delay = min(RETRY_BASE_DELAY * 2 ** max(attempts - 1, 0), RETRY_MAX_DELAY)
+    return timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+
+def claim_batch(batch_size: int = OUTBOX_BATCH_SIZE) -> list[OutboxEmail]:
+    """Zamanı gelmiş bekleyen satırları alır (deneme sayısı + kira)."""
+    now = timezone.now()
+    skip_locked = connection.features.has_select_for_update_skip_locked
+    with transaction.atomic():
+        batch = list(
+            OutboxEmail.objects.select_for_update(skip_locked=skip_locked)
+            .filter(status=OutboxEmail.PENDING, next_attempt_at__lte=now)
+            .order_by("next_attempt_at", "id")[:batch_size]
+        )
+        if batch:
+            OutboxEmail.objects.filter(pk__in=[email.pk for email in batch]).update(
+                attempts=F("attempts") + 1, next_attempt_at=now + CLAIM_LEASE
+            )
+    for email in batch:
+        email.attempts += 1
+    return batch
+
+
+def purge_sent(older_than: timedelta) -> int:
+    """Gönderilmiş eski satırları siler (dead satırlar incelemek için kalır)."""
+    cutoff = timezone.now() - older_than
+    deleted, _ = OutboxEmail.objects.filter(status=OutboxEmail.SENT, sent_at__lt=cutoff).delete()
+    return deleted
+
+
+class OutboxWorker:
+    """Kuyruğu tek bir e-posta bağlantısı üzerinden boşaltır."""
+
+    def __init__(self, batch_size: int = OUTBOX_BATCH_SIZE, backend=None):
+        self.batch_size = batch_size
+        self.connection = get_connection(backend, fail_silently=False)
+        self.is_open = False
+
+    def open(self) -> None:
+        if not self.is_open:
+            self.connection.open()
+            self.is_open = True
+
+    def close(self) -> None:
+        if self.is_open:
+            self.is_open = False
+            try:
+                self.connection.close()
+            except Exception:
+                pass
+
+    def drain(self) -> dict:
+        """Zamanı gelmiş satır kalmayana kadar gönderir; {sent, retried, dead}."""
+        stats = {"sent": 0, "retried": 0, "dead": 0}
+        while True:
+            batch = claim_batch(self.batch_size)
+            if not batch:
+                return stats
+            for key, count in self.send_batch(batch).items():
+                stats[key] += count
+
+    def send_batch(self, batch) -> dict:
+        stats = {"sent": 0, "retried": 0, "dead": 0}
+        sent_ids = []
+        for i, email in enumerate(batch):
+            try:
+                self.open()
+            except Exception as exc:
+                # Sunucuya ulaşılamıyor: parçanın geri kalanı da yeniden planlanır
+                for rest in batch[i:]:
+                    stats[self._failed(rest, exc)] += 1
+                break
+            try:
+                if not self.connection.send_messages([self._message(email)]):
+                    # Backend hata vermeden göndermedi (ör. bağlantı açılamadı)
+                    raise smtplib.SMTPException("email backend sent 0 messages")
+            except Exception as exc:
+                stats[self._failed(email, exc)] += 1
+                if not isinstance(exc, PERMANENT_ERRORS):
+                    # Bağlantı kopmuş olabilir; sonraki mesaj yeniden açar
+                    self.close()
+            else:
+                sent_ids.append(email.pk)
+        if sent_ids:
+            OutboxEmail.objects.filter(pk__in=sent_ids).update(
+                status=OutboxEmail.SENT, sent_at=timezone.now(), last_error=""
+            )
+            stats["sent"] = len(sent_ids)
+        return stats
+
+    def _message(self, email):
+        message = EmailMultiAlternatives(
+            email.subject, email.body, email.from_email, email.to, connection=self.connection
+        )
+        if email.html_body:
+            message.attach_alternative(email.html_body, "text/html")
+        return message
+
+    @staticmethod
+    def _failed(email, exc) -> str:
+        error = f"{type(exc).__name__}: {exc}"[:2000]
+        if isinstance(exc, PERMANENT_ERRORS) or email.attempts >= max_attempts():
+            OutboxEmail.objects.filter(pk=email.pk).update(status=OutboxEmail.DEAD, last_error=error)
+            return "dead"
+        OutboxEmail.objects.filter(pk=email.pk).update(
+            next_attempt_at=timezone.now() + retry_delay(email.attempts), last_error=error
+        )
+        return "retried"
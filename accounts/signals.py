@@ -0,0 +1,22 @@
+# accounts/signals.py
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from profiles.models import Company, Profile
+
+from .identity import invalidate_identity
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def _user_changed(sender, instance, **kwargs):
+    invalidate_identity(instance.pk)
+
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+@receiver(post_save, sender=Company)
+@receiver(post_delete, sender=Company)
+def _identity_relation_changed(sender, instance, **kwargs):
+    invalidate_identity(instance.user_id)
@@ -1,3 +1,265 @@
-from django.test import TestCase
+import smtplib
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import authenticate
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.cache import cache
+from django.core.mail.backends.locmem import EmailBackend
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from profiles.models import Company, Profile
+
+from .backends import EmailBackend as EmailAuthBackend
+from .identity import user_company, user_profile
+from .models import OutboxEmail
+from .outbox import OutboxWorker, enqueue_email
+
+
+class FlakyBackend(EmailBackend):
+    """locmem + açılan bağlantı sayısı + sıradaki gönderimler için hata listesi."""
+
+    opened = 0
+    failures = []
+
+    def open(self):
+        FlakyBackend.opened += 1
+        return True
+
+    def send_messages(self, messages):
+        if FlakyBackend.failures:
+            raise FlakyBackend.failures.pop(0)
+        return super().send_messages(messages)
+
+
+@override_settings(EMAIL_BACKEND="accounts.tests.FlakyBackend", EMAIL_OUTBOX_MAX_ATTEMPTS=3)
+class OutboxTests(TestCase):
+    def setUp(self):
+        FlakyBackend.opened = 0
+        FlakyBackend.failures = []
+
+    def _due(self):
+        # Yeniden denemeyi beklemeden zamanı getir
+        OutboxEmail.objects.filter(status=OutboxEmail.PENDING).update(next_attempt_at=timezone.now())
+
+    def test_verification_request_only_queues_email(self):
+        user = User.objects.create_user("hr", password="x")
+        company = Company.objects.create(name="Acme", user=user)
+        self.client.force_login(user)
+
+        response = self.client.post(
+            reverse("company_send_verification_code", kwargs={"slug": company.slug}),
+            {"verification_email": "hr@acme.test"},
+        )
+        self.assertIn("sent=1", response["Location"])
+        self.assertEqual(mail.outbox, [])
+        queued = OutboxEmail.objects.get()
+        company.refresh_from_db()
+        self.assertEqual(queued.to, ["hr@acme.test"])
+        self.assertIn(company.verification_code, queued.body)
+
+        stats = OutboxWorker().drain()
+        self.assertEqual(stats, {"sent": 1, "retried": 0, "dead": 0})
+        self.assertEqual(mail.outbox[0].alternatives[0][1], "text/html")
+
+    def test_batches_share_one_connection(self):
+        for i in range(7):
+            enqueue_email("Hi", "body", [f"u{i}@x.test"])
+        stats = OutboxWorker(batch_size=3).drain()
+        self.assertEqual(stats["sent"], 7)
+        self.assertEqual(FlakyBackend.opened, 1)
+        self.assertEqual(OutboxEmail.objects.filter(status=OutboxEmail.SENT).count(), 7)
+
+    def test_transient_failure_backs_off_then_dead_letters(self):
+        email = enqueue_email("Hi", "body", ["u@x.test"])
+        FlakyBackend.failures = [smtplib.SMTPServerDisconnected("gone")] * 3
+        worker = OutboxWorker()
+
+        self.assertEqual(worker.drain()["retried"], 1)
+        email.refresh_from_db()
+        self.assertEqual((email.status, email.attempts), (OutboxEmail.PENDING, 1))
+        self.assertGreater(email.next_attempt_at, timezone.now() + timedelta(seconds=20))
+        self.assertIn("gone", email.last_error)
+        # Geri çekilme süresi dolmadan tekrar alınmaz
+        self.assertEqual(worker.drain(), {"sent": 0, "retried": 0, "dead": 0})
+
+        self._due()
+        worker.drain()
+        self._due()
+        self.assertEqual(worker.drain()["dead"], 1)
+        email.refresh_from_db()
+        self.assertEqual((email.status, email.attempts), (OutboxEmail.DEAD, 3))
+        self.assertEqual(mail.outbox, [])
+
+    def test_refused_recipient_is_dead_lettered_immediately(self):
+        enqueue_email("Hi", "body", ["bad@x.test"])
+        enqueue_email("Hi", "body", ["good@x.test"])
+        FlakyBackend.failures = [smtplib.SMTPRecipientsRefused({"bad@x.test": (550, b"no such user")})]
+
+        self.assertEqual(OutboxWorker().drain(), {"sent": 1, "retried": 0, "dead": 1})
+        self.assertEqual(FlakyBackend.opened, 1)
+        self.assertEqual(mail.outbox[0].to, ["good@x.test"])
+
+    def test_zero_sent_messages_is_a_failure(self):
+        email = enqueue_email("Hi", "body", ["u@x.test"])
+        with mock.patch.object(FlakyBackend, "send_messages", return_value=0):
+            self.assertEqual(OutboxWorker().drain(), {"sent": 0, "retried": 1, "dead": 0})
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutboxEmail.PENDING)
+        self.assertIn("sent 0 messages", email.last_error)
+
+    def test_cron_endpoint_drains_only_for_app_engine_cron(self):
+        enqueue_email("Hi", "body", ["u@x.test"])
+        url = reverse("outbox_drain")
+        # Kapalıyken başlık taklit edilse de çalışmaz
+        self.assertEqual(self.client.get(url, headers={"X-Appengine-Cron": "true"}).status_code, 403)
+        with self.settings(EMAIL_OUTBOX_CRON=True):
+            self.assertEqual(self.client.get(url).status_code, 403)
+            response = self.client.get(url, headers={"X-Appengine-Cron": "true"})
+        self.assertEqual(response.json(), {"sent": 1, "retried": 0, "dead": 0})
+        self.assertEqual(mail.outbox[0].to, ["u@x.test"])
+
+    def test_unreachable_server_reschedules_whole_batch(self):
+        for i in range(3):
+            enqueue_email("Hi", "body", [f"u{i}@x.test"])
+        with mock.patch.object(FlakyBackend, "open", side_effect=OSError("connection refused")) as opened:
+            stats = OutboxWorker().drain()
+        self.assertEqual(stats["retried"], 3)
+        self.assertEqual(opened.call_count, 1)
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class EmailLoginTests(TestCase):
+    def setUp(self):
+        self.student = User.objects.create_user("stu", email="Stu@Example.com", password="pw")
+        Profile.objects.create(user=self.student)
+        self.hr = User.objects.create_user("hr", email="hr@acme.test", password="pw")
+        self.company = Company.objects.create(name="Acme", user=self.hr)
+
+    def _login(self, email, user_type, password="pw"):
+        return self.client.post(
+            reverse("login"), {"email": email, "password": password, "user_type": user_type}
+        )
+
+    def test_backend_resolves_user_and_relations_in_one_query(self):
+        with CaptureQueriesContext(connection) as ctx:
+            user = authenticate(email="STU@example.COM", password="pw")
+            self.assertEqual(user, self.student)
+            self.assertIsNone(getattr(user, "company", None))
+            self.assertIsNotNone(user.profile)
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertIn("LOWER", ctx.captured_queries[0]["sql"])
+        self.assertIsNone(authenticate(email="stu@example.com", password="wrong"))
+        # Kullanıcı adıyla giriş (admin) çalışmaya devam eder
+        self.assertEqual(authenticate(username="stu", password="pw"), self.student)
+
+    def test_failed_username_login_hashes_the_password_once(self):
+        self.assertIsNone(EmailAuthBackend().authenticate(None, username="stu", password="pw"))
+        with mock.patch("django.contrib.auth.base_user.check_password", return_value=False) as verify:
+            self.assertIsNone(authenticate(username="stu", password="wrong"))
+        self.assertEqual(verify.call_count, 1)
+
+    def test_login_redirects_by_account_type(self):
+        response = self._login("stu@example.com", "student")
+        self.assertRedirects(response, reverse("profile_detail", kwargs={"username": "stu"}), fetch_redirect_response=False)
+        self.client.logout()
+
+        response = self._login("HR@acme.test", "company")
+        self.assertRedirects(response, reverse("company_profile", kwargs={"slug": self.company.slug}), fetch_redirect_response=False)
+        self.client.logout()
+
+        response = self._login("hr@acme.test", "student")
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("_auth_user_id", self.client.session)
+
+    def test_student_without_profile_gets_one(self):
+        User.objects.create_user("new", email="new@x.test", password="pw")
+        response = self._login("new@x.test", "student")
+        # Giriş yalnız yönlendirir; profil yönlendirilen sayfada oluşturulur
+        self.assertFalse(Profile.objects.filter(user__username="new").exists())
+        self.client.get(response["Location"])
+        self.assertTrue(Profile.objects.filter(user__username="new").exists())
+
+
+class IdentityTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.student = User.objects.create_user("stu", password="pw")
+        Profile.objects.create(user=self.student)
+        self.hr = User.objects.create_user("hr", password="pw")
+        self.company = Company.objects.create(name="Acme", user=self.hr)
+
+    def _user_queries(self, ctx):
+        return [q["sql"] for q in ctx.captured_queries if 'FROM "auth_user"' in q["sql"]]
+
+    def test_request_user_loaded_with_relations_in_one_query(self):
+        for user, target in (
+            (self.hr, reverse("company_profile", kwargs={"slug": self.company.slug})),
+            (self.student, reverse("profile_detail", kwargs={"username": "stu"})),
+        ):
+            self.client.force_login(user)
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(reverse("profile_redirect"))
+            self.assertRedirects(response, target, fetch_redirect_response=False)
+            # session + JOIN'li tek kullanıcı sorgusu
+            self.assertEqual(len(ctx.captured_queries), 2)
+            self.assertIn("profiles_company", self._user_queries(ctx)[0])
+
+    # Eski oturumlarda ilişkiler tembel yüklenir (+1 sorgu), yeniden girişe kadar
+    @override_settings(NPLUSONE_RAISE=False)
+    def test_sessions_from_model_backend_stay_logged_in(self):
+        # EmailBackend öncesi açılmış oturumlar ModelBackend yolunu saklar
+        self.client.force_login(self.hr, backend="django.contrib.auth.backends.ModelBackend")
+        response = self.client.get(reverse("profile_redirect"))
+        self.assertRedirects(
+            response,
+            reverse("company_profile", kwargs={"slug": self.company.slug}),
+            fetch_redirect_response=False,
+        )
+
+    def test_company_registration_logs_in_through_email_backend(self):
+        password = "Budget-Pass-2026!"
+        response = self.client.post(reverse("register"), {
+            "username": "newco", "email": "newco@example.com", "password1": password,
+            "password2": password, "user_type": "company",
+        })
+        company = Company.objects.get(user__username="newco")
+        self.assertTrue(response["Location"].startswith(
+            reverse("company_email_verify", kwargs={"slug": company.slug})
+        ))
+        self.assertEqual(self.client.session["_auth_user_backend"], "accounts.backends.EmailBackend")
+
+    async def test_async_user_loads_relations(self):
+        # async bağlamda lazy ilişki sorgusu SynchronousOnlyOperation verirdi
+        user = await EmailAuthBackend().aget_user(self.hr.pk)
+        self.assertEqual(user_company(user), self.company)
+        self.assertIsNone(user_profile(user))
+
+    @override_settings(IDENTITY_CACHE_TIMEOUT=60)
+    def test_cached_identity_is_invalidated_on_save(self):
+        self.client.force_login(self.hr)
+        self.client.get(reverse("profile_redirect"))
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(reverse("profile_redirect"))
+        self.assertEqual(self._user_queries(ctx), [])
+
+        self.company.delete()
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("profile_redirect"))
+        self.assertEqual(len(self._user_queries(ctx)), 1)
+        self.assertRedirects(response, reverse("profile_detail", kwargs={"username": "hr"}), fetch_redirect_response=False)
+
+    @override_settings(IDENTITY_CACHE_TIMEOUT=60)
+    def test_inactive_user_is_logged_out(self):
+        self.client.force_login(self.student)
+        self.client.get(reverse("profile_redirect"))
+        self.student.is_active = False
+        self.student.save()
+        response = self.client.get(reverse("profile_redirect"))
+        self.assertEqual(response.status_code, 302)
+        self.assertIn(reverse("login"), response["Location"])
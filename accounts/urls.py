@@ -12,4 +12,7 @@ urlpatterns = [
     # Kod gönder & doğrulama (view'lar artık accounts.views içinde)
     path('company/<slug:slug>/send-code/', views.company_send_verification_code, name='company_send_verification_code'),
     path('company/<slug:slug>/verify/',     views.company_email_verify,          name='company_email_verify'),
+
+    # App Engine cron: e-posta outbox'ını boşaltır (cron.yaml)
+    path('outbox/drain/', views.outbox_drain, name='outbox_drain'),
 ]
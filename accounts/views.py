@@ -7,14 +7,18 @@ from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.forms import AuthenticationForm
 from django.contrib import messages
 from django.urls import reverse
-from django.utils.text import slugify
 from django.contrib.auth.decorators import login_required
 from django.utils import timezone
-from django.views.decorators.http import require_POST
+from django.conf import settings
+from django.http import HttpResponseForbidden, JsonResponse
+from django.views.decorators.http import require_GET, require_POST
 
 from .forms import RegisterForm
 from profiles.models import Profile, Company
-from .email_utils import send_company_verification_email
+from profiles.slugs import save_with_unique_slug, slug_base
+from .identity import user_company
+from .email_utils import queue_company_verification_email
+from .outbox import OutboxWorker
 from django.shortcuts import render, redirect
 from django.contrib.auth import authenticate, login
 from django.contrib.auth.models import User
@@ -27,27 +31,21 @@ from .forms import EmailLoginForm
 # -------------------------------
 # Company yardımcıları
 # -------------------------------
-def _unique_company_slug_for_user(user) -> str:
-    base = slugify(user.username or (user.email.split("@")[0] if user.email else "")) or f"company-{user.id}"
-    slug = base
-    i = 2
-    while Company.objects.filter(slug=slug).exists():
-        slug = f"{base}-{i}"
-        i += 1
-    return slug
+def _company_slug_base(user) -> str:
+    return slug_base(
+        user.username,
+        user.email.split("@")[0] if user.email else "",
+        fallback=f"company-{user.id}",
+    )
 
 
 def _get_or_prepare_company_for_user(user) -> Company:
     company = Company.objects.filter(user_id=user.id).first()
     if not company:
-        company = Company.objects.create(
-            user=user,
-            name=user.username or "Company",
-            slug=_unique_company_slug_for_user(user),
-        )
+        company = Company(user=user, name=user.username or "Company")
+        save_with_unique_slug(company, _company_slug_base(user), lambda: company.save(force_insert=True))
     elif not getattr(company, "slug", None):
-        company.slug = _unique_company_slug_for_user(user)
-        company.save(update_fields=["slug"])
+        save_with_unique_slug(company, _company_slug_base(user), lambda: company.save(update_fields=["slug"]))
     return company
 
 
@@ -76,7 +74,8 @@ def register_view(request):
 
             elif user_type in ['company', 'recruiter']:
                 company = _get_or_prepare_company_for_user(user)
-                login(request, user)
+                # Birden çok backend var: oturum kimliği EmailBackend ile yüklensin
+                login(request, user, backend="accounts.backends.EmailBackend")
                 params = {'next': reverse('login'), 'just_registered': '1'}
                 url = reverse('company_email_verify', kwargs={'slug': company.slug})
                 return redirect(f"{url}?{urlencode(params)}")
@@ -105,36 +104,29 @@ def login_view(request):
             email = form.cleaned_data["email"]
             password = form.cleaned_data["password"]
 
-            # Birden fazla kullanıcı kontrolü
-            users = User.objects.filter(email__iexact=email)
-            if not users.exists():
+            # Tek sorgu: kullanıcı + şirket + profil (accounts.backends.EmailBackend)
+            user = authenticate(request, email=email, password=password)
+            if user is None:
                 messages.error(request, "Invalid email or password.")
                 return render(request, "accounts/login.html", {"form": form})
 
-            if users.count() > 1:
+            if user.has_duplicate_email:
                 messages.warning(request, "Multiple accounts found with this email. Logging in with the first one.")
 
-            user_obj = users.first()
-            user = authenticate(request, username=user_obj.username, password=password)
-            if user is None:
-                messages.error(request, "Invalid email or password.")
-                return render(request, "accounts/login.html", {"form": form})
-
             # company/student yönlendirmesi
-            has_company = Company.objects.filter(user=user).exists()
+            company = user_company(user)
             if user_type == "student":
-                if has_company:
+                if company is not None:
                     messages.error(request, "This is a company account; cannot log in as 'Student'.")
                     return render(request, "accounts/login.html", {"form": form})
                 login(request, user)
-                Profile.objects.get_or_create(user=user)
+                # Profili olmayan öğrencinin profili ilk profile_detail ziyaretinde oluşur
                 return redirect("profile_detail", username=user.username)
             elif user_type == "company":
-                if not has_company:
+                if company is None:
                     messages.error(request, "This is a student account; cannot log in as 'Company'.")
                     return render(request, "accounts/login.html", {"form": form})
                 login(request, user)
-                company = Company.objects.filter(user=user).first()
                 return redirect("company_profile", slug=company.slug)
             else:
                 messages.error(request, "Please select a valid user type.")
@@ -206,7 +198,7 @@ def company_send_verification_code(request, slug):
 
     next_qs = request.GET.get("next") or request.POST.get("next")
     try:
-        send_company_verification_email(to_email, code, company.name)
+        queue_company_verification_email(to_email, code, company.name)
         url = f"{reverse('company_email_verify', kwargs={'slug': slug})}?sent=1"
     except Exception:
         url = f"{reverse('company_email_verify', kwargs={'slug': slug})}?error=send_failed"
@@ -251,3 +243,24 @@ def company_email_verify(request, slug):
             return redirect(next_url)
 
     return render(request, "accounts/company_verify_email.html", ctx)
+
+
+# -------------------------------
+# Outbox: App Engine cron (cron.yaml)
+# -------------------------------
+@require_GET
+def outbox_drain(request):
+    """
+    App Engine'de sürekli çalışan worker yok; cron her dakika bu uç noktayla
+    kuyruğu boşaltır. App Engine dışarıdan gelen isteklerdeki X-Appengine-Cron
+    başlığını siler, bu yüzden başlık yalnız EMAIL_OUTBOX_CRON açıkken
+    (App Engine'de varsayılan) kabul edilir.
+    """
+    if not getattr(settings, "EMAIL_OUTBOX_CRON", False) or request.headers.get("X-Appengine-Cron") != "true":
+        return HttpResponseForbidden()
+    worker = OutboxWorker()
+    try:
+        stats = worker.drain()
+    finally:
+        worker.close()
+    return JsonResponse(stats)
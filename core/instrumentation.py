@@ -0,0 +1,249 @@
+# core/instrumentation.py
+"""
+İstek başına performans ölçümü.
+
+PERF_SAMPLE_RATE oranında örneklenen isteklerde RequestMetricsMiddleware
+şunları toplar: SQL sorgu sayısı ve toplam DB süresi, çağrıldıkları yerle
+birlikte en yavaş PERF_SLOW_QUERY_COUNT sorgu, şablon render süresi ve
+toplam süre. Sonuç ``core.instrumentation`` logger'ına tek satır JSON
+olarak, PERF_SERVER_TIMING açıksa (varsayılan DEBUG; başlık sorgu sayısını
+her istemciye gösterir) ``Server-Timing`` başlığına da yazılır. Toplam
+süresi PERF_SLOW_REQUEST_MS'i aşan istekler WARNING seviyesinde, tüm
+sorgularla loglanır; örneklenmemiş yavaş istekler (PERF_SAMPLE_RATE 0
+olsa da) yalnız süreleriyle loglanır. SQL parametreleri loglanmaz.
+
+Örneklenmeyen isteğin ek maliyeti bir random() ve iki perf_counter()
+çağrısı ile sorgu başına bir ContextVar okumasıdır. Sorgu sarmalayıcısı
+connection_created ile her bağlantıya bir kez eklenir (install). Şablon süresi TEMPLATES'ta
+DjangoTemplates yerine tanımlanan TimedDjangoTemplates backend'inin
+döndürdüğü şablonların render'ında ölçülür; Django sınıfları yamanmaz.
+İkisi de aktif ölçüm yoksa doğrudan geçer.
+sync_to_async context'i taşıdığından async view'ların sorguları da aynı
+ölçüme yazılır.
+"""
+import heapq
+import json
+import logging
+import random
+import sys
+import time
+from contextvars import ContextVar
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.template import TemplateDoesNotExist
+from django.template.backends.django import DjangoTemplates, Template, reraise
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+# Sorgu sarmalayıcılarının kendi çerçeveleri çağrı yeri sayılmaz
+_CORE_HOOKS = tuple(
+    str(Path(__file__).resolve().parent / name) for name in ("instrumentation.py", "nplusone.py")
+)
+
+
+def sample_rate() -> float:
+    return getattr(settings, "PERF_SAMPLE_RATE", 0.0)
+
+
+def slow_request_ms() -> float:
+    return getattr(settings, "PERF_SLOW_REQUEST_MS", 500)
+
+
+def slow_query_count() -> int:
+    return getattr(settings, "PERF_SLOW_QUERY_COUNT", 5)
+
+
+def server_timing_enabled() -> bool:
+    return getattr(settings, "PERF_SERVER_TIMING", settings.DEBUG)
+
+
+def project_stack(frame=None, limit: int | None = None) -> list[str]:
+    """Yığındaki proje kodu çerçeveleri, içten dışa ("profiles/views.py:120 in company_profile")."""
+    frame = frame or sys._getframe(1)
+    sites = []
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if (
+            filename.startswith(PROJECT_ROOT)
+            and "site-packages" not in filename
+            and not filename.startswith(_CORE_HOOKS)
+        ):
+            relative = filename[len(PROJECT_ROOT) + 1:]
+            sites.append(f"{relative}:{frame.f_lineno} in {frame.f_code.co_name}")
+            if len(sites) == limit:
+                break
+        frame = frame.f_back
+    return sites
+
+
+def call_site() -> str:
+    """Sorguyu çalıştıran ilk proje kodu çerçevesi."""
+    sites = project_stack(sys._getframe(1), limit=1)
+    return sites[0] if sites else ""
+
+
+class RequestMetrics:
+    __slots__ = ("queries", "db_ms", "slowest", "template_ms", "rendering", "keep")
+
+    def __init__(self, keep: int = 5):
+        self.queries = []  # (ms, alias, sql)
+        self.db_ms = 0.0
+        self.slowest = []  # min-heap: (ms, sıra, alias, sql, çağrı yeri)
+        self.template_ms = 0.0
+        self.rendering = False
+        self.keep = keep
+
+    def add_query(self, sql: str, ms: float, alias: str):
+        self.queries.append((ms, alias, sql))
+        self.db_ms += ms
+        # Çağrı yeri yalnız en yavaşlar arasına girenler için çıkarılır
+        if len(self.slowest) < self.keep:
+            heapq.heappush(self.slowest, (ms, len(self.queries), alias, sql, call_site()))
+        elif ms > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, (ms, len(self.queries), alias, sql, call_site()))
+
+    def slowest_queries(self) -> list[dict]:
+        return [
+            {"ms": round(ms, 2), "alias": alias, "sql": sql, "at": site}
+            for ms, _, alias, sql, site in sorted(self.slowest, reverse=True)
+        ]
+
+
+_metrics: ContextVar[RequestMetrics | None] = ContextVar("request_metrics", default=None)
+
+
+def current_metrics() -> RequestMetrics | None:
+    return _metrics.get()
+
+
+def _record_query(execute, sql, params, many, context):
+    metrics = _metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.add_query(sql, (time.perf_counter() - start) * 1000, context["connection"].alias)
+
+
+def _instrument_connection(sender, connection, **kwargs):
+    # Başa eklenir: açık bir ``with connection.execute_wrapper(...)`` pop'unu bozmaz
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, _record_query)
+
+
+class TimedTemplate(Template):
+    def render(self, context=None, request=None):
+        metrics = _metrics.get()
+        if metrics is None or metrics.rendering:
+            # İç içe render_to_string çağrıları dıştakinin süresine dahil
+            return super().render(context, request)
+        metrics.rendering = True
+        start = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            metrics.rendering = False
+            metrics.template_ms += (time.perf_counter() - start) * 1000
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """Render süresini ölçülen isteğe yazan DjangoTemplates (TEMPLATES BACKEND)."""
+
+    def from_string(self, template_code):
+        return TimedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        try:
+            return TimedTemplate(self.engine.get_template(template_name), self)
+        except TemplateDoesNotExist as exc:
+            reraise(exc, self)
+
+
+def install():
+    """CoreConfig.ready'den bir kez çağrılır."""
+    connection_created.connect(_instrument_connection, dispatch_uid="core.instrumentation")
+
+
+def server_timing(metrics: RequestMetrics, total_ms: float) -> str:
+    return (
+        f'db;dur={metrics.db_ms:.1f};desc="{len(metrics.queries)} queries", '
+        f"tpl;dur={metrics.template_ms:.1f}, total;dur={total_ms:.1f}"
+    )
+
+
+class RequestMetricsMiddleware:
+    """Örneklenen isteklerde ölçümü açar; Server-Timing ve log satırını yazar."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        # Örnekleme kapalıyken de yavaş istekler süreleriyle loglanır
+        rate = sample_rate()
+        metrics = RequestMetrics(slow_query_count()) if rate > 0 and random.random() < rate else None
+        token = _metrics.set(metrics)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _metrics.reset(token)
+        return self._report(request, response, metrics, (time.perf_counter() - start) * 1000)
+
+    async def __acall__(self, request):
+        # Örnekleme kapalıyken de yavaş istekler süreleriyle loglanır
+        rate = sample_rate()
+        metrics = RequestMetrics(slow_query_count()) if rate > 0 and random.random() < rate else None
+        token = _metrics.set(metrics)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _metrics.reset(token)
+        return self._report(request, response, metrics, (time.perf_counter() - start) * 1000)
+
+    @staticmethod
+    def _report(request, response, metrics, total_ms):
+        slow = total_ms >= slow_request_ms()
+        if metrics is None and not slow:
+            return response
+
+        match = getattr(request, "resolver_match", None)
+        record = {
+            "event": "slow_request" if slow else "request",
+            "method": request.method,
+            "path": request.path,
+            "view": match.view_name if match else None,
+            "status": response.status_code,
+            "total_ms": round(total_ms, 1),
+            "sampled": metrics is not None,
+        }
+        if metrics is not None:
+            record.update(
+                queries=len(metrics.queries),
+                db_ms=round(metrics.db_ms, 1),
+                template_ms=round(metrics.template_ms, 1),
+                slowest=metrics.slowest_queries(),
+            )
+            if slow:
+                record["all_queries"] = [
+                    {"ms": round(ms, 2), "alias": alias, "sql": sql} for ms, alias, sql in metrics.queries
+                ]
+            if server_timing_enabled():
+                timing = server_timing(metrics, total_ms)
+                existing = response.get("Server-Timing")
+                response["Server-Timing"] = f"{existing}, {timing}" if existing else timing
+        logger.log(logging.WARNING if slow else logging.INFO, json.dumps(record, ensure_ascii=False))
+        return response
@@ -0,0 +1,209 @@
+# core/nplusone.py
+"""
+N+1 sorgu dedektörü ve view başına sorgu bütçeleri.
+
+Bir istek (QueryAuditMiddleware) ya da ``track_queries`` bloğu boyunca
+SELECT'ler normalize edilmiş parmak izine göre sayılır; sabitler, ``IN``
+listeleri ve boşluklar atılır. Aynı parmak izi NPLUSONE_THRESHOLD'dan fazla
+çalışınca, ilk aşımda onu tetikleyen şablon satırları ({% for %} /
+{{ değişken }}) ve proje çağrı yığını (view, model __str__ ...) kaydedilir.
+
+Middleware ayrıca isteğin toplam sorgu sayısını (URL adı, HTTP metodu)
+çiftinin QUERY_BUDGETS (core.query_budgets) bütçesiyle karşılaştırır. Sorun
+varsa istek sonunda:
+
+* NPLUSONE_RAISE açıksa QueryAuditError fırlatılır. Test runner
+  (core.testing.QueryAuditRunner) bunu açar; test istemcisi hatayı teste taşır.
+* Değilse ``core.nplusone`` logger'ına WARNING yazılır. Bu, DEBUG'daki
+  varsayılandır.
+
+NPLUSONE_DETECT kapalıyken (üretim) middleware doğrudan geçer. Sorgu
+sarmalayıcısı her bağlantıya bir kez eklenir ve aktif sayaç yoksa yalnız
+bir ContextVar okur.
+"""
+import logging
+import re
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.template.base import Node
+
+from .instrumentation import project_stack
+from .query_budgets import QUERY_BUDGETS
+
+logger = logging.getLogger(__name__)
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%s|\?")
+_IN_LIST = re.compile(r"\bIN \([^()]*\)", re.IGNORECASE)
+_SPACE = re.compile(r"\s+")
+_RENDER_ANNOTATED = Node.render_annotated.__code__
+
+
+class QueryAuditError(Exception):
+    """N+1 ya da sorgu bütçesi aşımı (NPLUSONE_RAISE açıkken)."""
+
+
+def detect_enabled() -> bool:
+    return getattr(settings, "NPLUSONE_DETECT", False)
+
+
+def raise_enabled() -> bool:
+    return getattr(settings, "NPLUSONE_RAISE", False)
+
+
+def nplusone_threshold() -> int:
+    return getattr(settings, "NPLUSONE_THRESHOLD", 5)
+
+
+def fingerprint(sql: str) -> str:
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _PLACEHOLDER.sub("?", sql)
+    sql = _IN_LIST.sub("IN (...)", sql)
+    return _SPACE.sub(" ", sql).strip()
+
+
+def template_stack(frame=None) -> list[str]:
+    """Render edilen şablon düğümleri, içten dışa ("profiles/company_profile.html:210")."""
+    frame = frame or sys._getframe(1)
+    lines = []
+    while frame is not None:
+        if frame.f_code is _RENDER_ANNOTATED:
+            node = frame.f_locals.get("self")
+            origin, token = getattr(node, "origin", None), getattr(node, "token", None)
+            if origin is not None and token is not None:
+                line = f"{origin.template_name or origin.name}:{token.lineno}"
+                if not lines or lines[-1] != line:
+                    lines.append(line)
+        frame = frame.f_back
+    return lines
+
+
+class RepeatedQuery:
+    __slots__ = ("sql", "templates", "stack")
+
+    def __init__(self, sql: str, templates: list[str], stack: list[str]):
+        self.sql = sql
+        self.templates = templates
+        self.stack = stack
+
+
+class QueryTracker:
+    __slots__ = ("threshold", "parent", "total", "counts", "repeated")
+
+    def __init__(self, threshold: int, parent: "QueryTracker | None" = None):
+        self.threshold = threshold
+        self.parent = parent
+        self.total = 0
+        self.counts = {}
+        self.repeated = []
+
+    def add(self, sql: str):
+        self.total += 1
+        if sql.lstrip()[:6].upper() != "SELECT":
+            return
+        key = fingerprint(sql)
+        count = self.counts[key] = self.counts.get(key, 0) + 1
+        if count == self.threshold + 1:
+            frame = sys._getframe(1)
+            self.repeated.append(RepeatedQuery(key, template_stack(frame), project_stack(frame)))
+
+    def problems(self, view_name: str | None = None, method: str | None = None) -> list[str]:
+        problems = []
+        for query in self.repeated:
+            where = "\n".join(
+                [f"    template: {line}" for line in query.templates]
+                + [f"    at {site}" for site in query.stack]
+            )
+            problems.append(f"N+1: {self.counts[query.sql]}x {query.sql}\n{where}")
+        budget = QUERY_BUDGETS.get((view_name, method))
+        if budget is not None and self.total > budget:
+            problems.append(f"query budget: {method} {view_name} ran {self.total} queries (budget {budget})")
+        return problems
+
+
+_tracker: ContextVar[QueryTracker | None] = ContextVar("query_tracker", default=None)
+
+
+@contextmanager
+def track_queries(threshold: int | None = None):
+    """Blok içindeki sorguları sayar; dıştaki bir sayaç varsa ona da yazar."""
+    tracker = QueryTracker(
+        nplusone_threshold() if threshold is None else threshold, parent=_tracker.get()
+    )
+    token = _tracker.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _tracker.reset(token)
+
+
+def _track_query(execute, sql, params, many, context):
+    tracker = _tracker.get()
+    while tracker is not None:
+        tracker.add(sql)
+        tracker = tracker.parent
+    return execute(sql, params, many, context)
+
+
+def _instrument_connection(sender, connection, **kwargs):
+    if _track_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, _track_query)
+
+
+def install():
+    """CoreConfig.ready'den bir kez çağrılır."""
+    connection_created.connect(_instrument_connection, dispatch_uid="core.nplusone")
+
+
+def audit(tracker: QueryTracker, label: str, view_name: str | None = None, method: str | None = None):
+    problems = tracker.problems(view_name, method)
+    if not problems:
+        return
+    message = f"{label}:\n" + "\n".join(problems)
+    if raise_enabled():
+        raise QueryAuditError(message)
+    logger.warning(message)
+
+
+class QueryAuditMiddleware:
+    """Geliştirmede ve testlerde istek başına N+1 ve sorgu bütçesi denetimi."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not detect_enabled():
+            return self.get_response(request)
+        with track_queries() as tracker:
+            response = self.get_response(request)
+        self._audit(request, tracker)
+        return response
+
+    async def __acall__(self, request):
+        if not detect_enabled():
+            return await self.get_response(request)
+        with track_queries() as tracker:
+            response = await self.get_response(request)
+        self._audit(request, tracker)
+        return response
+
+    @staticmethod
+    def _audit(request, tracker):
+        match = getattr(request, "resolver_match", None)
+        audit(
+            tracker, f"{request.method} {request.path}", match.view_name if match else None, request.method
+        )
@@ -0,0 +1,46 @@
+# core/query_budgets.py
+"""
+(URL adı, HTTP metodu) başına istek sorgu bütçeleri
+(core.nplusone.QueryAuditMiddleware).
+
+Sayılar soğuk cache'le, oturum ve request.user sorguları dahil ölçülür
+(core.tests.QueryBudgetTests her URL'yi iki veri boyutunda çağırır ve
+sayının veriyle büyümediğini de doğrular). Aynı URL'nin GET ve POST yolları
+çok farklı iş yapar (ör. kayıt formu / hesap oluşturma), bu yüzden bütçe
+metoda göre tutulur; listede olmayan metodun bütçesi yoktur. Bir view'a
+sorgu eklerken bütçeyi bilinçli olarak artırın; yeni URL'ler de buraya
+eklenmelidir.
+"""
+
+QUERY_BUDGETS = {
+    # core: statik sayfalar
+    ("home", "GET"): 0,
+    ("how_it_works", "GET"): 0,
+    ("for_students", "GET"): 0,
+    ("for_companies", "GET"): 0,
+    ("about", "GET"): 0,
+    # accounts
+    ("login", "GET"): 0,
+    ("login", "POST"): 9,  # kullanıcı, oturum, last_login; profil profile_detail'de oluşur
+    ("register", "GET"): 0,
+    ("register", "POST"): 20,  # şirket kaydı şirketi (benzersiz slug) oluşturup giriş yapar; öğrenci 9
+    ("logout", "GET"): 4,
+    ("company_verify_email", "GET"): 3,
+    ("company_send_verification_code", "POST"): 6,  # kod kaydı + outbox kuyruğu
+    ("company_email_verify", "GET"): 4,
+    ("company_email_verify", "POST"): 4,
+    ("outbox_drain", "GET"): 8,  # App Engine cron; parça başına claim + SENT işareti, sonda boş claim
+    # profiles
+    ("profile_redirect", "GET"): 2,
+    ("profile_edit", "GET"): 2,
+    ("profile_detail", "GET"): 14,  # ilk ziyaret profili oluşturur; dolu profil 7 (profiles.tests)
+    ("profile_detail", "POST"): 8,
+    ("company_profile", "GET"): 20,  # facet'ler, sayfa, dashboard, pozisyonlar, formlar (cache soğuk)
+    ("company_profile", "POST"): 12,  # pozisyon: skill doğrulama, insert, skor + dashboard, iki m2m set
+    ("company_students_page", "GET"): 8,
+    ("candidate_search", "GET"): 3,
+    ("skill_autocomplete", "GET"): 3,
+    ("student_profile_view", "GET"): 7,
+    ("increment_profile_views", "POST"): 5,
+    ("toggle_bookmark", "POST"): 8,
+}
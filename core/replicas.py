@@ -0,0 +1,166 @@
+# core/replicas.py
+"""
+Okuma replikaları.
+
+DATABASE_REPLICAS'taki alias'lardan yalnızca ``use_replica`` ile işaretli
+view'ların GET/HEAD istekleri okur (aday arama, öğrenci listeleri, herkese
+açık profil). Oturum, request.user, formlar ve tüm yazımlar primary'de
+kalır; istek başına bir replika seçilir ve istek boyunca o kullanılır.
+
+Kendi yazdığını okuma:
+
+* Aynı istekte bir yazım olduysa ya da ``transaction.atomic`` içindeysek
+  okumalar primary'ye döner.
+* Yazım yapan (ya da POST vb.) bir istekten sonra ReplicaPinMiddleware
+  REPLICA_PIN_SECONDS ömürlü bir çerez bırakır; POST -> redirect -> GET
+  akışında istemci bu süre boyunca primary'den okur, replika gecikmesi
+  görünmez.
+
+Replika yoksa (DB_REPLICAS boş) her şey primary'ye gider.
+"""
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+PIN_COOKIE = "db_pin_primary"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS", "TRACE")
+REPLICA_METHODS = ("GET", "HEAD")
+
+
+class RequestDBState:
+    __slots__ = ("pinned", "written", "replica")
+
+    def __init__(self, pinned: bool = False):
+        self.pinned = pinned
+        self.written = False
+        self.replica = None
+
+
+_state: ContextVar[RequestDBState | None] = ContextVar("request_db_state", default=None)
+
+
+def replica_aliases() -> list[str]:
+    return list(getattr(settings, "DATABASE_REPLICAS", ()))
+
+
+def pin_seconds() -> int:
+    return getattr(settings, "REPLICA_PIN_SECONDS", 10)
+
+
+@contextmanager
+def replica_reads():
+    """Blok içindeki okumalar (sabitlenmemişse) rastgele bir replikaya gider."""
+    state = _state.get()
+    token = None
+    if state is None:
+        state = RequestDBState()
+        token = _state.set(state)
+    previous = state.replica
+    aliases = replica_aliases()
+    if aliases and not state.pinned:
+        state.replica = previous or random.choice(aliases)
+    try:
+        yield state
+    finally:
+        state.replica = previous
+        if token is not None:
+            _state.reset(token)
+
+
+def use_replica(view):
+    """GET/HEAD isteklerinde view'ın okumalarını replikaya yönlendirir."""
+    if iscoroutinefunction(view):
+
+        @wraps(view)
+        async def async_wrapper(request, *args, **kwargs):
+            if request.method not in REPLICA_METHODS:
+                return await view(request, *args, **kwargs)
+            with replica_reads():
+                return await view(request, *args, **kwargs)
+
+        return async_wrapper
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if request.method not in REPLICA_METHODS:
+            return view(request, *args, **kwargs)
+        with replica_reads():
+            return view(request, *args, **kwargs)
+
+    return wrapper
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if (
+            state is None
+            or state.replica is None
+            or state.written
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            # Replikadan okunmuş bir instance'ın ilişkileri de primary'den
+            return DEFAULT_DB_ALIAS
+        return state.replica
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state.written = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        pool = {DEFAULT_DB_ALIAS, *replica_aliases()}
+        if obj1._state.db in pool and obj2._state.db in pool:
+            return True
+        return None
+
+
+class ReplicaPinMiddleware:
+    """İstek durumunu tutar; yazımdan sonra istemciyi primary'ye sabitler."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        state = RequestDBState(pinned=PIN_COOKIE in request.COOKIES)
+        token = _state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _state.reset(token)
+        return self._pin(request, response, state)
+
+    async def __acall__(self, request):
+        state = RequestDBState(pinned=PIN_COOKIE in request.COOKIES)
+        token = _state.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _state.reset(token)
+        return self._pin(request, response, state)
+
+    @staticmethod
+    def _pin(request, response, state):
+        if replica_aliases() and (state.written or request.method not in SAFE_METHODS):
+            response.set_cookie(
+                PIN_COOKIE,
+                "1",
+                max_age=pin_seconds(),
+                httponly=True,
+                samesite="Lax",
+                secure=settings.SESSION_COOKIE_SECURE,
+            )
+        return response
@@ -0,0 +1,17 @@
+# core/testing.py
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+
+
+class QueryAuditRunner(DiscoverRunner):
+    """Testlerde her istek N+1 ve sorgu bütçesi için denetlenir; ihlal testi düşürür."""
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._saved_audit = (settings.NPLUSONE_DETECT, settings.NPLUSONE_RAISE)
+        settings.NPLUSONE_DETECT = True
+        settings.NPLUSONE_RAISE = True
+
+    def teardown_test_environment(self, **kwargs):
+        settings.NPLUSONE_DETECT, settings.NPLUSONE_RAISE = self._saved_audit
+        super().teardown_test_environment(**kwargs)
@@ -1,3 +1,337 @@
-from django.test import TestCase
+import json
+import time
+from importlib import import_module
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.db import connection, router, transaction
+from django.http import HttpResponse
+from django.template import engines
+from django.test import Client, RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from profiles.models import Certification, Company, Position, Profile, Project, Skill
+from profiles.skill_catalog import reset_skill_catalog
+
+from .instrumentation import RequestMetricsMiddleware, TimedDjangoTemplates
+from .nplusone import QueryAuditError, QueryAuditMiddleware, fingerprint
+from .query_budgets import QUERY_BUDGETS
+from .replicas import PIN_COOKIE, ReplicaPinMiddleware, replica_reads, use_replica
+
+
+@override_settings(DATABASE_REPLICAS=["replica1"])
+class ReplicaRouterTests(TransactionTestCase):
+    # TestCase'in açık transaction'ı okumaları primary'de tutardı
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.seen = []
+
+    def _through_middleware(self, view, request):
+        return ReplicaPinMiddleware(lambda req: view(req))(request)
+
+    def _reads_then(self, write=False):
+        @use_replica
+        def view(request):
+            self.seen.append(router.db_for_read(Profile))
+            if write:
+                router.db_for_write(Profile)
+                self.seen.append(router.db_for_read(Profile))
+            return HttpResponse()
+
+        return view
+
+    def test_only_marked_get_requests_read_from_replica(self):
+        self.assertEqual(router.db_for_read(Profile), "default")
+        self._through_middleware(self._reads_then(), self.factory.get("/"))
+        self._through_middleware(self._reads_then(), self.factory.post("/"))
+        self.assertEqual(self.seen, ["replica1", "default"])
+        self.assertEqual(router.db_for_write(Profile), "default")
+
+    def test_reads_return_to_primary_after_write_or_inside_atomic(self):
+        self._through_middleware(self._reads_then(write=True), self.factory.get("/"))
+        self.assertEqual(self.seen, ["replica1", "default"])
+        with replica_reads():
+            with transaction.atomic():
+                self.assertEqual(router.db_for_read(Profile), "default")
+
+    def test_write_pins_client_to_primary(self):
+        response = self._through_middleware(self._reads_then(), self.factory.post("/"))
+        self.assertEqual(response.cookies[PIN_COOKIE]["max-age"], 10)
+
+        response = self._through_middleware(self._reads_then(), self.factory.get("/"))
+        self.assertNotIn(PIN_COOKIE, response.cookies)
+
+        request = self.factory.get("/")
+        request.COOKIES[PIN_COOKIE] = "1"
+        self._through_middleware(self._reads_then(), request)
+        self.assertEqual(self.seen, ["default", "replica1", "default"])
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_without_replicas_everything_stays_on_primary(self):
+        response = self._through_middleware(self._reads_then(), self.factory.post("/"))
+        self._through_middleware(self._reads_then(), self.factory.get("/"))
+        self.assertEqual(self.seen, ["default", "default"])
+        self.assertNotIn(PIN_COOKIE, response.cookies)
+
+
+class StaticBundleTests(SimpleTestCase):
+    def test_pages_link_shared_and_page_bundles_instead_of_inline_css(self):
+        for name in ("home", "how_it_works", "for_students", "for_companies", "about"):
+            html = self.client.get(reverse(name)).content.decode()
+            self.assertNotIn("<style>", html)
+            self.assertIn('href="/static/css/site.css"', html)
+            self.assertIn(f'href="/static/css/pages/{name}.css"', html)
+
+
+@override_settings(PERF_SAMPLE_RATE=1, PERF_SLOW_REQUEST_MS=10_000, PERF_SERVER_TIMING=True)
+class RequestMetricsTests(TestCase):
+    def _view(self, request):
+        list(Profile.objects.all())
+        Profile.objects.count()
+        html = engines["django"].from_string("{{ name }}").render({"name": "x"})
+        return HttpResponse(html)
+
+    def _get(self):
+        return RequestMetricsMiddleware(self._view)(RequestFactory().get("/metrics/"))
+
+    def test_sampled_request_reports_server_timing_and_log_line(self):
+        with self.assertLogs("core.instrumentation", "INFO") as logs:
+            response = self._get()
+        self.assertRegex(
+            response["Server-Timing"],
+            r'^db;dur=[\d.]+;desc="2 queries", tpl;dur=[\d.]+, total;dur=[\d.]+$',
+        )
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual((record["event"], record["queries"], record["status"]), ("request", 2, 200))
+        self.assertEqual(len(record["slowest"]), 2)
+        self.assertTrue(all(q["at"].startswith("core/tests.py:") for q in record["slowest"]))
+        self.assertNotIn("all_queries", record)
+
+    def test_template_time_comes_from_the_backend_not_a_patched_django_class(self):
+        from django.template.backends.django import Template
+
+        self.assertFalse(hasattr(Template.render, "_instrumented"))
+        self.assertIsInstance(engines["django"], TimedDjangoTemplates)
+
+        def slow_render(self, context):
+            time.sleep(0.02)
+            return "x"
+
+        with mock.patch("django.template.base.Template.render", slow_render):
+            with self.assertLogs("core.instrumentation", "INFO") as logs:
+                self._get()
+        self.assertGreaterEqual(json.loads(logs.records[0].getMessage())["template_ms"], 20)
+
+    @override_settings(PERF_SLOW_REQUEST_MS=0)
+    def test_slow_request_logs_every_query(self):
+        with self.assertLogs("core.instrumentation", "WARNING") as logs:
+            self._get()
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record["event"], "slow_request")
+        self.assertEqual([q["alias"] for q in record["all_queries"]], ["default", "default"])
+
+    @override_settings(PERF_SAMPLE_RATE=0)
+    def test_disabled_sampling_adds_nothing(self):
+        with self.assertNoLogs("core.instrumentation"):
+            response = self._get()
+        self.assertNotIn("Server-Timing", response)
+
+    @override_settings(PERF_SAMPLE_RATE=0, PERF_SLOW_REQUEST_MS=0)
+    def test_slow_request_is_logged_without_sampling(self):
+        with self.assertLogs("core.instrumentation", "WARNING") as logs:
+            response = self._get()
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual((record["event"], record["sampled"]), ("slow_request", False))
+        self.assertNotIn("queries", record)
+        self.assertNotIn("Server-Timing", response)
+
+    @override_settings(PERF_SERVER_TIMING=False)
+    def test_server_timing_header_can_be_withheld(self):
+        with self.assertLogs("core.instrumentation", "INFO") as logs:
+            response = self._get()
+        self.assertNotIn("Server-Timing", response)
+        self.assertEqual(json.loads(logs.records[0].getMessage())["queries"], 2)
+
+
+@override_settings(NPLUSONE_DETECT=True, NPLUSONE_RAISE=True, NPLUSONE_THRESHOLD=2)
+class QueryAuditTests(TestCase):
+    def setUp(self):
+        for i in range(4):
+            Profile.objects.create(user=User.objects.create_user(f"audit-{i}"))
+
+    def _get(self, view):
+        return QueryAuditMiddleware(view)(RequestFactory().get("/audit/"))
+
+    def test_repeated_query_from_template_loop_raises_with_template_and_stack(self):
+        def view(request):
+            template = engines["django"].from_string(
+                "{% for p in profiles %}{{ p.user.username }}{% endfor %}"
+            )
+            return HttpResponse(template.render({"profiles": Profile.objects.all()}))
+
+        with self.assertRaises(QueryAuditError) as raised:
+            self._get(view)
+        message = str(raised.exception)
+        self.assertIn('N+1: 4x SELECT "auth_user"', message)
+        self.assertIn('WHERE "auth_user"."id" = ? LIMIT ?', message)
+        self.assertIn("template: <unknown source>:1", message)
+        self.assertIn("at core/tests.py:", message)
+
+    def test_joined_query_passes(self):
+        def view(request):
+            return HttpResponse(", ".join(p.user.username for p in Profile.objects.select_related("user")))
+
+        self.assertEqual(self._get(view).status_code, 200)
+
+    @override_settings(NPLUSONE_RAISE=False)
+    def test_development_logs_instead_of_raising(self):
+        def view(request):
+            return HttpResponse(", ".join(str(p) for p in Profile.objects.all()))
+
+        with self.assertLogs("core.nplusone", "WARNING") as logs:
+            self._get(view)
+        self.assertIn("in view", logs.output[0])
+
+    def test_fingerprint_ignores_literals_and_in_lists(self):
+        self.assertEqual(
+            fingerprint("SELECT * FROM t WHERE a IN (%s, %s)  AND b = 'x' LIMIT 21"),
+            fingerprint("SELECT * FROM t WHERE a IN (%s) AND b = 'y' LIMIT 1"),
+        )
+
+
+@override_settings(NPLUSONE_DETECT=True, NPLUSONE_RAISE=True, EMAIL_OUTBOX_CRON=True)
+class QueryBudgetTests(TestCase):
+    """core/profiles/accounts URL'lerinin her biri bütçesinde ve veri büyüdükçe sabit."""
+
+    URLCONFS = ("core.urls", "accounts.urls", "profiles.urls")
+
+    def setUp(self):
+        self.student = User.objects.create_user("budget-student", "student@budget.test", "pw")
+        self.profile = Profile.objects.create(user=self.student, major="Computer Science")
+        self.company_user = User.objects.create_user("budget-company", "company@budget.test", "pw")
+        self.company = Company.objects.create(user=self.company_user, name="Budget Co")
+        # Profili henüz olmayan öğrenciler: ilk giriş / ilk ziyaret profili oluşturur
+        self.fresh = User.objects.create_user("budget-fresh", "fresh@budget.test", "pw")
+        self.fresh_visitor = User.objects.create_user("budget-fresh-visitor")
+        self.students = []
+        self.size = 0
+        self.round = 0
+        self.position_skills = [Skill.objects.create(name=f"budget-position-skill-{i}") for i in range(3)]
+
+    def _grow(self, size):
+        for i in range(self.size, size):
+            skill = Skill.objects.create(name=f"budget-skill-{i}")
+            self.profile.skills.add(skill)
+            Project.objects.create(profile=self.profile, title=f"P{i}", technologies=skill.name)
+            Certification.objects.create(
+                profile=self.profile, name=f"C{i}", organization="Org", date_obtained="2025-01-01"
+            )
+            other = Profile.objects.create(
+                user=User.objects.create_user(f"budget-other-{i}"), major="Computer Science"
+            )
+            other.skills.add(skill)
+            Project.objects.create(profile=other, title=f"O{i}", technologies=skill.name)
+            self.company.bookmarked_students.add(other)
+            Position.objects.create(company=self.company, title=f"Role {i}").required_skills.add(skill)
+            self.students.append(other)
+        self.size = size
+
+    def _requests(self):
+        Profile.objects.filter(user__in=[self.fresh, self.fresh_visitor]).delete()
+        student, company, fresh = Client(), Client(), Client()
+        student.force_login(self.student)
+        company.force_login(self.company_user)
+        fresh.force_login(self.fresh_visitor)
+        anonymous = Client()
+        slug = self.company.slug
+        username = self.student.username
+        other = self.students[0]
+        skills = self.position_skills
+        # Her turda yeni kullanıcı adı: kayıt POST'u her seferinde hesap oluşturur
+        self.round += 1
+        new = f"budget-new-{self.round}"
+        password = "Budget-Pass-2026!"
+        return [
+            ("home", anonymous, "get", reverse("home"), None),
+            ("how_it_works", anonymous, "get", reverse("how_it_works"), None),
+            ("for_students", anonymous, "get", reverse("for_students"), None),
+            ("for_companies", anonymous, "get", reverse("for_companies"), None),
+            ("about", anonymous, "get", reverse("about"), None),
+            ("login", anonymous, "get", reverse("login"), None),
+            ("login", Client(), "post", reverse("login"),
+             {"email": "student@budget.test", "password": "pw", "user_type": "student"}),
+            ("login", Client(), "post", reverse("login"),
+             {"email": "fresh@budget.test", "password": "pw", "user_type": "student"}),
+            ("register", anonymous, "get", reverse("register"), None),
+            ("register", Client(), "post", reverse("register"),
+             {"username": f"{new}-student", "email": f"{new}-student@budget.test", "password1": password,
+              "password2": password, "user_type": "student"}),
+            ("register", Client(), "post", reverse("register"),
+             {"username": f"{new}-company", "email": f"{new}-company@budget.test", "password1": password,
+              "password2": password, "user_type": "company"}),
+            ("company_verify_email", company, "get", reverse("company_verify_email"), None),
+            ("company_send_verification_code", company, "post",
+             reverse("company_send_verification_code", kwargs={"slug": slug}), {}),
+            ("company_email_verify", company, "get", reverse("company_email_verify", kwargs={"slug": slug}), None),
+            ("company_email_verify", company, "post",
+             reverse("company_email_verify", kwargs={"slug": slug}), {"code": "000000"}),
+            ("outbox_drain", Client(headers={"X-Appengine-Cron": "true"}), "get", reverse("outbox_drain"), None),
+            ("profile_redirect", student, "get", reverse("profile_redirect"), None),
+            ("profile_edit", student, "get", reverse("profile_edit", kwargs={"username": username}), None),
+            ("profile_detail", student, "get", reverse("profile_detail", kwargs={"username": username}), None),
+            ("profile_detail", fresh, "get",
+             reverse("profile_detail", kwargs={"username": self.fresh_visitor.username}), None),
+            ("profile_detail", student, "post", reverse("profile_detail", kwargs={"username": username}),
+             {"social_submit": "1", "github": "https://github.com/budget"}),
+            ("company_profile", company, "get", reverse("company_profile", kwargs={"slug": slug}), None),
+            ("company_profile", company, "get",
+             reverse("company_profile", kwargs={"slug": slug}) + "?major=computer&tab=bookmarked", None),
+            ("company_profile", company, "post", reverse("company_profile", kwargs={"slug": slug}),
+             {"social_submit": "1", "linkedin": "https://linkedin.com/company/budget"}),
+            ("company_profile", company, "post", reverse("company_profile", kwargs={"slug": slug}),
+             {"position_submit": "1", "title": f"Role {new}", "required_skills": [s.pk for s in skills[:2]],
+              "nice_to_have_skills": [s.pk for s in skills[2:3]]}),
+            ("company_students_page", company, "get", reverse("company_students_page", kwargs={"slug": slug}), None),
+            ("candidate_search", company, "get", reverse("candidate_search") + "?major=computer", None),
+            ("skill_autocomplete", student, "get", reverse("skill_autocomplete") + "?q=budget", None),
+            ("student_profile_view", company, "get",
+             reverse("student_profile_view", kwargs={"user_id": other.user_id}), None),
+            ("increment_profile_views", company, "post",
+             reverse("increment_profile_views", kwargs={"user_id": other.user_id}), {}),
+            # Önce kaldırır, sonra geri ekler: iki yol da her turda ölçülür
+            ("toggle_bookmark", company, "post", reverse("toggle_bookmark", kwargs={"student_id": other.id}), {}),
+            ("toggle_bookmark", company, "post", reverse("toggle_bookmark", kwargs={"student_id": other.id}), {}),
+            ("logout", student, "get", reverse("logout"), None),
+        ]
+
+    def _query_counts(self):
+        counts = {}
+        for name, client, method, url, data in self._requests():
+            for alias in caches:
+                caches[alias].clear()
+            reset_skill_catalog()
+            with CaptureQueriesContext(connection) as ctx:
+                response = getattr(client, method)(url, data) if data is not None else getattr(client, method)(url)
+            self.assertLess(response.status_code, 400, url)
+            key = (name, method.upper())
+            counts[key] = max(counts.get(key, 0), len(ctx.captured_queries))
+        return counts
+
+    def test_every_url_has_a_budget_and_a_request(self):
+        names = {
+            pattern.name for urlconf in self.URLCONFS for pattern in import_module(urlconf).urlpatterns
+        }
+        self.assertEqual(names, {name for name, _ in QUERY_BUDGETS})
+        self._grow(1)
+        self.assertEqual(set(QUERY_BUDGETS), {(name, method.upper()) for name, _, method, *_ in self._requests()})
+
+    def test_query_counts_stay_within_budget_as_data_grows(self):
+        self._grow(2)
+        small = self._query_counts()
+        self._grow(12)
+        large = self._query_counts()
+        for key, budget in QUERY_BUDGETS.items():
+            self.assertLessEqual(large[key], budget, key)
+        self.assertEqual(small, large)
@@ -0,0 +1,166 @@
+# profiles/async_views.py
+"""
+Okuma ağırlıklı view'ların ASGI sürümleri.
+
+ASYNC_VIEWS açıkken (smartintern.asgi varsayılan olarak açar) profiles.urls
+company_profile, candidate_search ve student_profile_view'ı buradan bağlar;
+worker sorgu beklerken başka istekleri karşılar. Şablon/JSON ve iş mantığı
+sync view'larla ortaktır (profiles.views yardımcıları).
+
+Django'nun async ORM'u bir isteğin sorgularını tek bir sync thread'de sırayla
+çalıştırır. Birbirinden bağımsız sorgular (şirket + pozisyonlar; facet'ler,
+bookmark kümesi, sayfa) ``gather_queries`` ile toplanır: ASYNC_PARALLEL_QUERIES
+açıkken thread havuzunda, her biri kendi bağlantısıyla aynı anda çalışır ve
+iş bitince bağlantı close_old_connections ile kapanır (CONN_MAX_AGE'e uyar);
+replika seçimi (core.replicas) context ile bu thread'lere taşınır. Varsayılan
+olarak kapalıdır: kalıcı bağlantı yokken her paralel çağrı yeni bir bağlantı
+el sıkışması öder ve sıralı yoldan yavaş kalır (bench_http). Testler de
+sıralı yolu kullanır; TestCase transaction'ı başka bağlantıdan görünmez.
+"""
+import asyncio
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.decorators import login_required
+from django.db import close_old_connections
+from django.http import Http404, JsonResponse
+from django.shortcuts import render
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+
+from accounts.identity import arequest_user, user_company
+from core.replicas import use_replica
+
+from . import views
+from .dashboard import company_dashboard
+from .facets import facet_counts
+from .forms import CompanyForm, PositionForm
+from .models import Company, Position, Profile
+from .result_cache import bookmarked_profile_ids
+from .search import candidate_filters, candidate_sort
+
+
+def parallel_queries() -> bool:
+    return getattr(settings, "ASYNC_PARALLEL_QUERIES", False)
+
+
+def _in_own_connection(func):
+    def run(*args):
+        try:
+            return func(*args)
+        finally:
+            close_old_connections()
+
+    return run
+
+
+async def gather_queries(*calls):
+    """``(func, *args)`` çağrılarını aynı anda çalıştırır; sonuçlar aynı sırada."""
+    if not parallel_queries():
+        return [await sync_to_async(func)(*args) for func, *args in calls]
+    return await asyncio.gather(
+        *(sync_to_async(_in_own_connection(func), thread_sensitive=False)(*args) for func, *args in calls)
+    )
+
+
+def _company_by_slug(slug):
+    return Company.objects.select_related("dashboard").filter(slug=slug).first()
+
+
+def _positions_by_company_slug(slug):
+    return list(Position.objects.filter(company__slug=slug).only("id", "title"))
+
+
+# ---------------------------------
+# Şirket profili (GET async; formlar sync view'da)
+# ---------------------------------
+@login_required
+@use_replica
+async def company_profile(request, slug):
+    await arequest_user(request)
+    if request.method not in ("GET", "HEAD"):
+        return await sync_to_async(views.company_profile)(request, slug)
+
+    tab = views._normalize_tab(request.GET.get("tab"))
+    filters = candidate_filters(request.GET)
+    sort = candidate_sort(request.GET)
+    filtered = any(filters.values())
+
+    # Pozisyonlar slug üzerinden şirketle aynı anda
+    company, positions = await gather_queries(
+        (_company_by_slug, slug),
+        (_positions_by_company_slug, slug),
+    )
+    if company is None:
+        raise Http404("No Company matches the given query.")
+    position = views._ranking_position(positions, request.GET.get("position"))
+
+    calls = [
+        (company_dashboard, company),
+        (bookmarked_profile_ids, company.id),
+        (views._company_students_page_or_first, company, tab, filters, request.GET.get("cursor"), position, sort),
+        (facet_counts, filters),
+    ]
+    if filtered:
+        calls.append((facet_counts, {}))
+    dashboard, bookmarked, (page, next_cursor), facets, *total = await gather_queries(*calls)
+
+    context = views._company_profile_context(
+        request, company, dashboard,
+        company_form=CompanyForm(instance=company),
+        position_form=PositionForm(),
+        tab=tab,
+        sort=sort,
+        facets=facets,
+        total_count=total[0]["total"] if filtered else facets["total"],
+        positions=positions,
+        position=position,
+        page=page,
+        next_cursor=next_cursor,
+        bookmarked_ids=bookmarked.intersection(card.id for card in page),
+    )
+    return await sync_to_async(render)(request, "profiles/company_profile.html", context)
+
+
+# ---------------------------------
+# Aday arama API'si (JSON)
+# ---------------------------------
+@login_required
+@use_replica
+async def candidate_search(request):
+    # Kimlik şirketle birlikte yüklü (accounts.identity); ek sorgu yok
+    company = user_company(await arequest_user(request))
+    if not company:
+        return JsonResponse({"error": "company_required"}, status=403)
+    return JsonResponse(await sync_to_async(views._candidate_search_payload)(company, request.GET))
+
+
+# ---------------------------------
+# Öğrenci herkese açık profil
+# ---------------------------------
+def _with_public_profile_stamp(view):
+    """condition'ın sync ETag fonksiyonları sorgu atmasın diye damgayı önceden yükler."""
+
+    @wraps(view)
+    async def wrapper(request, user_id):
+        await arequest_user(request)
+        await sync_to_async(views._public_profile_stamp)(request, user_id)
+        return await view(request, user_id)
+
+    return wrapper
+
+
+@login_required
+@use_replica
+@_with_public_profile_stamp
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=views._public_profile_etag, last_modified_func=views._public_profile_last_modified)
+async def student_profile_view(request, user_id: int):
+    profile = await Profile.objects.select_related("user").filter(user_id=user_id).afirst()
+    if profile is None:
+        raise Http404("No Profile matches the given query.")
+    # Fragment cache ıskasındaki ilişki sorguları render sırasında, replika kapsamında
+    return await sync_to_async(render)(
+        request, "profiles/student_public_profile.html", views._public_profile_context(profile)
+    )
@@ -0,0 +1,94 @@
+# profiles/backfill.py
+"""
+Toplu (batch) backfill rutinleri.
+
+Model sınıfları parametre olarak alınır; hem management command'lar hem de
+migration'lar (tarihsel modellerle) aynı kodu kullanır.
+"""
+from django.db import transaction
+
+
+def _tokenize_technologies(text):
+    # Tarihsel modellerde staticmethod olmadığı için doğrudan çağrılır
+    from .models import Technology as CurrentTechnology
+
+    return CurrentTechnology.tokenize(text)
+
+
+def backfill_project_technologies(Project, Technology, batch_size: int = 1000, stdout=None) -> int:
+    """
+    Tüm Project satırları için technology_tags ilişkisini technologies
+    alanından yeniden kurar. Her batch tek transaction: Technology
+    bulk_create + through tablosuna toplu insert.
+    """
+    Through = Project.technology_tags.through
+    last_pk = 0
+    total = 0
+    while True:
+        batch = list(
+            Project.objects.filter(pk__gt=last_pk).order_by("pk").values_list("pk", "technologies")[:batch_size]
+        )
+        if not batch:
+            break
+
+        tokens = {pk: _tokenize_technologies(text) for pk, text in batch}
+        names = {name for names in tokens.values() for name in names}
+
+        with transaction.atomic():
+            if names:
+                Technology.objects.bulk_create([Technology(name=n) for n in names], ignore_conflicts=True)
+            ids = dict(Technology.objects.filter(name__in=names).values_list("name", "id"))
+            Through.objects.filter(project_id__in=tokens.keys()).delete()
+            Through.objects.bulk_create(
+                [Through(project_id=pk, technology_id=ids[name]) for pk, names in tokens.items() for name in names],
+                batch_size=batch_size,
+            )
+
+        total += len(batch)
+        last_pk = batch[-1][0]
+        if stdout is not None:
+            stdout.write(f"{total} projects processed")
+    return total
+
+
+def backfill_completion_scores(Profile, Company, Position, batch_size: int = 1000, stdout=None) -> int:
+    """
+    completion_score kolonlarını pk aralıkları halinde tek UPDATE'lerle
+    yeniden hesaplar; güncellenen satır sayısını döner.
+    """
+    from .completion import company_score_expression, profile_score_expression
+
+    total = 0
+    for model, expression in (
+        (Profile, profile_score_expression(Profile)),
+        (Company, company_score_expression(Position)),
+    ):
+        last_pk = 0
+        while True:
+            pks = list(model.objects.filter(pk__gt=last_pk).order_by("pk").values_list("pk", flat=True)[:batch_size])
+            if not pks:
+                break
+            total += model.objects.filter(pk__gte=pks[0], pk__lte=pks[-1]).update(completion_score=expression)
+            last_pk = pks[-1]
+            if stdout is not None:
+                stdout.write(f"{model.__name__}: up to pk {last_pk}")
+    return total
+
+
+def backfill_company_dashboards(Company, CompanyDashboard, Position, Bookmark,
+                                batch_size: int = 1000, stdout=None) -> int:
+    """Her şirket için CompanyDashboard satırını oluşturur / yeniden sayar."""
+    from .dashboard import refresh_dashboards
+
+    total = 0
+    last_pk = 0
+    while True:
+        pks = list(Company.objects.filter(pk__gt=last_pk).order_by("pk").values_list("pk", flat=True)[:batch_size])
+        if not pks:
+            break
+        with transaction.atomic():
+            total += refresh_dashboards(CompanyDashboard, Position, Bookmark, pks, create=True)
+        last_pk = pks[-1]
+        if stdout is not None:
+            stdout.write(f"Company: up to pk {last_pk}")
+    return total
@@ -0,0 +1,251 @@
+# profiles/benchmarks.py
+"""Benchmark komutları için ortak yardımcılar (geçici veri üretimi, ölçüm)."""
+import itertools
+import random
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from .backfill import (
+    backfill_company_dashboards,
+    backfill_completion_scores,
+    backfill_project_technologies,
+)
+from .models import (
+    Bookmark,
+    Certification,
+    Company,
+    CompanyDashboard,
+    Position,
+    Profile,
+    Project,
+    Skill,
+    Technology,
+)
+from .search import refresh_search_documents
+from .versioning import CANDIDATES, bump_version
+
+SKILL_CATALOG = 200
+
+
+def seed_skill_catalog(size: int = SKILL_CATALOG) -> list[int]:
+    Skill.objects.bulk_create(
+        [Skill(name=f"bench-skill-{i:03d}") for i in range(size)], ignore_conflicts=True
+    )
+    return list(Skill.objects.filter(name__startswith="bench-skill-").values_list("id", flat=True))
+
+
+def seed_students(size: int, prefix: str, skills_per_profile: int = 6, rng=None) -> list[int]:
+    """``size`` öğrenci (User + Profile + skill'ler + 1 proje) üretir; profile id'lerini döner."""
+    rng = rng or random.Random(42)
+    skill_ids = seed_skill_catalog()
+    skill_names = dict(Skill.objects.filter(id__in=skill_ids).values_list("id", "name"))
+
+    User.objects.bulk_create(
+        [User(username=f"{prefix}{i}", first_name="Student", last_name=str(i), password="!")
+         for i in range(size)],
+        batch_size=2000,
+    )
+    user_ids = User.objects.filter(username__startswith=prefix).values_list("id", flat=True)
+    Profile.objects.bulk_create(
+        [Profile(user_id=uid, major="Computer Science", location="Istanbul", graduation_year=2026)
+         for uid in user_ids],
+        batch_size=2000,
+    )
+    profile_ids = list(
+        Profile.objects.filter(user__username__startswith=prefix).values_list("id", flat=True)
+    )
+    Through = Profile.skills.through
+    Through.objects.bulk_create(
+        [Through(profile_id=pid, skill_id=sid)
+         for pid in profile_ids
+         for sid in rng.sample(skill_ids, skills_per_profile)],
+        batch_size=5000,
+    )
+    Project.objects.bulk_create(
+        [Project(profile_id=pid, title="Project",
+                 technologies=", ".join(skill_names[sid] for sid in rng.sample(skill_ids, 2)))
+         for pid in profile_ids],
+        batch_size=2000,
+    )
+    backfill_project_technologies(Project, Technology, batch_size=5000)
+    return profile_ids
+
+
+def measure(func, *args, **kwargs):
+    """(sonuç, sorgu sayısı, süre ms, tepe bellek byte)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    with CaptureQueriesContext(connection) as ctx:
+        result = func(*args, **kwargs)
+    elapsed = (time.perf_counter() - start) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, len(ctx.captured_queries), elapsed, peak
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, round(q * (len(sorted_values) - 1)))]
+
+
+# ---------------------------------
+# Ölçekli sentetik veri seti (seed_dataset / bench_views)
+# ---------------------------------
+FIRST_NAMES = ("Ayşe", "Mehmet", "Zeynep", "Can", "Elif", "Burak", "Deniz", "Ece", "Emre", "Selin")
+LAST_NAMES = ("Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Aydın", "Öztürk", "Arslan", "Doğan", "Koç")
+UNIVERSITIES = (
+    "Boğaziçi University", "METU", "ITU", "Bilkent University", "Koç University",
+    "Sabancı University", "Hacettepe University", "Ege University",
+)
+MAJORS = (
+    "Computer Science", "Computer Engineering", "Software Engineering", "Electrical Engineering",
+    "Industrial Engineering", "Mathematics", "Data Science", "Business Administration",
+)
+LOCATIONS = ("Istanbul", "Ankara", "Izmir", "Bursa", "Antalya", "Eskisehir", "Kocaeli")
+INTERNSHIP_TYPES = ("full_time", "part_time", "remote", None)
+INDUSTRIES = ("Software", "Fintech", "E-commerce", "Gaming", "Telecom", "Consulting", "Healthcare")
+CERTIFICATIONS = (
+    ("AWS Cloud Practitioner", "Amazon"), ("Google Data Analytics", "Google"),
+    ("Azure Fundamentals", "Microsoft"), ("Deep Learning Specialization", "Coursera"),
+    ("CCNA", "Cisco"), ("Scrum Master", "Scrum.org"),
+)
+GRADUATION_YEARS = range(2024, 2030)
+
+
+def _popular(rng, ids, cum_weights, k) -> set:
+    """Zipf benzeri seçim: katalogdaki ilk skill'ler daha sık görünür."""
+    picked = set()
+    while len(picked) < min(k, len(ids)):
+        picked.add(rng.choices(ids, cum_weights=cum_weights)[0])
+    return picked
+
+
+def seed_dataset(students: int, companies: int, prefix: str, positions_per_company: int = 3,
+                 bookmarks_per_company: int = 25, password: str = "!", rng=None) -> dict:
+    """
+    Ölçekli, dağılımı gerçeğe yakın veri seti üretir: ``students`` öğrenci
+    (0-12 skill, 0-4 proje, 0-3 sertifika) ve ``companies`` şirket
+    (pozisyonlar + required/nice-to-have skill'ler + bookmark'lar). Her şey
+    bulk_create ile yazılır; sinyallerin kuracağı türetilmiş veriler (proje
+    teknolojileri, arama dokümanları, tamamlanma skorları, dashboard'lar)
+    sonda toplu olarak yeniden hesaplanır. ``password`` hazır bir hash'tir
+    (make_password). ``{"profile_ids", "user_ids", "company_ids"}`` döner;
+    öğrenci listeleri aynı sıradadır.
+    """
+    rng = rng or random.Random(42)
+    skill_ids = seed_skill_catalog()
+    skill_names = dict(Skill.objects.filter(id__in=skill_ids).values_list("id", "name"))
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(skill_ids))))
+
+    User.objects.bulk_create(
+        [User(username=f"{prefix}student-{i}", email=f"{prefix}student-{i}@example.com",
+              first_name=rng.choice(FIRST_NAMES), last_name=rng.choice(LAST_NAMES), password=password)
+         for i in range(students)]
+        + [User(username=f"{prefix}company-{i}", email=f"{prefix}company-{i}@example.com", password=password)
+           for i in range(companies)],
+        batch_size=2000,
+    )
+    user_ids = list(
+        User.objects.filter(username__startswith=f"{prefix}student-").order_by("id").values_list("id", flat=True)
+    )
+    Profile.objects.bulk_create(
+        [Profile(
+            user_id=uid,
+            university=rng.choice(UNIVERSITIES),
+            major=rng.choice(MAJORS),
+            graduation_year=rng.choice(GRADUATION_YEARS),
+            location=rng.choice(LOCATIONS),
+            bio="Curious student looking for an internship." if rng.random() < 0.6 else None,
+            github=f"https://github.com/{prefix}{uid}" if rng.random() < 0.5 else None,
+            internship_type=rng.choice(INTERNSHIP_TYPES),
+            preferred_locations=", ".join(rng.sample(LOCATIONS, 2)),
+            open_to_relocate=rng.random() < 0.3,
+            profile_views=int(rng.expovariate(1 / 20)),
+        ) for uid in user_ids],
+        batch_size=2000,
+    )
+    profiles = list(
+        Profile.objects.filter(user_id__in=user_ids).order_by("user_id").values_list("id", flat=True)
+    )
+
+    Through = Profile.skills.through
+    student_skills = {pid: _popular(rng, skill_ids, cum_weights, rng.randint(0, 12)) for pid in profiles}
+    Through.objects.bulk_create(
+        [Through(profile_id=pid, skill_id=sid) for pid, sids in student_skills.items() for sid in sids],
+        batch_size=5000,
+    )
+    Project.objects.bulk_create(
+        [Project(
+            profile_id=pid,
+            title=f"Project {n + 1}",
+            description="Built as a course / side project.",
+            technologies=", ".join(
+                skill_names[sid] for sid in _popular(rng, skill_ids, cum_weights, rng.randint(1, 4))
+            ),
+        ) for pid in profiles for n in range(rng.randint(0, 4))],
+        batch_size=2000,
+    )
+    Certification.objects.bulk_create(
+        [Certification(
+            profile_id=pid, name=name, organization=organization,
+            date_obtained=date(2022, 1, 1) + timedelta(days=rng.randint(0, 1400)),
+        ) for pid in profiles for name, organization in rng.sample(CERTIFICATIONS, rng.randint(0, 3))],
+        batch_size=2000,
+    )
+
+    company_users = list(
+        User.objects.filter(username__startswith=f"{prefix}company-").order_by("id").values_list("id", "username")
+    )
+    Company.objects.bulk_create(
+        [Company(
+            user_id=uid, name=f"{username.title()} Ltd", slug=username,
+            industry=rng.choice(INDUSTRIES), location=rng.choice(LOCATIONS),
+            about="We hire interns every semester.", contact_email=f"{username}@example.com",
+            is_verified=rng.random() < 0.7,
+        ) for uid, username in company_users],
+        batch_size=2000,
+    )
+    company_ids = list(
+        Company.objects.filter(user_id__in=[uid for uid, _ in company_users]).order_by("user_id")
+        .values_list("id", flat=True)
+    )
+    Position.objects.bulk_create(
+        [Position(company_id=cid, title=f"{rng.choice(MAJORS)} Intern", description="Summer internship.")
+         for cid in company_ids for _ in range(positions_per_company)],
+        batch_size=2000,
+    )
+    positions = Position.objects.filter(company_id__in=company_ids).values_list("id", flat=True)
+    Required, Nice = Position.required_skills.through, Position.nice_to_have_skills.through
+    required, nice = [], []
+    for pos_id in positions:
+        picked = list(_popular(rng, skill_ids, cum_weights, 6))
+        required += [Required(position_id=pos_id, skill_id=sid) for sid in picked[:3]]
+        nice += [Nice(position_id=pos_id, skill_id=sid) for sid in picked[3:]]
+    Required.objects.bulk_create(required, batch_size=5000)
+    Nice.objects.bulk_create(nice, batch_size=5000)
+    Bookmark.objects.bulk_create(
+        [Bookmark(company_id=cid, profile_id=pid)
+         for cid in company_ids for pid in rng.sample(profiles, min(bookmarks_per_company, len(profiles)))],
+        batch_size=5000,
+    )
+
+    backfill_project_technologies(Project, Technology, batch_size=5000)
+    for start in range(0, len(profiles), 1000):
+        refresh_search_documents(profiles[start:start + 1000])
+    backfill_completion_scores(Profile, Company, Position, batch_size=5000)
+    backfill_company_dashboards(Company, CompanyDashboard, Position, Bookmark, batch_size=5000)
+    bump_version(CANDIDATES)
+    return {"profile_ids": profiles, "user_ids": user_ids, "company_ids": company_ids}
+
+
+def clear_dataset(prefix: str) -> int:
+    """seed_dataset'in ``prefix`` ile ürettiği kullanıcıları (ve cascade ile geri kalanını) siler."""
+    deleted, _ = User.objects.filter(username__startswith=prefix).delete()
+    bump_version(CANDIDATES)
+    return deleted
@@ -0,0 +1,107 @@
+# profiles/cards.py
+"""
+Recruiter listesindeki öğrenci kartları için hafif yükleyici.
+
+Kart şablonu sadece isim, bölüm, lokasyon, mezuniyet yılı ve ilk N skill'i
+gösterir. Tam Profile/User nesneleri (ve proje prefetch'i) yerine:
+
+1. sorgu: sadece kart kolonları (``values``),
+2. sorgu: profil başına ilk N skill adı (ROW_NUMBER penceresi ile SQL'de
+   kırpılır).
+
+Sonuç ``__slots__``'lu StudentCard kayıtlarıdır.
+"""
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+from .models import Profile
+
+CARD_SKILL_LIMIT = 8
+
+CARD_FIELDS = (
+    "id",
+    "user_id",
+    "user__username",
+    "user__first_name",
+    "user__last_name",
+    "major",
+    "location",
+    "graduation_year",
+    "completion_score",
+)
+
+
+class StudentCard:
+    __slots__ = (
+        "id", "user_id", "name", "major", "location", "graduation_year", "completion", "skills", "score",
+    )
+
+    def __init__(self, id, user_id, name, major, location, graduation_year, completion=0, skills=(),
+                 score=None):
+        self.id = id
+        self.user_id = user_id
+        self.name = name
+        self.major = major
+        self.location = location
+        self.graduation_year = graduation_year
+        self.completion = completion
+        self.skills = skills
+        # Position eşleşme puanı (profiles.ranking), yoksa None
+        self.score = score
+
+    def __repr__(self):
+        return f"<StudentCard {self.id}: {self.name}>"
+
+
+def card_rows(qs, *extra):
+    """Profile queryset'ini kart kolonlarına indirger (``extra``: ör. search_rank)."""
+    return qs.values(*CARD_FIELDS, *(field for field in extra if field not in CARD_FIELDS))
+
+
+def skill_names_by_profile(profile_ids, limit: int = CARD_SKILL_LIMIT) -> dict:
+    """profile_id -> isim sırasına göre ilk ``limit`` skill adı (tek sorgu)."""
+    if not profile_ids:
+        return {}
+    Through = Profile.skills.through
+    rows = (
+        Through.objects.filter(profile_id__in=profile_ids)
+        .annotate(
+            rank=Window(
+                RowNumber(),
+                partition_by=[F("profile_id")],
+                order_by=[F("skill__name").asc()],
+            )
+        )
+        .filter(rank__lte=limit)
+        .values_list("profile_id", "skill__name")
+    )
+    skills = {}
+    for profile_id, name in rows:
+        skills.setdefault(profile_id, []).append(name)
+    for names in skills.values():
+        names.sort()
+    return skills
+
+
+def build_cards(rows, skill_limit: int = CARD_SKILL_LIMIT) -> list:
+    """``card_rows`` satırlarından (sırası korunarak) StudentCard listesi."""
+    rows = list(rows)
+    skills = skill_names_by_profile([row["id"] for row in rows], skill_limit)
+    cards = []
+    for row in rows:
+        full_name = f"{row['user__first_name']} {row['user__last_name']}".strip()
+        cards.append(StudentCard(
+            row["id"],
+            row["user_id"],
+            full_name or row["user__username"],
+            row["major"],
+            row["location"],
+            row["graduation_year"],
+            row["completion_score"],
+            tuple(skills.get(row["id"], ())),
+        ))
+    return cards
+
+
+def load_student_cards(qs, skill_limit: int = CARD_SKILL_LIMIT) -> list:
+    return build_cards(card_rows(qs), skill_limit)
@@ -0,0 +1,69 @@
+# profiles/completion.py
+"""
+Denormalize profil / şirket tamamlanma skoru.
+
+Skor ``completion_score`` kolonunda tutulur ve sadece bağlı olduğu alan ve
+ilişkiler değişince (profiles.signals) tek bir UPDATE ile SQL'de yeniden
+hesaplanır:
+
+* Profile: bio (30) + location (30) + en az bir skill (40)
+* Company: about (30) + location (30) + en az bir position (40)
+
+İfadeler model sınıflarını parametre alır; backfill migration'ı tarihsel
+modellerle aynı kodu kullanır.
+"""
+from django.db.models import Case, Exists, IntegerField, OuterRef, Q, Value, When
+
+from .models import Company, Position, Profile
+
+BIO_POINTS = 30
+LOCATION_POINTS = 30
+SKILLS_POINTS = 40
+
+ABOUT_POINTS = 30
+COMPANY_LOCATION_POINTS = 30
+POSITIONS_POINTS = 40
+
+
+def _filled(field: str) -> Q:
+    return Q(**{f"{field}__isnull": False}) & ~Q(**{field: ""})
+
+
+def _points(condition, points: int):
+    return Case(When(condition, then=Value(points)), default=Value(0), output_field=IntegerField())
+
+
+def profile_score_expression(Profile):
+    has_skills = Exists(Profile.skills.through.objects.filter(profile_id=OuterRef("pk")))
+    return (
+        _points(_filled("bio"), BIO_POINTS)
+        + _points(_filled("location"), LOCATION_POINTS)
+        + _points(has_skills, SKILLS_POINTS)
+    )
+
+
+def company_score_expression(Position):
+    has_positions = Exists(Position.objects.filter(company_id=OuterRef("pk")))
+    return (
+        _points(_filled("about"), ABOUT_POINTS)
+        + _points(_filled("location"), COMPANY_LOCATION_POINTS)
+        + _points(has_positions, POSITIONS_POINTS)
+    )
+
+
+def refresh_profile_completion(profile_ids) -> int:
+    profile_ids = [pk for pk in profile_ids if pk]
+    if not profile_ids:
+        return 0
+    return Profile.objects.filter(pk__in=profile_ids).update(
+        completion_score=profile_score_expression(Profile)
+    )
+
+
+def refresh_company_completion(company_ids) -> int:
+    company_ids = [pk for pk in company_ids if pk]
+    if not company_ids:
+        return 0
+    return Company.objects.filter(pk__in=company_ids).update(
+        completion_score=company_score_expression(Position)
+    )
@@ -0,0 +1,78 @@
+# profiles/dashboard.py
+"""
+Şirket paneli özet sayaçları (CompanyDashboard).
+
+Sayaçlar artırıp azaltılmaz, değişiklikten sonra tek bir UPDATE içinde
+ilişkili alt sorgularla yeniden sayılır: toplu ekleme/silme ve m2m clear
+sonrası da doğru kalır. UPDATE özet satırını kilitlediği için aynı şirket
+için eşzamanlı iki değişiklik sırayla uygulanır (InnoDB, UPDATE içindeki alt
+sorguları kilitli okuma ile en son commit edilmiş veriye göre çalıştırır).
+
+Tamamlanma skoru zaten Company.completion_score kolonunda
+(profiles.completion); özet ile aynı satırdan okunur.
+
+İfadeler model sınıflarını parametre alır; backfill migration'ı tarihsel
+modellerle aynı kodu kullanır.
+"""
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import Bookmark, CompanyDashboard, Position
+
+
+def _company_count(model):
+    counts = (
+        model.objects.filter(company_id=OuterRef("company_id"))
+        .order_by()
+        .values("company_id")
+        .annotate(n=Count("pk"))
+        .values("n")
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+
+def dashboard_values(Position, Bookmark) -> dict:
+    """CompanyDashboard UPDATE'i için kolon -> ifade."""
+    return {
+        "open_positions": _company_count(Position),
+        "bookmarks": _company_count(Bookmark),
+    }
+
+
+def refresh_dashboards(CompanyDashboard, Position, Bookmark, company_ids, create: bool = False) -> int:
+    """
+    Özet satırlarını yeniden sayar. Sinyaller sadece var olan satırları
+    günceller (cascade silmede silinmekte olan şirket için satır yeniden
+    oluşmaz); ``create=True`` eksik satırları da ekler.
+    """
+    company_ids = list({pk for pk in company_ids if pk})
+    if not company_ids:
+        return 0
+    if create:
+        CompanyDashboard.objects.bulk_create(
+            [CompanyDashboard(company_id=pk) for pk in company_ids], ignore_conflicts=True
+        )
+    return CompanyDashboard.objects.filter(company_id__in=company_ids).update(
+        updated_at=timezone.now(), **dashboard_values(Position, Bookmark)
+    )
+
+
+def refresh_company_dashboards(company_ids, create: bool = False) -> int:
+    return refresh_dashboards(CompanyDashboard, Position, Bookmark, company_ids, create=create)
+
+
+def company_dashboard(company) -> CompanyDashboard:
+    """
+    Şirketin özet satırı. Satır yoksa kaydetmeden hesaplanır; GET isteği
+    veritabanına yazmaz. ``select_related("dashboard")`` ile yüklenmiş
+    şirkette ek sorgu yapılmaz.
+    """
+    try:
+        return company.dashboard
+    except CompanyDashboard.DoesNotExist:
+        return CompanyDashboard(
+            company=company,
+            open_positions=Position.objects.filter(company_id=company.pk).count(),
+            bookmarks=Bookmark.objects.filter(company_id=company.pk).count(),
+        )
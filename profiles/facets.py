@@ -0,0 +1,96 @@
+# profiles/facets.py
+"""
+Recruiter filtre paneli için facet sayıları.
+
+Mevcut sonuç kümesi (filtrelenmiş öğrenciler) üzerinde her boyut için tek
+bir GROUP BY sorgusu çalışır; toplam sabit 6 sorgu. Sonuç normalize
+edilmiş filtre kombinasyonu + aday verisi sürümü ile cache'lenir, böylece
+Profile / Profile.skills / Project değişince kendiliğinden geçersizleşir.
+"""
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.db.models import Count
+
+from .models import Profile, Project
+from .search import FILTER_KEYS, apply_candidate_filters, student_queryset
+from .versioning import CANDIDATES, get_version
+
+FACET_LIMIT = 8
+FACET_CACHE_TIMEOUT = 600
+
+_CASE_INSENSITIVE_KEYS = ("major", "skill", "project_skill", "location", "internship_type")
+
+
+def normalize_filters(filters: dict) -> dict:
+    """icontains/iexact filtreleri için büyük-küçük harf farkı sonucu değiştirmez."""
+    normalized = {}
+    for key in (*FILTER_KEYS, "q"):
+        value = (filters.get(key) or "").strip()
+        if key in _CASE_INSENSITIVE_KEYS:
+            value = value.lower()
+        if value:
+            normalized[key] = value
+    return normalized
+
+
+def filters_digest(filters: dict) -> str:
+    raw = json.dumps(normalize_filters(filters), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def _grouped(qs, field, limit=FACET_LIMIT):
+    rows = (
+        qs.exclude(**{f"{field}__isnull": True})
+        .exclude(**{field: ""})
+        .values_list(field)
+        .annotate(n=Count("pk"))
+        .order_by("-n", field)
+    )
+    if limit:
+        rows = rows[:limit]
+    return [(value, n) for value, n in rows]
+
+
+def compute_facets(filters: dict) -> dict:
+    ids = apply_candidate_filters(student_queryset(), filters).order_by().values("id")
+    students = Profile.objects.filter(id__in=ids).order_by()
+
+    # Mezuniyet yılı sınırsız gruplanır (NULL dahil); toplamı sonuç sayısıdır
+    years = list(
+        students.values_list("graduation_year").annotate(n=Count("pk")).order_by("-graduation_year")
+    )
+    total = sum(n for _, n in years)
+
+    skills = (
+        Profile.skills.through.objects.filter(profile_id__in=ids)
+        .values_list("skill__name")
+        .annotate(n=Count("pk"))
+        .order_by("-n", "skill__name")[:FACET_LIMIT]
+    )
+    project_skills = (
+        Project.technology_tags.through.objects.filter(project__profile_id__in=ids)
+        .values_list("technology__name")
+        .annotate(n=Count("project__profile_id", distinct=True))
+        .order_by("-n", "technology__name")[:FACET_LIMIT]
+    )
+
+    return {
+        "total": total,
+        "major": _grouped(students, "major"),
+        "location": _grouped(students, "location"),
+        "internship_type": _grouped(students, "internship_type"),
+        "graduation_year": [(year, n) for year, n in years if year is not None],
+        "skill": [(name, n) for name, n in skills],
+        "project_skill": [(tech, n) for tech, n in project_skills],
+    }
+
+
+def facet_counts(filters: dict) -> dict:
+    key = f"profiles:facets:v{get_version(CANDIDATES)}:{filters_digest(filters)}"
+    facets = cache.get(key)
+    if facets is None:
+        facets = compute_facets(normalize_filters(filters))
+        cache.set(key, facets, FACET_CACHE_TIMEOUT)
+    return facets
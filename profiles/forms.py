@@ -37,4 +37,10 @@ class CompanyForm(forms.ModelForm):
 class PositionForm(forms.ModelForm):
     class Meta:
         model = Position
-        fields = ['title', 'description', 'link']
+        fields = ['title', 'description', 'link', 'required_skills', 'nice_to_have_skills']
+        # Skill'ler company_profile'daki autocomplete seçicisinden id olarak gelir;
+        # tüm skill tablosu seçenek olarak render edilmez
+        widgets = {
+            'required_skills': forms.MultipleHiddenInput(),
+            'nice_to_have_skills': forms.MultipleHiddenInput(),
+        }
@@ -0,0 +1,394 @@
+# profiles/importer.py
+"""
+Toplu öğrenci / şirket içe aktarma (``import_accounts`` komutu).
+
+Dosya (CSV ya da JSONL) satır satır okunur ve ``batch_size``'lık parçalar
+halinde yazılır; bellekte aynı anda tek parça + skill / technology isim
+haritaları tutulur. Her parça tek transaction:
+
+* User / Profile / Company / Project / Certification ``bulk_create``,
+* skill ve technology ilişkileri through tablolarına toplu insert,
+* bulk_create sinyal göndermediği için türetilmiş veriler (arama dokümanı,
+  completion_score, şirket paneli özeti) parça sonunda sabit sayıda
+  sorguyla yenilenir.
+
+MySQL bulk_create'te pk döndürmediği için id'ler doğal anahtarla
+(username, user_id, profile_id) geri okunur.
+
+Satır alanları::
+
+    type                student (varsayılan) | company
+    username            zorunlu; mevcut kullanıcılar atlanır
+    email, first_name, last_name
+    password            verilirse hash'lenir (yavaş); yoksa kullanılamaz parola
+    # öğrenci
+    university, major, graduation_year, location, bio, github, linkedin,
+    website, internship_type, preferred_locations, open_to_relocate
+    skills              JSONL: liste; CSV: ";" ile ayrılmış isimler
+    projects            [{title, description, technologies, link}, ...]
+    certifications      [{name, organization, date_obtained, certificate_url}, ...]
+    # şirket
+    name, industry, location, website, about, contact_email
+
+CSV'de ``projects`` / ``certifications`` hücreleri JSON metnidir.
+"""
+import csv
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import date
+from itertools import islice
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import reset_queries, transaction
+
+from .completion import refresh_company_completion, refresh_profile_completion
+from .dashboard import refresh_company_dashboards
+from .models import Certification, Company, Profile, Project, Skill, Technology
+from .search import refresh_search_documents
+from .slugs import free_slugs, slug_base
+from .versioning import CANDIDATES, SKILLS, bump_version
+
+IMPORT_BATCH_SIZE = 1000
+FORMATS = ("csv", "jsonl")
+SKILL_SEPARATOR = ";"
+# Hatalı satırların tamamı değil ilk N'i saklanır (bellek satır sayısından bağımsız)
+MAX_REPORTED_ERRORS = 50
+
+STUDENT = "student"
+COMPANY = "company"
+
+PROFILE_FIELDS = (
+    "university", "major", "location", "bio", "github", "linkedin", "website",
+    "internship_type", "preferred_locations",
+)
+COMPANY_FIELDS = ("industry", "location", "website", "about", "contact_email")
+_TRUE = frozenset({"1", "true", "yes", "y", "on"})
+
+
+class ImportRowError(ValueError):
+    pass
+
+
+@dataclass
+class ImportStats:
+    rows: int = 0
+    students: int = 0
+    companies: int = 0
+    skipped: int = 0
+    skill_links: int = 0
+    projects: int = 0
+    certifications: int = 0
+    created_skills: int = 0
+    unknown_skills: int = 0
+    errors: int = 0
+    error_samples: list = field(default_factory=list)
+    started_at: float = field(default_factory=time.perf_counter)
+
+    def add_error(self, line_no: int, message: str) -> None:
+        self.errors += 1
+        if len(self.error_samples) < MAX_REPORTED_ERRORS:
+            self.error_samples.append((line_no, message))
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+
+# ---------------------------------
+# Okuma
+# ---------------------------------
+def read_rows(stream, fmt: str):
+    """(satır no, dict) üretir; dosya baştan sona belleğe alınmaz."""
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+    elif fmt == "jsonl":
+        for line_no, line in enumerate(stream, start=1):
+            if line.strip():
+                try:
+                    yield line_no, json.loads(line)
+                except json.JSONDecodeError as exc:
+                    yield line_no, ImportRowError(f"invalid JSON: {exc.msg}")
+    else:
+        raise ValueError(f"unknown format: {fmt}")
+
+
+def _text(value, max_length=None):
+    value = " ".join(str(value).split()) if value not in (None, "") else ""
+    return value[:max_length] if max_length else value
+
+
+def _list(value, decode_json: bool):
+    if value in (None, ""):
+        return []
+    if isinstance(value, str):
+        if decode_json:
+            try:
+                value = json.loads(value)
+            except json.JSONDecodeError:
+                raise ImportRowError("expected a JSON list") from None
+        else:
+            value = value.split(SKILL_SEPARATOR)
+    if not isinstance(value, list):
+        raise ImportRowError("expected a list")
+    return value
+
+
+def _parse_row(raw) -> dict:
+    """Ham satırı doğrular ve normalize eder; hatalı satır ImportRowError."""
+    if isinstance(raw, ImportRowError):
+        raise raw
+    if not isinstance(raw, dict):
+        raise ImportRowError("expected an object")
+
+    kind = _text(raw.get("type")).lower() or STUDENT
+    if kind not in (STUDENT, COMPANY):
+        raise ImportRowError(f"unknown type: {kind}")
+    username = _text(raw.get("username"), 150)
+    if not username:
+        raise ImportRowError("username is required")
+
+    row = {
+        "type": kind,
+        "username": username,
+        "email": _text(raw.get("email"), 254),
+        "first_name": _text(raw.get("first_name"), 150),
+        "last_name": _text(raw.get("last_name"), 150),
+        "password": raw.get("password") or None,
+    }
+    if kind == COMPANY:
+        row["name"] = _text(raw.get("name"), 255) or username
+        row.update({key: raw.get(key) or None for key in COMPANY_FIELDS})
+        return row
+
+    row.update({key: raw.get(key) or None for key in PROFILE_FIELDS})
+    year = raw.get("graduation_year")
+    try:
+        row["graduation_year"] = int(year) if year not in (None, "") else None
+    except (TypeError, ValueError):
+        raise ImportRowError(f"invalid graduation_year: {year}") from None
+    relocate = raw.get("open_to_relocate")
+    row["open_to_relocate"] = relocate if isinstance(relocate, bool) else str(relocate or "").lower() in _TRUE
+
+    row["skills"] = [name for name in (_text(s, 100) for s in _list(raw.get("skills"), False)) if name]
+
+    row["projects"] = []
+    for item in _list(raw.get("projects"), True):
+        if not isinstance(item, dict) or not _text(item.get("title")):
+            raise ImportRowError("project requires a title")
+        row["projects"].append({
+            "title": _text(item["title"], 255),
+            "description": item.get("description") or "",
+            "technologies": _text(item.get("technologies"), 255),
+            "link": item.get("link") or None,
+        })
+
+    row["certifications"] = []
+    for item in _list(raw.get("certifications"), True):
+        if not isinstance(item, dict) or not _text(item.get("name")):
+            raise ImportRowError("certification requires a name")
+        try:
+            obtained = date.fromisoformat(str(item.get("date_obtained")))
+        except ValueError:
+            raise ImportRowError(f"invalid date_obtained: {item.get('date_obtained')}") from None
+        row["certifications"].append({
+            "name": _text(item["name"], 255),
+            "organization": _text(item.get("organization"), 255),
+            "date_obtained": obtained,
+            "certificate_url": item.get("certificate_url") or None,
+        })
+    return row
+
+
+# ---------------------------------
+# Yazma
+# ---------------------------------
+class AccountImporter:
+    def __init__(self, batch_size: int = IMPORT_BATCH_SIZE, create_skills: bool = False,
+                 stdout=None, reset_query_log: bool = False):
+        self.batch_size = batch_size
+        self.create_skills = create_skills
+        self.stdout = stdout
+        # DEBUG=True'da bağlantı son 9000 sorguyu (büyük INSERT metinleriyle) tutar
+        self.reset_query_log = reset_query_log
+        self.stats = ImportStats()
+        # İsim -> id haritaları; büyüklükleri katalogla sınırlı, satır sayısıyla değil
+        self.skill_ids = {
+            name.lower(): pk for pk, name in Skill.objects.values_list("id", "name").iterator(chunk_size=10_000)
+        }
+        self.technology_ids = {}
+
+    def run(self, rows) -> ImportStats:
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, self.batch_size))
+            if not chunk:
+                break
+            self._import_chunk(chunk)
+            if self.reset_query_log:
+                reset_queries()
+            if self.stdout is not None:
+                self.stdout.write(
+                    f"{self.stats.rows} rows, {self.stats.rows_per_sec:.0f} rows/sec"
+                )
+        if self.stats.students or self.stats.companies:
+            transaction.on_commit(lambda: bump_version(CANDIDATES))
+        if self.stats.created_skills:
+            transaction.on_commit(lambda: bump_version(SKILLS))
+        return self.stats
+
+    def _import_chunk(self, chunk) -> None:
+        rows = []
+        for line_no, raw in chunk:
+            self.stats.rows += 1
+            try:
+                rows.append(_parse_row(raw))
+            except ImportRowError as exc:
+                self.stats.add_error(line_no, str(exc))
+
+        # Dosyada tekrar eden ve veritabanında olan kullanıcı adları atlanır
+        unique = {}
+        for row in rows:
+            unique.setdefault(row["username"], row)
+        existing = set(User.objects.filter(username__in=unique).values_list("username", flat=True))
+        new_rows = [row for name, row in unique.items() if name not in existing]
+        self.stats.skipped += len(rows) - len(new_rows)
+        rows = new_rows
+        if not rows:
+            return
+
+        with transaction.atomic():
+            user_ids = self._create_users(rows)
+            students = [row for row in rows if row["type"] == STUDENT]
+            companies = [row for row in rows if row["type"] == COMPANY]
+            if students:
+                self._create_students(students, user_ids)
+            if companies:
+                self._create_companies(companies, user_ids)
+
+        self.stats.students += len(students)
+        self.stats.companies += len(companies)
+
+    def _create_users(self, rows) -> dict:
+        unusable = make_password(None)
+        User.objects.bulk_create(
+            [
+                User(
+                    username=row["username"],
+                    email=row["email"],
+                    first_name=row["first_name"],
+                    last_name=row["last_name"],
+                    password=make_password(row["password"]) if row["password"] else unusable,
+                )
+                for row in rows
+            ],
+            batch_size=self.batch_size,
+        )
+        return dict(
+            User.objects.filter(username__in=[row["username"] for row in rows]).values_list("username", "id")
+        )
+
+    def _create_students(self, rows, user_ids) -> None:
+        Profile.objects.bulk_create(
+            [
+                Profile(
+                    user_id=user_ids[row["username"]],
+                    graduation_year=row["graduation_year"],
+                    open_to_relocate=row["open_to_relocate"],
+                    **{key: row[key] for key in PROFILE_FIELDS},
+                )
+                for row in rows
+            ],
+            batch_size=self.batch_size,
+        )
+        profile_ids = dict(
+            Profile.objects.filter(user_id__in=[user_ids[row["username"]] for row in rows])
+            .values_list("user_id", "id")
+        )
+        by_profile = {profile_ids[user_ids[row["username"]]]: row for row in rows}
+
+        self._link_skills(by_profile)
+        self._create_projects(by_profile)
+        Certification.objects.bulk_create(
+            [Certification(profile_id=pid, **cert) for pid, row in by_profile.items() for cert in row["certifications"]],
+            batch_size=self.batch_size,
+        )
+        self.stats.certifications += sum(len(row["certifications"]) for row in rows)
+
+        refresh_profile_completion(list(by_profile))
+        refresh_search_documents(list(by_profile))
+
+    def _link_skills(self, by_profile) -> None:
+        names = {}
+        for row in by_profile.values():
+            for name in row["skills"]:
+                names.setdefault(name.lower(), name)
+        missing = [name for key, name in names.items() if key not in self.skill_ids]
+        if missing and self.create_skills:
+            Skill.objects.bulk_create([Skill(name=name) for name in missing], ignore_conflicts=True)
+            created = Skill.objects.filter(name__in=missing).values_list("id", "name")
+            for pk, name in created:
+                self.skill_ids[name.lower()] = pk
+            self.stats.created_skills += len(missing)
+
+        Through = Profile.skills.through
+        links = []
+        for pid, row in by_profile.items():
+            seen = set()
+            for name in row["skills"]:
+                skill_id = self.skill_ids.get(name.lower())
+                if skill_id is None:
+                    self.stats.unknown_skills += 1
+                elif skill_id not in seen:
+                    seen.add(skill_id)
+                    links.append(Through(profile_id=pid, skill_id=skill_id))
+        Through.objects.bulk_create(links, batch_size=self.batch_size)
+        self.stats.skill_links += len(links)
+
+    def _create_projects(self, by_profile) -> None:
+        projects = [Project(profile_id=pid, **project) for pid, row in by_profile.items() for project in row["projects"]]
+        if not projects:
+            return
+        Project.objects.bulk_create(projects, batch_size=self.batch_size)
+        self.stats.projects += len(projects)
+
+        # Project.save'deki sync_technologies'in toplu karşılığı
+        saved = list(Project.objects.filter(profile_id__in=by_profile.keys()).values_list("id", "technologies"))
+        tokens = {pk: Technology.tokenize(text) for pk, text in saved}
+        missing = {name for names in tokens.values() for name in names if name not in self.technology_ids}
+        if missing:
+            Technology.objects.bulk_create([Technology(name=name) for name in missing], ignore_conflicts=True)
+            self.technology_ids.update(Technology.objects.filter(name__in=missing).values_list("name", "id"))
+        Through = Project.technology_tags.through
+        Through.objects.bulk_create(
+            [Through(project_id=pk, technology_id=self.technology_ids[name]) for pk, names in tokens.items() for name in names],
+            batch_size=self.batch_size,
+        )
+
+    def _create_companies(self, rows, user_ids) -> None:
+        # Company.save ile aynı şema; parça başına tek sorgu
+        slugs = free_slugs(Company.objects.all(), [slug_base(row["name"], row["username"]) for row in rows])
+        Company.objects.bulk_create(
+            [
+                Company(
+                    user_id=user_ids[row["username"]],
+                    name=row["name"],
+                    slug=slug,
+                    **{key: row[key] for key in COMPANY_FIELDS},
+                )
+                for row, slug in zip(rows, slugs)
+            ],
+            batch_size=self.batch_size,
+        )
+        company_ids = list(
+            Company.objects.filter(user_id__in=[user_ids[row["username"]] for row in rows]).values_list("id", flat=True)
+        )
+        refresh_company_completion(company_ids)
+        refresh_company_dashboards(company_ids, create=True)
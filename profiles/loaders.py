@@ -0,0 +1,43 @@
+# profiles/loaders.py
+"""
+Sayfa yükleyicileri.
+
+profile_detail için profil sabit sayıda sorguyla yüklenir:
+
+1. Profile + User (select_related, kullanıcı adıyla),
+2-4. skills / projects / certifications prefetch'leri.
+
+Sayılar ve tamamlanma yüzdesi prefetch edilmiş listelerden türetilir;
+şablondaki ``profile.skills.all`` vb. çağrılar da aynı cache'i kullanır.
+"""
+from django.contrib.auth.models import User
+from django.shortcuts import get_object_or_404
+
+from .models import Profile
+
+
+def profile_page_queryset():
+    return Profile.objects.select_related("user").prefetch_related("skills", "projects", "certifications")
+
+
+def load_profile_page(username: str) -> Profile:
+    """Kullanıcının profilini (yoksa oluşturup) prefetch'leriyle döner; kullanıcı yoksa 404."""
+    profile = profile_page_queryset().filter(user__username=username).first()
+    if profile is None:
+        user = get_object_or_404(User, username=username)
+        Profile.objects.get_or_create(user=user)
+        profile = profile_page_queryset().get(user=user)
+    return profile
+
+
+def profile_page_counts(profile: Profile) -> dict:
+    """Prefetch edilmiş ilişkilerden sayılar (ek sorgu yok)."""
+    skills = profile.skills.all()
+    return {
+        "skills": skills,
+        "projects": profile.projects.all(),
+        "certifications": profile.certifications.all(),
+        "skills_count": len(skills),
+        "projects_count": len(profile.projects.all()),
+        "certifications_count": len(profile.certifications.all()),
+    }
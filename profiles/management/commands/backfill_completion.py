@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from profiles.backfill import backfill_completion_scores
+from profiles.models import Company, Position, Profile
+from profiles.versioning import CANDIDATES, bump_version
+
+
+class Command(BaseCommand):
+    help = "Profile ve Company completion_score kolonlarını parça parça yeniden hesaplar."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        total = backfill_completion_scores(
+            Profile, Company, Position, batch_size=options["batch_size"], stdout=self.stdout
+        )
+        bump_version(CANDIDATES)
+        self.stdout.write(self.style.SUCCESS(f"{total} rows updated."))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from profiles.backfill import backfill_company_dashboards
+from profiles.models import Bookmark, Company, CompanyDashboard, Position
+
+
+class Command(BaseCommand):
+    help = "Şirket paneli özet sayaçlarını (CompanyDashboard) parça parça yeniden sayar."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        total = backfill_company_dashboards(
+            Company, CompanyDashboard, Position, Bookmark, batch_size=options["batch_size"], stdout=self.stdout
+        )
+        self.stdout.write(self.style.SUCCESS(f"{total} rows updated."))
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from profiles.backfill import backfill_project_technologies
+from profiles.models import Project, Technology
+from profiles.versioning import CANDIDATES, bump_version
+
+
+class Command(BaseCommand):
+    help = "Project.technologies metinlerinden Technology etiketlerini parça parça üretir."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        total = backfill_project_technologies(
+            Project, Technology, batch_size=options["batch_size"], stdout=self.stdout
+        )
+        bump_version(CANDIDATES)
+        self.stdout.write(self.style.SUCCESS(f"{total} projects tagged."))
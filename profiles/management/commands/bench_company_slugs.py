@@ -0,0 +1,103 @@
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import IntegrityError, OperationalError, connection, transaction
+
+from profiles.benchmarks import measure
+from profiles.models import Company
+from profiles.slugs import slug_base
+
+BENCH_NAME = "Bench Slug Race"
+
+
+def _legacy_slug(base):
+    """Eski döngü: dolu sonek başına bir exists() sorgusu."""
+    slug, i = base, 2
+    while Company.objects.filter(slug=slug).exists():
+        slug = f"{base}-{i}"
+        i += 1
+    return slug
+
+
+def _legacy_create(name):
+    return Company.objects.create(name=name, slug=_legacy_slug(slug_base(name)))
+
+
+def _create(name):
+    return Company.objects.create(name=name)
+
+
+class Command(BaseCommand):
+    help = (
+        "Company slug üretimini (profiles.slugs) eski sonek döngüsüyle karşılaştırır: "
+        "aynı isimli binlerce şirket varken tek kayıt maliyeti ve eşzamanlı "
+        "thread'lerle çakışma sayısı. Yarış testi satırları commit eder ve sonunda siler."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--colliding", type=int, nargs="+", default=[100, 1000, 5000])
+        parser.add_argument("--threads", type=int, default=8)
+        parser.add_argument("--per-thread", type=int, default=25)
+
+    def handle(self, *args, **options):
+        base = slug_base(BENCH_NAME)
+        self.stdout.write(f"{'existing':>9} {'path':<8} {'queries':>7} {'ms':>8}")
+        for size in options["colliding"]:
+            with transaction.atomic():
+                Company.objects.bulk_create(
+                    [Company(name=BENCH_NAME, slug=base if i == 1 else f"{base}-{i}") for i in range(1, size + 1)],
+                    batch_size=2000,
+                )
+                for name, create in (("legacy", _legacy_create), ("shared", _create)):
+                    with transaction.atomic():
+                        _, queries, ms, _ = measure(create, BENCH_NAME)
+                        transaction.set_rollback(True)
+                    self.stdout.write(f"{size:>9} {name:<8} {queries:>7} {ms:>8.1f}")
+                transaction.set_rollback(True)
+
+        self.stdout.write("")
+        self.stdout.write(f"{'path':<8} {'threads':>7} {'created':>7} {'collided':>8} {'locked':>6} {'unique':>6} {'s':>6}")
+        for name, create in (("legacy", _legacy_create), ("shared", _create)):
+            try:
+                result = self._race(create, options["threads"], options["per_thread"])
+            finally:
+                Company.objects.filter(name=BENCH_NAME).delete()
+            created, collided, locked, unique, elapsed = result
+            self.stdout.write(
+                f"{name:<8} {options['threads']:>7} {created:>7} {collided:>8} {locked:>6} {str(unique):>6} {elapsed:>6.2f}"
+            )
+
+    @staticmethod
+    def _race(create, threads, per_thread):
+        counts = {"created": 0, "collided": 0, "locked": 0}
+        lock = threading.Lock()
+        barrier = threading.Barrier(threads)
+
+        def worker():
+            try:
+                barrier.wait()
+                for _ in range(per_thread):
+                    try:
+                        create(BENCH_NAME)
+                        key = "created"
+                    except IntegrityError:
+                        key = "collided"
+                    except OperationalError:
+                        # SQLite yazarları kilitleyebilir; MySQL'de görülmez
+                        key = "locked"
+                    with lock:
+                        counts[key] += 1
+            finally:
+                connection.close()
+
+        start = time.perf_counter()
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+        elapsed = time.perf_counter() - start
+
+        slugs = list(Company.objects.filter(name=BENCH_NAME).values_list("slug", flat=True))
+        return counts["created"], counts["collided"], counts["locked"], len(slugs) == len(set(slugs)), elapsed
@@ -0,0 +1,138 @@
+import http.client
+import itertools
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.contrib.auth.models import User
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.management.base import BaseCommand
+from django.urls import reverse
+
+from profiles.benchmarks import percentile, seed_students
+from profiles.models import Company, Profile, Skill, Technology
+from profiles.versioning import CANDIDATES, bump_version
+
+PREFIX = "bench-http-"
+
+
+class Command(BaseCommand):
+    help = (
+        "Çalışan bir sunucuya (sync gunicorn ya da ASGI) şirket sayfası, aday arama "
+        "ve herkese açık profil istekleri gönderip eşzamanlılık başına istek/sn ve "
+        "p50/p99 gecikmeyi ölçer. Sunucu aynı veritabanını kullanmalıdır; öğrenciler "
+        "ve bir şirket hesabı geçici olarak üretilir ve sonunda silinir."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+        parser.add_argument("--label", default="", help="Çıktıdaki dağıtım adı (ör. wsgi / asgi)")
+        parser.add_argument("--students", type=int, default=2000)
+        parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+        parser.add_argument("--requests", type=int, default=400, help="Eşzamanlılık başına istek")
+        parser.add_argument("--keep-data", action="store_true", help="Üretilen veriyi silme")
+
+    def handle(self, *args, **options):
+        company, profile_user_ids = self._seed(options["students"])
+        try:
+            cookie = f"{settings.SESSION_COOKIE_NAME}={self._session(company.user)}"
+            paths = self._paths(company, profile_user_ids)
+            self.stdout.write(
+                f"{'server':<8} {'conc':>5} {'requests':>8} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'errors':>6}"
+            )
+            for concurrency in options["concurrency"]:
+                # Isınma: bağlantılar ve süreç içi cache'ler
+                self._load(options["base_url"], cookie, paths, concurrency, concurrency * 2)
+                latencies, errors, elapsed = self._load(
+                    options["base_url"], cookie, paths, concurrency, options["requests"]
+                )
+                latencies.sort()
+                self.stdout.write(
+                    f"{options['label']:<8} {concurrency:>5} {len(latencies):>8} "
+                    f"{len(latencies) / elapsed:>8.1f} {percentile(latencies, 0.5):>8.1f} "
+                    f"{percentile(latencies, 0.99):>8.1f} {errors:>6}"
+                )
+        finally:
+            if not options["keep_data"]:
+                self._cleanup()
+
+    @staticmethod
+    def _seed(size):
+        profile_ids = seed_students(size, f"{PREFIX}student-")
+        user = User.objects.create_user(f"{PREFIX}company", password=None)
+        company = Company.objects.create(user=user, name="Bench HTTP")
+        company.bookmarked_students.add(*profile_ids[:50])
+        bump_version(CANDIDATES)
+        user_ids = list(Profile.objects.filter(id__in=profile_ids[:500]).values_list("user_id", flat=True))
+        return company, user_ids
+
+    @staticmethod
+    def _session(user):
+        session = SessionStore()
+        session[SESSION_KEY] = str(user.pk)
+        session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+        session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        session.create()
+        return session.session_key
+
+    @staticmethod
+    def _paths(company, profile_user_ids):
+        page = reverse("company_profile", kwargs={"slug": company.slug})
+        search = reverse("candidate_search")
+        rng = random.Random(7)
+        paths = [
+            page,
+            f"{page}?major=computer",
+            f"{page}?tab=bookmarked",
+            f"{search}?limit=20",
+            f"{search}?major=computer&sort=completion&limit=20",
+        ]
+        paths += [
+            reverse("student_profile_view", kwargs={"user_id": uid})
+            for uid in rng.sample(profile_user_ids, min(5, len(profile_user_ids)))
+        ]
+        return paths
+
+    @staticmethod
+    def _load(base_url, cookie, paths, concurrency, total):
+        url = urlsplit(base_url)
+        counter = itertools.count()
+        headers = {"Cookie": cookie, "Host": url.netloc}
+
+        def worker():
+            latencies, errors = [], 0
+            conn = http.client.HTTPConnection(url.hostname, url.port or 80, timeout=60)
+            while (i := next(counter)) < total:
+                start = time.perf_counter()
+                try:
+                    conn.request("GET", paths[i % len(paths)], headers=headers)
+                    response = conn.getresponse()
+                    response.read()
+                    if response.status != 200:
+                        errors += 1
+                        continue
+                except (OSError, http.client.HTTPException):
+                    errors += 1
+                    conn.close()
+                    conn = http.client.HTTPConnection(url.hostname, url.port or 80, timeout=60)
+                    continue
+                latencies.append((time.perf_counter() - start) * 1000)
+            conn.close()
+            return latencies, errors
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(concurrency) as pool:
+            results = [pool.submit(worker) for _ in range(concurrency)]
+            results = [future.result() for future in results]
+        elapsed = time.perf_counter() - start
+        return [ms for part, _ in results for ms in part], sum(errors for _, errors in results), elapsed
+
+    @staticmethod
+    def _cleanup():
+        User.objects.filter(username__startswith=PREFIX).delete()
+        Skill.objects.filter(name__startswith="bench-skill-").delete()
+        Technology.objects.filter(name__startswith="bench-skill-").delete()
+        bump_version(CANDIDATES)
@@ -0,0 +1,60 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from profiles.benchmarks import measure, seed_students
+from profiles.models import Company, Position, Skill
+from profiles.ranking import get_skill_matrix, ranked_page, reset_skill_matrix, top_k
+
+
+class Command(BaseCommand):
+    help = (
+        "Position'a göre vektörel aday sıralamasını (profiles.ranking) ölçer: "
+        "matris kurulumu ve sıcak top-K. Veri geçici üretilir, transaction geri alınır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+        parser.add_argument("--k", type=int, default=20)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        k = options["k"]
+        for size in options["sizes"]:
+            with transaction.atomic():
+                seed_students(size, f"bench-rank-{size}-")
+                company = Company.objects.create(name=f"bench-rank-{size}")
+                position = Position.objects.create(company=company, title="Backend Intern")
+                skills = list(Skill.objects.filter(name__startswith="bench-skill-").order_by("id")[:6])
+                position.required_skills.set(skills[:3])
+                position.nice_to_have_skills.set(skills[3:])
+
+                reset_skill_matrix()
+                matrix, _, build_ms, build_peak = measure(get_skill_matrix)
+
+                timings = {}
+                for name, func in (
+                    ("top_k", lambda: top_k(position, k)),
+                    ("top_k_cosine", lambda: top_k(position, k, method="cosine")),
+                    ("first_page", lambda: ranked_page(position, None, k)),
+                ):
+                    samples = []
+                    for _ in range(options["repeat"]):
+                        start = time.perf_counter()
+                        func()
+                        samples.append((time.perf_counter() - start) * 1000)
+                    timings[name] = samples
+
+                self.stdout.write(
+                    f"profiles={matrix.matrix.shape[0]} skills={matrix.matrix.shape[1]} "
+                    f"nnz={matrix.matrix.nnz} build={build_ms:.0f}ms peak={build_peak / 2**20:.1f}MiB"
+                )
+                for name, samples in timings.items():
+                    self.stdout.write(
+                        f"  {name:<13} k={k} median={statistics.median(samples):.1f}ms "
+                        f"max={max(samples):.1f}ms"
+                    )
+                transaction.set_rollback(True)
+            reset_skill_matrix()
@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from profiles.benchmarks import measure, seed_students
+from profiles.cards import load_student_cards
+from profiles.search import student_queryset
+
+
+class Command(BaseCommand):
+    help = (
+        "Kart yükleyici (profiles.cards) ile eski ORM yolunu (select_related + "
+        "prefetch skills/projects) bellek ve süre açısından karşılaştırır. "
+        "Veri geçici olarak üretilir ve transaction geri alınır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+        parser.add_argument("--page-size", type=int, default=20)
+        parser.add_argument("--skills-per-profile", type=int, default=6)
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f"{'profiles':>9} {'path':<12} {'scope':<6} {'rows':>7} {'queries':>7} {'ms':>10} {'peak MiB':>9}"
+        )
+        for size in options["sizes"]:
+            with transaction.atomic():
+                seed_students(size, f"bench-card-{size}-", options["skills_per_profile"])
+                for scope, limit in (("page", options["page_size"]), ("all", None)):
+                    for name, loader in (("orm", self._legacy), ("cards", self._cards)):
+                        rows, queries, ms, peak = measure(loader, limit)
+                        self.stdout.write(
+                            f"{size:>9} {name:<12} {scope:<6} {len(rows):>7} {queries:>7} {ms:>10.1f} {peak / 2**20:>9.2f}"
+                        )
+                transaction.set_rollback(True)
+
+    # --- ölçülen yollar ---
+    def _legacy(self, limit):
+        qs = student_queryset().select_related("user").prefetch_related("skills", "projects").order_by("id")
+        profiles = list(qs[:limit] if limit else qs)
+        # Şablonun yaptığı: isim + ilk 8 skill
+        for p in profiles:
+            p.user.get_full_name()
+            list(p.skills.all()[:8])
+        return profiles
+
+    def _cards(self, limit):
+        qs = student_queryset().order_by("id")
+        return load_student_cards(qs[:limit] if limit else qs)
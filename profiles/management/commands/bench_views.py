@@ -0,0 +1,234 @@
+import json
+import platform
+import random
+import statistics
+import time
+
+import django
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from profiles.benchmarks import measure, percentile, seed_dataset
+from profiles.models import Company, Position, Profile
+from profiles.search import FILTER_KEYS
+from profiles.skill_catalog import reset_skill_catalog
+
+FAST_HASHER = "django.contrib.auth.hashers.MD5PasswordHasher"
+PASSWORD = "bench-password"
+
+# company_profile filtrelerinin örnek değerleri; FILTER_KEYS'e yeni filtre
+# eklenince burada da değer olmalı (KeyError)
+FILTER_SAMPLES = {
+    "major": "computer",
+    "skill": "bench-skill-001",
+    "project_skill": "bench-skill-002",
+    "location": "istanbul",
+    "graduation_year": "2026",
+    "internship_type": "remote",
+    "min_completion": "50",
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Ana view'ları (filtre başına company_profile, profile_detail, "
+        "student_profile_view, toggle_bookmark, login_view) birkaç veri boyutunda "
+        "tüm middleware zinciriyle süreç içinde ölçer: p50/p95 gecikme, istek "
+        "başına sorgu sayısı ve tepe bellek. --json sonuçları makinece okunur "
+        "yazar, --compare eski bir çıktıyla karşılaştırıp gerilemede hata döner. "
+        "Veri seed_dataset ile geçici olarak üretilir ve transaction geri alınır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000], help="Öğrenci sayıları")
+        parser.add_argument("--companies", type=int, default=20)
+        parser.add_argument("--repeat", type=int, default=30, help="Senaryo başına ölçülen istek")
+        parser.add_argument("--warmup", type=int, default=3)
+        parser.add_argument("--only", nargs="+", default=[], help="Yalnız bu view adları")
+        parser.add_argument("--cold-cache", action="store_true", help="Her istekten önce cache'leri temizle")
+        parser.add_argument("--real-hasher", action="store_true", help="Ayarlardaki PASSWORD_HASHERS ile ölç")
+        parser.add_argument("--label", default="", help="JSON'a yazılan çalışma adı (ör. commit)")
+        parser.add_argument("--json", dest="json_path", help="Sonuçların yazılacağı dosya")
+        parser.add_argument("--compare", help="Karşılaştırılacak eski --json çıktısı")
+        parser.add_argument("--threshold", type=float, default=50.0,
+                            help="Gerileme sayılan p50 / bellek artışı (yüzde); sorgu artışı her zaman gerilemedir")
+
+    def handle(self, *args, **options):
+        overrides = {
+            # Üretime yakın: DEBUG sorgu logu, örnekleme ve N+1 denetimi kapalı
+            "DEBUG": False,
+            "PERF_SAMPLE_RATE": 0,
+            "NPLUSONE_DETECT": False,
+            # Geri alınacak veri replikada görünmez
+            "DATABASE_REPLICAS": [],
+            "ALLOWED_HOSTS": [*settings.ALLOWED_HOSTS, "testserver"],
+        }
+        if not options["real_hasher"]:
+            overrides["PASSWORD_HASHERS"] = [FAST_HASHER]
+
+        results = []
+        self.stdout.write(
+            f"{'students':>8} {'view':<22} {'variant':<30} {'p50 ms':>8} {'p95 ms':>8} {'queries':>7} {'peak KiB':>9}"
+        )
+        with override_settings(**overrides):
+            for size in options["sizes"]:
+                with transaction.atomic():
+                    scenarios = self._scenarios(self._seed(size, options["companies"]))
+                    for view, variant, client, method, urls, data in scenarios:
+                        if options["only"] and view not in options["only"]:
+                            continue
+                        row = self._run(client, method, urls, data, options)
+                        row.update(size=size, view=view, variant=variant)
+                        results.append(row)
+                        self.stdout.write(
+                            f"{size:>8} {view:<22} {variant:<30} {row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} "
+                            f"{row['queries']:>7} {row['peak_kib']:>9.0f}"
+                        )
+                    transaction.set_rollback(True)
+
+        report = {
+            "label": options["label"],
+            "created_at": timezone.now().isoformat(),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "database": connection.vendor,
+            "repeat": options["repeat"],
+            "cold_cache": options["cold_cache"],
+            "results": results,
+        }
+        if options["json_path"]:
+            with open(options["json_path"], "w", encoding="utf-8") as fh:
+                json.dump(report, fh, indent=2, ensure_ascii=False)
+        if options["compare"]:
+            with open(options["compare"], encoding="utf-8") as fh:
+                self._compare(json.load(fh), report, options["threshold"])
+
+    # --- veri ve senaryolar ---
+    @staticmethod
+    def _seed(size, companies):
+        prefix = f"bench-views-{size}-"
+        dataset = seed_dataset(
+            size, max(companies, 1), prefix, password=make_password(PASSWORD), rng=random.Random(size)
+        )
+        dataset["prefix"] = prefix
+        return dataset
+
+    def _scenarios(self, dataset):
+        prefix = dataset["prefix"]
+        company = Company.objects.select_related("user").get(pk=dataset["company_ids"][0])
+        student = Profile.objects.select_related("user").get(pk=dataset["profile_ids"][0])
+        position = Position.objects.filter(company=company).order_by("id").first()
+        company_client, student_client = Client(), Client()
+        company_client.force_login(company.user)
+        student_client.force_login(student.user)
+
+        # Cache'lenen sayfalar tek öğrenciye takılmasın diye öğrenciler döner
+        sample = random.Random(7).sample(
+            list(zip(dataset["profile_ids"], dataset["user_ids"])), min(50, len(dataset["profile_ids"]))
+        )
+        page = reverse("company_profile", kwargs={"slug": company.slug})
+        variants = [("", "")]
+        variants += [(key, f"?{key}={FILTER_SAMPLES[key]}") for key in FILTER_KEYS]
+        variants += [
+            ("q", "?q=engineering"),
+            ("tab=bookmarked", "?tab=bookmarked"),
+            ("sort=completion", "?sort=completion"),
+            ("position", f"?position={position.pk}" if position else ""),
+            ("major+skill+sort", f"?major=computer&skill={FILTER_SAMPLES['skill']}&sort=completion"),
+        ]
+        scenarios = [
+            ("company_profile", name or "(none)", company_client, "get", [page + query], None)
+            for name, query in variants
+        ]
+        scenarios += [
+            ("profile_detail", "own", student_client, "get",
+             [reverse("profile_detail", kwargs={"username": student.user.username})], None),
+            ("student_profile_view", "company", company_client, "get",
+             [reverse("student_profile_view", kwargs={"user_id": uid}) for _, uid in sample], None),
+            # Aynı öğrenci art arda ekler / kaldırır; iki yol da ölçülür
+            ("toggle_bookmark", "add+remove", company_client, "post",
+             [reverse("toggle_bookmark", kwargs={"student_id": pid}) for pid, _ in sample for _ in (0, 1)], {}),
+            ("login_view", "student", Client(), "post", [reverse("login")],
+             {"email": f"{prefix}student-0@example.com", "password": PASSWORD, "user_type": "student"}),
+            ("login_view", "company", Client(), "post", [reverse("login")],
+             {"email": f"{prefix}company-0@example.com", "password": PASSWORD, "user_type": "company"}),
+        ]
+        return scenarios
+
+    # --- ölçüm ---
+    @staticmethod
+    def _reset_caches():
+        for alias in caches:
+            caches[alias].clear()
+        reset_skill_catalog()
+
+    def _request(self, client, method, url, data):
+        response = getattr(client, method)(url, data) if data is not None else getattr(client, method)(url)
+        if response.status_code >= 400:
+            raise CommandError(f"{method.upper()} {url}: HTTP {response.status_code}")
+        return response
+
+    def _run(self, client, method, urls, data, options):
+        cold = options["cold_cache"]
+        for i in range(options["warmup"]):
+            self._request(client, method, urls[i % len(urls)], data)
+
+        latencies = []
+        for i in range(options["repeat"]):
+            if cold:
+                self._reset_caches()
+            start = time.perf_counter()
+            self._request(client, method, urls[i % len(urls)], data)
+            latencies.append((time.perf_counter() - start) * 1000)
+        latencies.sort()
+
+        # Sorgu sayısı ve bellek ayrı bir istekte: tracemalloc süreyi şişirir
+        if cold:
+            self._reset_caches()
+        _, queries, _, peak = measure(self._request, client, method, urls[options["repeat"] % len(urls)], data)
+        return {
+            "requests": len(latencies),
+            "p50_ms": round(percentile(latencies, 0.5), 2),
+            "p95_ms": round(percentile(latencies, 0.95), 2),
+            "mean_ms": round(statistics.fmean(latencies), 2) if latencies else 0.0,
+            "queries": queries,
+            "peak_kib": round(peak / 1024, 1),
+        }
+
+    # --- karşılaştırma ---
+    def _compare(self, baseline, report, threshold):
+        before = {(r["size"], r["view"], r["variant"]): r for r in baseline["results"]}
+        limit = 1 + threshold / 100
+        regressions = []
+        self.stdout.write(
+            f"\n{baseline.get('label') or 'baseline'} -> {report['label'] or 'current'}\n"
+            f"{'students':>8} {'view':<22} {'variant':<30} {'p50 Δ%':>8} {'queries':>9} {'peak Δ%':>8}"
+        )
+        for row in report["results"]:
+            old = before.get((row["size"], row["view"], row["variant"]))
+            if old is None:
+                continue
+            p50 = (row["p50_ms"] / old["p50_ms"] - 1) * 100 if old["p50_ms"] else 0.0
+            peak = (row["peak_kib"] / old["peak_kib"] - 1) * 100 if old["peak_kib"] else 0.0
+            worse = (
+                row["queries"] > old["queries"]
+                or row["p50_ms"] > old["p50_ms"] * limit
+                or row["peak_kib"] > old["peak_kib"] * limit
+            )
+            line = (
+                f"{row['size']:>8} {row['view']:<22} {row['variant']:<30} {p50:>+8.1f} "
+                f"{old['queries']:>4}->{row['queries']:<4} {peak:>+8.1f}"
+            )
+            if worse:
+                regressions.append(line)
+                line = self.style.ERROR(line)
+            self.stdout.write(line)
+        if regressions:
+            raise CommandError(f"{len(regressions)} senaryoda gerileme (eşik %{threshold:g})")
@@ -0,0 +1,72 @@
+from contextlib import nullcontext
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from profiles.importer import FORMATS, IMPORT_BATCH_SIZE, AccountImporter, read_rows
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+class Command(BaseCommand):
+    help = (
+        "CSV / JSONL dosyasından öğrenci ve şirket hesaplarını toplu içe aktarır "
+        "(alanlar: profiles.importer). Dosya parça parça okunur; her parça tek "
+        "transaction'da bulk_create ile yazılır. Mevcut kullanıcı adları atlanır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--format", choices=FORMATS, help="Varsayılan: dosya uzantısı")
+        parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+        parser.add_argument("--encoding", default="utf-8-sig")
+        parser.add_argument(
+            "--create-skills", action="store_true",
+            help="Katalogda olmayan skill'leri oluştur (varsayılan: atla ve say)",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="Her şeyi yaz ve sonunda geri al")
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        fmt = options["format"] or path.suffix.lstrip(".").lower()
+        if fmt not in FORMATS:
+            raise CommandError(f"Format belirlenemedi: {path.name} (--format {'|'.join(FORMATS)})")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size en az 1 olmalı")
+
+        importer = AccountImporter(
+            batch_size=options["batch_size"],
+            create_skills=options["create_skills"],
+            stdout=self.stdout,
+            reset_query_log=settings.DEBUG,
+        )
+        # Normalde her parça kendi transaction'ında commit edilir
+        outer = transaction.atomic() if options["dry_run"] else nullcontext()
+        with path.open(encoding=options["encoding"], newline="") as stream, outer:
+            stats = importer.run(read_rows(stream, fmt))
+            if options["dry_run"]:
+                transaction.set_rollback(True)
+
+        for line_no, message in stats.error_samples:
+            self.stderr.write(f"line {line_no}: {message}")
+        if stats.errors > len(stats.error_samples):
+            self.stderr.write(f"... {stats.errors - len(stats.error_samples)} more errors")
+
+        summary = (
+            f"{stats.rows} rows in {stats.elapsed:.1f}s ({stats.rows_per_sec:.0f} rows/sec): "
+            f"{stats.students} students, {stats.companies} companies, {stats.skipped} skipped, "
+            f"{stats.errors} errors; {stats.skill_links} skill links, {stats.projects} projects, "
+            f"{stats.certifications} certifications, {stats.created_skills} new skills, "
+            f"{stats.unknown_skills} unknown skills"
+        )
+        if resource is not None:
+            # Linux'ta KiB
+            summary += f"; max RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MiB"
+        if options["dry_run"]:
+            summary += " (dry run, rolled back)"
+        self.stdout.write(self.style.SUCCESS(summary))
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from profiles.models import Profile
+from profiles.search import refresh_search_documents
+
+
+class Command(BaseCommand):
+    help = "Tüm profillerin arama dokümanlarını parça parça yeniden üretir."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        last_pk = 0
+        total = 0
+        while True:
+            ids = list(
+                Profile.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            total += refresh_search_documents(ids)
+            last_pk = ids[-1]
+        self.stdout.write(self.style.SUCCESS(f"{total} search documents rebuilt."))
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from profiles.result_cache import COUNTERS, reset_stats, stats
+
+
+class Command(BaseCommand):
+    help = (
+        "company_profile sonuç ve bookmark cache'lerinin isabet (hit) / ıska (miss) "
+        "sayılarını ayrı ayrı gösterir. "
+        "Sayaçlar default cache'te tutulur; LocMem kullanılıyorsa süreç başınadır, "
+        "komut sadece paylaşımlı (Redis) cache'te anlamlı sonuç verir."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reset", action="store_true", help="Sayaçları sıfırla.")
+
+    def handle(self, *args, **options):
+        for counter in COUNTERS:
+            current = stats(counter)
+            self.stdout.write(
+                f"{counter}: hits={current['hits']} misses={current['misses']} "
+                f"hit_ratio={current['hit_ratio']:.2%}"
+            )
+        if options["reset"]:
+            reset_stats()
+            self.stdout.write("Counters reset.")
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from profiles.view_analytics import (
+    HOURLY_RETENTION_DAYS,
+    ROLLUP_BATCH_SIZE,
+    RollupInProgress,
+    prune_hourly_buckets,
+    rollup_view_events,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Ham profil görüntülenme olaylarını saatlik/günlük kovalara toplar, işlenen "
+        "olayları ve eski saatlik kovaları siler. Cron ile sık çalıştırılmalıdır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=ROLLUP_BATCH_SIZE)
+        parser.add_argument(
+            "--hourly-retention-days",
+            type=int,
+            default=HOURLY_RETENTION_DAYS,
+            help="Bundan eski saatlik kovalar silinir (günlük kovalar kalır).",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            total = rollup_view_events(batch_size=options["batch_size"], stdout=self.stdout)
+        except RollupInProgress:
+            raise CommandError("Another rollup is already running.")
+        pruned = prune_hourly_buckets(options["hourly_retention_days"])
+        self.stdout.write(self.style.SUCCESS(
+            f"{total} events rolled up, {pruned} hourly buckets pruned."
+        ))
@@ -0,0 +1,48 @@
+import random
+import time
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from profiles.benchmarks import clear_dataset, seed_dataset
+
+
+class Command(BaseCommand):
+    help = (
+        "Ölçekli sentetik veri seti üretir: skill, proje ve sertifikalı N öğrenci; "
+        "pozisyonlu ve bookmark'lı M şirket. Veri kalıcıdır (yerel geliştirme / "
+        "manuel ölçüm için); --clear aynı önekli eski veriyi önce siler. Tüm "
+        "hesapların parolası --password'dür."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--students", type=int, default=10_000)
+        parser.add_argument("--companies", type=int, default=100)
+        parser.add_argument("--positions-per-company", type=int, default=3)
+        parser.add_argument("--bookmarks-per-company", type=int, default=25)
+        parser.add_argument("--prefix", default="synthetic-", help="Kullanıcı adı / slug öneki")
+        parser.add_argument("--password", default="synthetic-password")
+        parser.add_argument("--seed", type=int, default=42, help="Aynı seed aynı veri setini üretir")
+        parser.add_argument("--clear", action="store_true", help="Önekli mevcut veriyi önce sil")
+
+    def handle(self, *args, **options):
+        prefix = options["prefix"]
+        start = time.perf_counter()
+        with transaction.atomic():
+            if options["clear"]:
+                self.stdout.write(f"Silinen satır: {clear_dataset(prefix)}")
+            dataset = seed_dataset(
+                options["students"],
+                options["companies"],
+                prefix,
+                positions_per_company=options["positions_per_company"],
+                bookmarks_per_company=options["bookmarks_per_company"],
+                password=make_password(options["password"]),
+                rng=random.Random(options["seed"]),
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(dataset['profile_ids'])} öğrenci, {len(dataset['company_ids'])} şirket "
+            f"({time.perf_counter() - start:.1f} s). Giriş: {prefix}student-0@example.com / "
+            f"{prefix}company-0@example.com"
+        ))
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.4 on 2026-10-17 02:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0006_company_contact_email_company_is_verified_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProfileSearchDocument',
+            fields=[
+                ('profile', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='profiles.profile')),
+                ('skills_text', models.TextField(blank=True, default='')),
+                ('technologies_text', models.TextField(blank=True, default='')),
+                ('document', models.TextField(blank=True, default='')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,90 @@
+from django.db import migrations
+
+FTS_TABLE = "profiles_search_fts"
+DOC_TABLE = "profiles_profilesearchdocument"
+MYSQL_FULLTEXT_INDEX = "profiles_search_document_ft"
+
+SQLITE_FORWARD = [
+    f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+    f"document, content='{DOC_TABLE}', content_rowid='profile_id')",
+    f"CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON {DOC_TABLE} BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, document) VALUES (new.profile_id, new.document); END",
+    f"CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON {DOC_TABLE} BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, document) VALUES ('delete', old.profile_id, old.document); END",
+    f"CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE ON {DOC_TABLE} BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, document) VALUES ('delete', old.profile_id, old.document); "
+    f"INSERT INTO {FTS_TABLE}(rowid, document) VALUES (new.profile_id, new.document); END",
+]
+SQLITE_BACKWARD = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "mysql":
+        schema_editor.execute(
+            f"ALTER TABLE {DOC_TABLE} ADD FULLTEXT INDEX {MYSQL_FULLTEXT_INDEX} (document)"
+        )
+    elif vendor == "sqlite":
+        for sql in SQLITE_FORWARD:
+            schema_editor.execute(sql)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "mysql":
+        schema_editor.execute(f"ALTER TABLE {DOC_TABLE} DROP INDEX {MYSQL_FULLTEXT_INDEX}")
+    elif vendor == "sqlite":
+        for sql in SQLITE_BACKWARD:
+            schema_editor.execute(sql)
+
+
+def backfill_documents(apps, schema_editor):
+    from profiles.search import build_document_fields
+
+    Profile = apps.get_model("profiles", "Profile")
+    ProfileSearchDocument = apps.get_model("profiles", "ProfileSearchDocument")
+
+    batch_size = 500
+    last_pk = 0
+    while True:
+        batch = list(
+            Profile.objects.filter(pk__gt=last_pk)
+            .order_by("pk")
+            .select_related("user")
+            .prefetch_related("skills", "projects")[:batch_size]
+        )
+        if not batch:
+            break
+        docs = []
+        for profile in batch:
+            user = profile.user
+            fields = build_document_fields(
+                f"{user.first_name} {user.last_name}".strip(),
+                user.username,
+                profile.university,
+                profile.major,
+                profile.location,
+                profile.bio,
+                [s.name for s in profile.skills.all()],
+                [(p.title, p.technologies) for p in profile.projects.all()],
+            )
+            docs.append(ProfileSearchDocument(profile_id=profile.pk, **fields))
+        ProfileSearchDocument.objects.bulk_create(docs)
+        last_pk = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0007_profilesearchdocument'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+        migrations.RunPython(backfill_documents, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-17 02:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0008_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='position',
+            name='nice_to_have_skills',
+            field=models.ManyToManyField(blank=True, related_name='nice_to_have_for_positions', to='profiles.skill'),
+        ),
+        migrations.AddField(
+            model_name='position',
+            name='required_skills',
+            field=models.ManyToManyField(blank=True, related_name='required_by_positions', to='profiles.skill'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.4 on 2026-10-17 02:29
+
+from django.db import migrations, models
+
+
+def backfill_technologies(apps, schema_editor):
+    from profiles.backfill import backfill_project_technologies
+
+    backfill_project_technologies(
+        apps.get_model("profiles", "Project"),
+        apps.get_model("profiles", "Technology"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0009_position_skills'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Technology',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='technology_tags',
+            field=models.ManyToManyField(blank=True, related_name='projects', to='profiles.technology'),
+        ),
+        migrations.RunPython(backfill_technologies, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.4 on 2026-10-17 02:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0010_technology'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProfileViewEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('viewed_at', models.DateTimeField(db_index=True)),
+                ('company', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='profiles.company')),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='view_events', to='profiles.profile')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ProfileViewDaily',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('views', models.PositiveIntegerField(default=0)),
+                ('company_views', models.PositiveIntegerField(default=0)),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_views', to='profiles.profile')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('profile', 'day'), name='profiles_view_daily_day_uniq')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProfileViewHourly',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bucket', models.DateTimeField()),
+                ('views', models.PositiveIntegerField(default=0)),
+                ('company_views', models.PositiveIntegerField(default=0)),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='hourly_views', to='profiles.profile')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('profile', 'bucket'), name='profiles_view_hourly_bucket_uniq')],
+            },
+        ),
+    ]
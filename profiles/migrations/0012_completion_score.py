@@ -0,0 +1,34 @@
+# Generated by Django 5.2.4 on 2026-10-17 02:39
+
+from django.db import migrations, models
+
+
+def backfill_completion(apps, schema_editor):
+    from profiles.backfill import backfill_completion_scores
+
+    backfill_completion_scores(
+        apps.get_model("profiles", "Profile"),
+        apps.get_model("profiles", "Company"),
+        apps.get_model("profiles", "Position"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0011_profile_view_analytics'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='company',
+            name='completion_score',
+            field=models.PositiveSmallIntegerField(db_index=True, default=0),
+        ),
+        migrations.AddField(
+            model_name='profile',
+            name='completion_score',
+            field=models.PositiveSmallIntegerField(db_index=True, default=0),
+        ),
+        migrations.RunPython(backfill_completion, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.4 on 2026-10-17 03:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_dashboards(apps, schema_editor):
+    from profiles.backfill import backfill_company_dashboards
+
+    backfill_company_dashboards(
+        apps.get_model("profiles", "Company"),
+        apps.get_model("profiles", "CompanyDashboard"),
+        apps.get_model("profiles", "Position"),
+        apps.get_model("profiles", "Bookmark"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0013_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CompanyDashboard',
+            fields=[
+                ('company', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='dashboard', serialize=False, to='profiles.company')),
+                ('open_positions', models.PositiveIntegerField(default=0)),
+                ('bookmarks', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(backfill_dashboards, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.4 on 2026-10-17 04:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0014_company_dashboard'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProfileSearchIndex',
+            fields=[
+                ('profile', models.OneToOneField(db_column='rowid', db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='search_index', serialize=False, to='profiles.profile')),
+                ('match', models.TextField(db_column='profiles_search_fts')),
+            ],
+            options={
+                'db_table': 'profiles_search_fts',
+                'managed': False,
+            },
+        ),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations
+
+
+def backfill_technologies(apps, schema_editor):
+    # Çok kelimeli adların kelimeleri de etiket olur (Technology.tokenize)
+    from profiles.backfill import backfill_project_technologies
+
+    backfill_project_technologies(
+        apps.get_model("profiles", "Project"),
+        apps.get_model("profiles", "Technology"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0015_search_index_model'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_technologies, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,12 @@
 # profiles/models.py
+import re
+
 from django.db import models
 from django.contrib.auth.models import User
-from django.utils.text import slugify
+
+from .slugs import save_with_unique_slug, slug_base
+
+_TECH_SPLIT_RE = re.compile(r"[,;/|\n]+")
 
 
 class Skill(models.Model):
@@ -37,6 +42,14 @@ class Profile(models.Model):
     # Görüntülenme sayacı
     profile_views = models.PositiveIntegerField(default=0)
 
+    # Profil tamamlanma yüzdesi (profiles.completion; sinyallerle güncellenir)
+    completion_score = models.PositiveSmallIntegerField(default=0, db_index=True)
+
+    # Herkese açık profilde görünen her değişiklikte ilerler (skill, proje,
+    # sertifika ve kullanıcı adı değişiklikleri sinyallerle "touch" eder);
+    # student_profile_view ETag / Last-Modified ve fragment cache anahtarı
+    updated_at = models.DateTimeField(auto_now=True)
+
     class Meta:
         ordering = ["user__username"]
 
@@ -44,6 +57,77 @@ class Profile(models.Model):
         return f"{self.user.username}'s Profile"
 
 
+class ProfileSearchDocument(models.Model):
+    """Profile için aranabilir metin (profiles.search tarafından güncellenir)."""
+
+    profile = models.OneToOneField(
+        Profile, on_delete=models.CASCADE, primary_key=True, related_name="search_document"
+    )
+    skills_text = models.TextField(blank=True, default="")
+    technologies_text = models.TextField(blank=True, default="")
+    document = models.TextField(blank=True, default="")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Search document #{self.profile_id}"
+
+
+class ProfileSearchIndex(models.Model):
+    """
+    SQLite FTS5 sanal tablosu (migration 0008) için yönetilmeyen model; rowid
+    profil id'sidir. Yalnız arama sorgusunun tek join'i için vardır: ``match``
+    FTS5'in tablo adıyla aynı gizli kolonudur (MATCH ve bm25 bunu alır).
+    """
+
+    profile = models.OneToOneField(
+        Profile, on_delete=models.DO_NOTHING, primary_key=True, db_column="rowid",
+        db_constraint=False, related_name="search_index",
+    )
+    match = models.TextField(db_column="profiles_search_fts")
+
+    class Meta:
+        managed = False
+        db_table = "profiles_search_fts"
+
+
+class Technology(models.Model):
+    """Project.technologies alanından çıkarılan normalize (küçük harf) token."""
+
+    name = models.CharField(max_length=100, unique=True)
+
+    class Meta:
+        ordering = ["name"]
+
+    def __str__(self):
+        return self.name
+
+    @staticmethod
+    def phrases(text) -> list[str]:
+        """'Python, Django / React Native' -> ['python', 'django', 'react native']"""
+        phrases = []
+        for part in _TECH_SPLIT_RE.split(text or ""):
+            phrase = " ".join(part.split()).lower()[:100]
+            if phrase and phrase not in phrases:
+                phrases.append(phrase)
+        return phrases
+
+    @staticmethod
+    def tokenize(text) -> list[str]:
+        """
+        Ayraçla bölünmüş adlar ve çok kelimeli adların kelimeleri:
+        'Python Django, React Native' -> ['python django', 'python', 'django',
+        'react native', 'react', 'native']. Alan serbest metindir; ayraçsız
+        yazılmış listeler de kelime kelime bulunur.
+        """
+        tokens = []
+        for phrase in Technology.phrases(text):
+            words = phrase.split()
+            for token in [phrase, *words] if len(words) > 1 else [phrase]:
+                if token not in tokens:
+                    tokens.append(token)
+        return tokens
+
+
 class Project(models.Model):
     profile = models.ForeignKey(
         Profile, on_delete=models.CASCADE, related_name="projects"
@@ -53,12 +137,29 @@ class Project(models.Model):
     technologies = models.CharField(max_length=255, blank=True)
     link = models.URLField(blank=True, null=True)
 
+    # technologies alanının tokenize edilmiş hali (save'de güncellenir)
+    technology_tags = models.ManyToManyField(Technology, blank=True, related_name="projects")
+
+    updated_at = models.DateTimeField(auto_now=True)
+
     class Meta:
         ordering = ["-id"]
 
     def __str__(self):
         return f"{self.title} - {self.profile.user.username}"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "technologies" in update_fields:
+            self.sync_technologies()
+
+    def sync_technologies(self):
+        names = Technology.tokenize(self.technologies)
+        if names:
+            Technology.objects.bulk_create([Technology(name=n) for n in names], ignore_conflicts=True)
+        self.technology_tags.set(Technology.objects.filter(name__in=names))
+
 
 class Certification(models.Model):
     profile = models.ForeignKey(
@@ -69,6 +170,8 @@ class Certification(models.Model):
     date_obtained = models.DateField()
     certificate_url = models.URLField(blank=True, null=True)
 
+    updated_at = models.DateTimeField(auto_now=True)
+
     class Meta:
         ordering = ["-date_obtained", "name"]
 
@@ -99,6 +202,9 @@ class Company(models.Model):
     verification_expires_at = models.DateTimeField(blank=True, null=True)
     verified_at = models.DateTimeField(blank=True, null=True)
 
+    # Profil tamamlanma yüzdesi (profiles.completion; sinyallerle güncellenir)
+    completion_score = models.PositiveSmallIntegerField(default=0, db_index=True)
+
     # Öğrenci bookmark ilişkisi (through ile)
     bookmarked_students = models.ManyToManyField(
         Profile,
@@ -118,15 +224,11 @@ class Company(models.Model):
         return self.name
 
     def save(self, *args, **kwargs):
-        if not self.slug:
-            base = slugify(self.name or (self.user.username if self.user else "company")) or "company"
-            slug = base
-            i = 2
-            while Company.objects.filter(slug=slug).exclude(pk=self.pk).exists():
-                slug = f"{base}-{i}"
-                i += 1
-            self.slug = slug
-        super().save(*args, **kwargs)
+        if self.slug:
+            super().save(*args, **kwargs)
+            return
+        base = slug_base(self.name, self.user.username if self.user_id else "")
+        save_with_unique_slug(self, base, lambda: super(Company, self).save(*args, **kwargs))
 
 
 class Position(models.Model):
@@ -137,6 +239,14 @@ class Position(models.Model):
     description = models.TextField(blank=True, null=True)
     link = models.URLField(blank=True, null=True)
 
+    # Aday sıralaması (profiles.ranking) için yapılandırılmış beceriler
+    required_skills = models.ManyToManyField(
+        Skill, blank=True, related_name="required_by_positions"
+    )
+    nice_to_have_skills = models.ManyToManyField(
+        Skill, blank=True, related_name="nice_to_have_for_positions"
+    )
+
     class Meta:
         ordering = ["-id"]
 
@@ -160,3 +270,57 @@ class Bookmark(models.Model):
 
     def __str__(self):
         return f"{self.company.name} ↔ {self.profile.user.username}"
+
+
+class CompanyDashboard(models.Model):
+    """
+    company_profile başlığındaki sayaçlar (profiles.dashboard). Position ve
+    Bookmark değişikliklerinde aynı transaction'da yeniden sayılır; sayfa
+    bunları Company ile tek sorguda (select_related) okur.
+    """
+
+    company = models.OneToOneField(
+        Company, on_delete=models.CASCADE, primary_key=True, related_name="dashboard"
+    )
+    open_positions = models.PositiveIntegerField(default=0)
+    bookmarks = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Dashboard #{self.company_id}"
+
+
+# ---------------------------------
+# Profil görüntülenme analitiği (profiles.view_analytics)
+# ---------------------------------
+class ProfileViewEvent(models.Model):
+    """Ham görüntülenme olayı; rollup_profile_views ile kovalara toplanıp silinir."""
+    profile = models.ForeignKey(Profile, on_delete=models.CASCADE, related_name="view_events")
+    company = models.ForeignKey(
+        Company, on_delete=models.SET_NULL, null=True, blank=True, related_name="+"
+    )
+    viewed_at = models.DateTimeField(db_index=True)
+
+
+class ProfileViewHourly(models.Model):
+    profile = models.ForeignKey(Profile, on_delete=models.CASCADE, related_name="hourly_views")
+    bucket = models.DateTimeField()  # saat başı
+    views = models.PositiveIntegerField(default=0)
+    company_views = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["profile", "bucket"], name="profiles_view_hourly_bucket_uniq"),
+        ]
+
+
+class ProfileViewDaily(models.Model):
+    profile = models.ForeignKey(Profile, on_delete=models.CASCADE, related_name="daily_views")
+    day = models.DateField()
+    views = models.PositiveIntegerField(default=0)
+    company_views = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["profile", "day"], name="profiles_view_daily_day_uniq"),
+        ]
@@ -0,0 +1,71 @@
+# profiles/pagination.py
+"""
+Keyset (cursor) sayfalama.
+
+OFFSET yerine son görülen satırın sıralama anahtarından devam edilir; her
+sayfa aynı maliyette kalır. Cursor, sıralama alanlarının değerlerini taşıyan
+base64 JSON'dur.
+"""
+import base64
+import json
+
+from django.db.models import Q
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(values) -> str:
+    raw = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str, size: int) -> list:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursor(token) from exc
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursor(token)
+    # Sıralama anahtarları sayısaldır (id, puan, skor); elle değiştirilmiş
+    # cursor'daki metin / nesne filtreye girip 500'e yol açmasın
+    if not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+        raise InvalidCursor(token)
+    return values
+
+
+def _after(ordering, values) -> Q:
+    """(a, b, c) > (va, vb, vc) koşulunu sıralama yönlerine göre kurar."""
+    condition = Q()
+    equal = Q()
+    for field, value in zip(ordering, values):
+        name = field.lstrip("-")
+        lookup = "lt" if field.startswith("-") else "gt"
+        condition |= equal & Q(**{f"{name}__{lookup}": value})
+        equal &= Q(**{name: value})
+    return condition
+
+
+def _value(item, name):
+    return item[name] if isinstance(item, dict) else getattr(item, name)
+
+
+def keyset_page(qs, ordering, cursor: str | None, page_size: int):
+    """
+    ``ordering`` benzersiz bir anahtarla bitmeli (ör. ``["-search_rank", "id"]``).
+    Model ve ``values()`` querysetleriyle çalışır. (items, next_cursor) döner;
+    son sayfada next_cursor None'dır.
+    """
+    qs = qs.order_by(*ordering)
+    if cursor:
+        qs = qs.filter(_after(ordering, decode_cursor(cursor, len(ordering))))
+
+    items = list(qs[: page_size + 1])
+    next_cursor = None
+    if len(items) > page_size:
+        items = items[:page_size]
+        last = items[-1]
+        next_cursor = encode_cursor(_value(last, field.lstrip("-")) for field in ordering)
+    return items, next_cursor
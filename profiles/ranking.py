@@ -0,0 +1,239 @@
+# profiles/ranking.py
+"""
+Position'a göre aday sıralama.
+
+Öğrenci profilleri × skill seyrek matrisi (scipy.sparse CSR) bir kere kurulur
+ve süreç içinde tutulur:
+
+* ``Profile.skills`` ilişkisi  -> 1.0
+* Projelerin Technology etiketlerinden adı bir skill ile eşleşen -> 0.5
+  (hücre 1.0'ı aşmaz)
+
+Position için ağırlık vektörü (zorunlu skill'ler REQUIRED_WEIGHT, tercih
+edilenler NICE_TO_HAVE_WEIGHT) ile tek bir matris-vektör çarpımı tüm
+adayları puanlar. Matris, aday verisi sürümü (profiles.versioning)
+değişince ya da MATRIX_MAX_AGE saniye dolunca yeniden kurulur.
+
+Yeniden kurulum istek yolunda yapılmaz: bayat matris sunulmaya devam eder,
+yenisi arka plan thread'inde kurulup hazır olunca atomik olarak yerine
+konur. Sinyaller her profil kaydında sürümü artırdığından kurulumlar en az
+MATRIX_MIN_REBUILD_INTERVAL saniye arayla başlar. Senkron kurulum yalnız
+süreçteki ilk matris için ve açık bir transaction içindeyken (başka
+bağlantı bu transaction'ın verisini göremez: testler, bench komutları)
+yapılır.
+"""
+import threading
+import time
+
+import numpy as np
+from django.db import connection, connections
+from scipy import sparse
+
+from .models import Profile, Project, Skill
+from .pagination import decode_cursor, encode_cursor
+from .search import student_queryset
+from .versioning import CANDIDATES, get_version
+
+REQUIRED_WEIGHT = 2.0
+NICE_TO_HAVE_WEIGHT = 1.0
+PROFILE_SKILL_WEIGHT = 1.0
+PROJECT_TECH_WEIGHT = 0.5
+
+# Çok süreçli kurulumda lokal cache sürüm artışını görmese de matris bayatlamaz
+MATRIX_MAX_AGE = 300
+MATRIX_MIN_REBUILD_INTERVAL = 30
+
+METHODS = ("overlap", "cosine")
+
+
+class SkillMatrix:
+    """Satırlar: profile id'leri (artan), kolonlar: skill id'leri (artan)."""
+
+    def __init__(self, profile_ids, skill_ids, matrix):
+        self.profile_ids = profile_ids
+        self.skill_ids = skill_ids
+        self.matrix = matrix
+        self.row_norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+
+    @classmethod
+    def build(cls):
+        profile_ids = np.fromiter(
+            student_queryset().order_by("id").values_list("id", flat=True).iterator(chunk_size=10_000),
+            dtype=np.int64,
+        )
+
+        Through = Profile.skills.through
+        pairs = np.array(
+            list(Through.objects.values_list("profile_id", "skill_id").iterator(chunk_size=10_000)),
+            dtype=np.int64,
+        ).reshape(-1, 2)
+
+        skill_by_name = {name.lower(): pk for pk, name in Skill.objects.values_list("id", "name")}
+        tech_pairs = []
+        for profile_id, technology in (
+            Project.technology_tags.through.objects
+            .values_list("project__profile_id", "technology__name")
+            .iterator(chunk_size=10_000)
+        ):
+            skill_id = skill_by_name.get(technology)
+            if skill_id is not None:
+                tech_pairs.append((profile_id, skill_id))
+        tech_pairs = np.array(tech_pairs, dtype=np.int64).reshape(-1, 2)
+
+        rows = np.concatenate([pairs[:, 0], tech_pairs[:, 0]])
+        cols = np.concatenate([pairs[:, 1], tech_pairs[:, 1]])
+        data = np.concatenate([
+            np.full(len(pairs), PROFILE_SKILL_WEIGHT),
+            np.full(len(tech_pairs), PROJECT_TECH_WEIGHT),
+        ])
+
+        # Öğrenci olmayan (şirket kullanıcısı) profiller düşülür
+        row_idx = np.searchsorted(profile_ids, rows)
+        row_idx = np.minimum(row_idx, max(len(profile_ids) - 1, 0))
+        keep = (profile_ids[row_idx] == rows) if len(profile_ids) else np.zeros(len(rows), dtype=bool)
+        skill_ids, col_idx = np.unique(cols[keep], return_inverse=True)
+
+        matrix = sparse.csr_matrix(
+            (data[keep], (row_idx[keep], col_idx)),
+            shape=(len(profile_ids), len(skill_ids)),
+        )
+        # Aynı hücreye gelen kanıtlar toplanır, 1.0 ile sınırlanır
+        matrix.data = np.minimum(matrix.data, PROFILE_SKILL_WEIGHT)
+        return cls(profile_ids, skill_ids, matrix)
+
+    def weight_vector(self, required_ids, nice_ids):
+        """(kolon vektörü, toplam ağırlık); matriste olmayan skill'ler de paydaya girer."""
+        weights = {}
+        for skill_id in nice_ids:
+            weights[skill_id] = NICE_TO_HAVE_WEIGHT
+        for skill_id in required_ids:
+            weights[skill_id] = REQUIRED_WEIGHT
+
+        vector = np.zeros(len(self.skill_ids))
+        if weights:
+            ids = np.fromiter(weights.keys(), dtype=np.int64)
+            vals = np.fromiter(weights.values(), dtype=np.float64)
+            pos = np.searchsorted(self.skill_ids, ids)
+            pos = np.minimum(pos, max(len(self.skill_ids) - 1, 0))
+            present = (self.skill_ids[pos] == ids) if len(self.skill_ids) else np.zeros(len(ids), dtype=bool)
+            vector[pos[present]] = vals[present]
+        return vector, float(sum(weights.values()))
+
+    def score(self, required_ids, nice_ids, method: str = "overlap"):
+        """Tüm satırlar için [0, 1] aralığında puan dizisi."""
+        vector, total = self.weight_vector(required_ids, nice_ids)
+        if not total:
+            return np.zeros(len(self.profile_ids))
+        raw = self.matrix @ vector
+        if method == "cosine":
+            denom = self.row_norms * np.linalg.norm(vector)
+            return np.divide(raw, denom, out=np.zeros_like(raw), where=denom > 0)
+        return raw / total
+
+
+# ---------------------------------
+# Süreç içi matris cache'i
+# ---------------------------------
+_lock = threading.Lock()
+_state = {"matrix": None, "version": None, "built_at": 0.0, "rebuilding": False}
+
+
+def _is_fresh(state, version) -> bool:
+    return state["version"] == version and time.monotonic() - state["built_at"] < MATRIX_MAX_AGE
+
+
+def _in_transaction() -> bool:
+    return connection.in_atomic_block
+
+
+def get_skill_matrix() -> SkillMatrix:
+    version = get_version(CANDIDATES)
+    state = _state
+    matrix = state["matrix"]
+    if matrix is not None and _is_fresh(state, version):
+        return matrix
+    if matrix is not None and not _in_transaction():
+        _schedule_rebuild(version)
+        return matrix
+    with _lock:
+        if state["matrix"] is None or not _is_fresh(state, version):
+            state.update(matrix=SkillMatrix.build(), version=version, built_at=time.monotonic())
+        return state["matrix"]
+
+
+def _schedule_rebuild(version) -> None:
+    with _lock:
+        if _state["rebuilding"] or time.monotonic() - _state["built_at"] < MATRIX_MIN_REBUILD_INTERVAL:
+            return
+        _state["rebuilding"] = True
+    threading.Thread(target=_rebuild, args=(version,), name="skill-matrix-rebuild", daemon=True).start()
+
+
+def _rebuild(version) -> None:
+    # Kurulum sırasında sürüm yine artarsa bir sonraki istek yeni kurulum başlatır
+    try:
+        matrix = SkillMatrix.build()
+        with _lock:
+            _state.update(matrix=matrix, version=version, built_at=time.monotonic())
+    finally:
+        with _lock:
+            _state["rebuilding"] = False
+        connections.close_all()
+
+
+def reset_skill_matrix() -> None:
+    with _lock:
+        _state.update(matrix=None, version=None, built_at=0.0)
+
+
+def position_skill_ids(position):
+    required = list(position.required_skills.values_list("id", flat=True))
+    nice = list(position.nice_to_have_skills.values_list("id", flat=True))
+    return required, nice
+
+
+def _scored(position, candidate_ids, method):
+    matrix = get_skill_matrix()
+    required, nice = position_skill_ids(position)
+    scores = matrix.score(required, nice, method)
+    ids = matrix.profile_ids
+    if candidate_ids is not None:
+        mask = np.isin(ids, np.fromiter(candidate_ids, dtype=np.int64))
+        ids, scores = ids[mask], scores[mask]
+    return ids, scores
+
+
+def rank_candidates(position, candidate_ids=None, method: str = "overlap"):
+    """
+    (profile_ids, scores) -> puana göre azalan, eşitlikte id'ye göre artan.
+    ``candidate_ids`` verilirse sadece o profiller (ör. filtre sonucu) sıralanır.
+    """
+    ids, scores = _scored(position, candidate_ids, method)
+    order = np.lexsort((ids, -scores))
+    return ids[order], scores[order]
+
+
+def top_k(position, k: int = 20, candidate_ids=None, method: str = "overlap"):
+    """En yüksek puanlı ``k`` aday (tam sıralama yerine argpartition): [(profile_id, score), ...]"""
+    ids, scores = _scored(position, candidate_ids, method)
+    if k < len(scores):
+        part = np.argpartition(-scores, k)[:k]
+        ids, scores = ids[part], scores[part]
+    order = np.lexsort((ids, -scores))
+    return [(int(i), float(s)) for i, s in zip(ids[order], scores[order])]
+
+
+def ranked_page(position, cursor, page_size: int, candidate_ids=None, method: str = "overlap"):
+    """Keyset sayfası: ([(profile_id, score), ...], next_cursor); cursor = (score, id)."""
+    ids, scores = rank_candidates(position, candidate_ids, method)
+    if cursor:
+        last_score, last_id = decode_cursor(cursor, 2)
+        after = (scores < last_score) | ((scores == last_score) & (ids > last_id))
+        ids, scores = ids[after], scores[after]
+
+    items = [(int(i), float(s)) for i, s in zip(ids[: page_size + 1], scores[: page_size + 1])]
+    next_cursor = None
+    if len(items) > page_size:
+        items = items[:page_size]
+        next_cursor = encode_cursor([items[-1][1], items[-1][0]])
+    return items, next_cursor
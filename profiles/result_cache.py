@@ -0,0 +1,118 @@
+# profiles/result_cache.py
+"""
+company_profile sonuç ID cache'i.
+
+Filtrelenmiş öğrenci listesinin sıralı id'leri (``q`` varsa alaka puanlarıyla
+birlikte) normalize edilmiş GET parametreleriyle anahtarlanıp
+``candidate_results`` cache'inde tutulur (TTL + LRU tahliye: LocMem
+MAX_ENTRIES ya da Redis maxmemory-policy). Anahtar aday verisi sürümünü
+içerir; Profile/Project/skill değişiklikleri eski girdileri erişilmez kılar.
+Bookmark id kümesi (bookmark sekmesi ve sayfadaki bookmark durumu) şirket
+başına ayrı bir sürümle anahtarlanır. İki cache'in hit/miss sayaçları
+ayrıdır; bookmark okumaları sonuç cache'inin oranını şişirmez.
+"""
+from django.core.cache import cache, caches
+
+from .facets import filters_digest
+from .models import Bookmark
+from .versioning import CANDIDATES, get_version
+
+RESULT_CACHE_ALIAS = "candidate_results"
+
+# Bundan büyük sonuçlar cache'lenmez (DB keyset yoluna düşülür)
+MAX_CACHED_IDS = 20_000
+
+TOO_LARGE = "too-large"
+
+# Sayaç grupları
+RESULTS = "results"
+BOOKMARKS = "bookmarks"
+COUNTERS = (RESULTS, BOOKMARKS)
+
+
+def results_cache():
+    return caches[RESULT_CACHE_ALIAS]
+
+
+def bookmarks_version_name(company_id) -> str:
+    return f"bookmarks:{company_id}"
+
+
+# ---------------------------------
+# Metrikler
+# ---------------------------------
+def _counter_keys(counter):
+    # Sonuç sayaçlarının eski anahtarları korunur
+    prefix = "profiles:result_cache" if counter == RESULTS else f"profiles:result_cache:{counter}"
+    return f"{prefix}:hits", f"{prefix}:misses"
+
+
+def _count(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+
+def stats(counter=RESULTS) -> dict:
+    hits_key, misses_key = _counter_keys(counter)
+    hits = cache.get(hits_key, 0)
+    misses = cache.get(misses_key, 0)
+    lookups = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": (hits / lookups) if lookups else 0.0,
+    }
+
+
+def reset_stats() -> None:
+    cache.delete_many([key for counter in COUNTERS for key in _counter_keys(counter)])
+
+
+def _get_or_compute(key, compute, counter):
+    hits_key, misses_key = _counter_keys(counter)
+    store = results_cache()
+    value = store.get(key)
+    if value is not None:
+        _count(hits_key)
+        return value
+    _count(misses_key)
+    value = compute()
+    store.set(key, value)
+    return value
+
+
+# ---------------------------------
+# Sonuç id'leri
+# ---------------------------------
+def result_key(filters: dict, sort: str = "") -> str:
+    return f"profiles:results:v{get_version(CANDIDATES)}:all:{sort or 'default'}:{filters_digest(filters)}"
+
+
+def cached_result(filters: dict, compute, sort: str = ""):
+    """
+    "All" sekmesi için ``compute(limit)`` -> sıralı [(id, rank), ...]
+    (``limit`` = MAX_CACHED_IDS + 1). (ids, ranks) döner; sonuç çok büyükse
+    TOO_LARGE saklanır ve None döner. ``sort`` farklı sıralamaları ayrı
+    anahtarlarda tutar.
+    """
+    def _compute():
+        rows = compute(MAX_CACHED_IDS + 1)
+        if len(rows) > MAX_CACHED_IDS:
+            return TOO_LARGE
+        return (tuple(row[0] for row in rows), tuple(row[1] for row in rows))
+
+    value = _get_or_compute(result_key(filters, sort), _compute, RESULTS)
+    return None if value == TOO_LARGE else value
+
+
+def bookmarked_profile_ids(company_id) -> frozenset:
+    """Şirketin bookmark'ladığı profil id'leri; bookmark sekmesi de buradan sayfalanır."""
+    key = f"profiles:bookmarked-ids:{company_id}:b{get_version(bookmarks_version_name(company_id))}"
+    return _get_or_compute(
+        key,
+        lambda: frozenset(Bookmark.objects.filter(company_id=company_id).values_list("profile_id", flat=True)),
+        BOOKMARKS,
+    )
@@ -0,0 +1,265 @@
+# profiles/search.py
+"""
+Aday arama altyapısı.
+
+Her Profile için bir ProfileSearchDocument tutulur (isim, bölüm, üniversite,
+lokasyon, bio, skill isimleri, proje başlıkları ve teknolojileri). MySQL'de
+``document`` kolonu üzerinde FULLTEXT index, SQLite'ta (lokal) aynı tabloya
+bağlı bir FTS5 sanal tablosu kullanılır. Diğer veritabanlarında icontains'e
+düşülür.
+"""
+import re
+
+from django.db import NotSupportedError, connection
+from django.db.models import Exists, F, FloatField, Func, Lookup, OuterRef, Value
+
+from .models import Profile, ProfileSearchDocument, ProfileSearchIndex, Project, Technology
+
+MYSQL_FULLTEXT_INDEX = "profiles_search_document_ft"
+
+# InnoDB varsayılan innodb_ft_min_token_size = 3
+MYSQL_MIN_TOKEN_LEN = 3
+MAX_QUERY_TERMS = 10
+
+FILTER_KEYS = (
+    "major", "skill", "project_skill", "location", "graduation_year", "internship_type", "min_completion",
+)
+
+# company_profile sıralama seçenekleri: "" (varsayılan: id / arama alakası), "completion"
+SORT_COMPLETION = "completion"
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+# ---------------------------------
+# Doküman üretimi
+# ---------------------------------
+def build_document_fields(full_name, username, university, major, location, bio,
+                          skill_names, projects) -> dict:
+    """
+    Saf fonksiyon: alan değerlerinden doküman kolonlarını üretir.
+    ``projects`` -> (title, technologies) çiftleri. Migration'lar da kullanır.
+    """
+    skill_names = [n for n in skill_names if n]
+    technologies = [tech for _, tech in projects if tech]
+    titles = [title for title, _ in projects if title]
+
+    parts = [full_name, username, university, major, location, bio]
+    parts.extend(skill_names)
+    parts.extend(titles)
+    parts.extend(technologies)
+    return {
+        "skills_text": "\n".join(skill_names),
+        "technologies_text": "\n".join(technologies),
+        "document": "\n".join(p for p in parts if p),
+    }
+
+
+def refresh_search_documents(profile_ids) -> int:
+    """Verilen profillerin arama dokümanlarını yeniden yazar (sabit sayıda sorgu)."""
+    profile_ids = list(set(profile_ids))
+    if not profile_ids:
+        return 0
+
+    profiles = (
+        Profile.objects.filter(pk__in=profile_ids)
+        .select_related("user")
+        .prefetch_related("skills", "projects")
+    )
+    docs = []
+    for profile in profiles:
+        fields = build_document_fields(
+            profile.user.get_full_name(),
+            profile.user.username,
+            profile.university,
+            profile.major,
+            profile.location,
+            profile.bio,
+            [s.name for s in profile.skills.all()],
+            [(p.title, p.technologies) for p in profile.projects.all()],
+        )
+        docs.append(ProfileSearchDocument(profile_id=profile.pk, **fields))
+
+    # MySQL ON DUPLICATE KEY UPDATE hedef kolon kabul etmez
+    unique_fields = ["profile"] if connection.features.supports_update_conflicts_with_target else None
+    ProfileSearchDocument.objects.bulk_create(
+        docs,
+        update_conflicts=True,
+        unique_fields=unique_fields,
+        update_fields=["skills_text", "technologies_text", "document", "updated_at"],
+    )
+    return len(docs)
+
+
+def refresh_search_document(profile_id) -> None:
+    refresh_search_documents([profile_id])
+
+
+# ---------------------------------
+# Sorgu
+# ---------------------------------
+def tokenize(query: str) -> list[str]:
+    return _TOKEN_RE.findall((query or "").lower())[:MAX_QUERY_TERMS]
+
+
+def _mysql_boolean_query(terms):
+    return " ".join(f"+{t}*" for t in terms)
+
+
+def _fts5_query(terms):
+    # \w+ token'larında tırnak olamaz; her terim prefix eşleşmesi
+    return " ".join(f'"{t}"*' for t in terms)
+
+
+class FullTextMatch(Lookup):
+    """
+    ``document__fulltext=<ifade>``: MySQL'de MATCH ... AGAINST (BOOLEAN MODE),
+    SQLite'ta FTS5 gizli kolonu üzerinde MATCH. Kayıtlı lookup olarak
+    kullanıldığından ilişki INNER JOIN ile bağlanır; planlayıcı tam metin
+    index'ini bir kez tarayıp profillere pk ile gider.
+    """
+
+    lookup_name = "fulltext"
+
+    def as_mysql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"MATCH ({lhs}) AGAINST ({rhs} IN BOOLEAN MODE)", (*lhs_params, *rhs_params)
+
+    def as_sqlite(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} MATCH {rhs}", (*lhs_params, *rhs_params)
+
+
+class FullTextRank(Func):
+    """Aynı join'den alaka puanı; büyük = daha alakalı."""
+
+    output_field = FloatField()
+
+    def __init__(self, column: str, expr: str):
+        super().__init__(F(column), Value(expr))
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        return super().as_sql(
+            compiler, connection,
+            template="MATCH (%(expressions)s IN BOOLEAN MODE)", arg_joiner=") AGAINST (",
+            **extra_context,
+        )
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        # bm25 yalnız FTS5 gizli kolonunu alır; küçük = daha alakalı, işaret çevrilir
+        sql, params = compiler.compile(self.source_expressions[0])
+        return f"-bm25({sql})", params
+
+    def as_sql(self, compiler, connection, **extra_context):
+        raise NotSupportedError("FullTextRank yalnız MySQL ve SQLite'ta desteklenir.")
+
+
+ProfileSearchDocument._meta.get_field("document").register_lookup(FullTextMatch)
+ProfileSearchIndex._meta.get_field("match").register_lookup(FullTextMatch)
+
+
+def apply_search(qs, query: str):
+    """
+    Profile queryset'ine serbest metin araması uygular.
+    ``search_rank`` annotate edilir ve sonuç alaka düzeyine göre sıralanır.
+    Eşleşme ve puan aynı join'den gelir (MySQL: arama dokümanı, SQLite: FTS5
+    tablosu); tam metin index'i sorgu başına bir kez taranır.
+    """
+    terms = tokenize(query)
+    if not terms:
+        return qs
+
+    vendor = connection.vendor
+    if vendor == "mysql":
+        indexed = [t for t in terms if len(t) >= MYSQL_MIN_TOKEN_LEN]
+        short = [t for t in terms if len(t) < MYSQL_MIN_TOKEN_LEN]
+        for term in short:
+            qs = qs.filter(search_document__document__icontains=term)
+        if not indexed:
+            return qs.annotate(search_rank=Value(0.0, output_field=FloatField()))
+        column, expr = "search_document__document", _mysql_boolean_query(indexed)
+    elif vendor == "sqlite":
+        column, expr = "search_index__match", _fts5_query(terms)
+    else:
+        for term in terms:
+            qs = qs.filter(search_document__document__icontains=term)
+        return qs.annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+    return (
+        qs.filter(**{f"{column}__fulltext": expr})
+        .annotate(search_rank=FullTextRank(column, expr))
+        .order_by("-search_rank", "pk")
+    )
+
+
+# ---------------------------------
+# Recruiter filtreleri
+# ---------------------------------
+def candidate_filters(params) -> dict:
+    """GET parametrelerinden normalize edilmiş filtre sözlüğü."""
+    filters = {key: (params.get(key) or "").strip() for key in FILTER_KEYS}
+    filters["q"] = " ".join(tokenize(params.get("q")))
+    min_completion = filters["min_completion"]
+    if not (min_completion.isdigit() and 0 < int(min_completion) <= 100):
+        filters["min_completion"] = ""
+    return filters
+
+
+def candidate_sort(params) -> str:
+    return SORT_COMPLETION if (params.get("sort") or "").strip() == SORT_COMPLETION else ""
+
+
+def apply_candidate_filters(qs, filters: dict):
+    """
+    company_profile filtre semantiği (icontains / iexact) korunur. Skill,
+    facet'in saydığı gibi tam adla (büyük-küçük harf duyarsız) ve join +
+    distinct yerine EXISTS ile eşleşir; "java" javascript'i getirmez. Proje
+    teknolojileri Technology tablosunda indexli prefix aramasıyla eşleşir.
+    """
+    if filters.get("major"):
+        qs = qs.filter(major__icontains=filters["major"])
+    if filters.get("location"):
+        qs = qs.filter(location__icontains=filters["location"])
+    if filters.get("graduation_year"):
+        qs = qs.filter(graduation_year=filters["graduation_year"])
+    if filters.get("internship_type"):
+        qs = qs.filter(internship_type__iexact=filters["internship_type"])
+    if filters.get("skill"):
+        qs = qs.filter(Exists(
+            Profile.skills.through.objects.filter(profile_id=OuterRef("pk"), skill__name__iexact=filters["skill"])
+        ))
+    if filters.get("project_skill"):
+        qs = filter_project_technologies(qs, filters["project_skill"])
+    if filters.get("min_completion"):
+        qs = qs.filter(completion_score__gte=int(filters["min_completion"]))
+    if filters.get("q"):
+        qs = apply_search(qs, filters["q"])
+    return qs
+
+
+def filter_project_technologies(qs, text: str):
+    """
+    Aranan her kelime için, projelerinden birinde o önekle başlayan bir
+    Technology olan profiller ("go" -> go, golang; django değil). Çok
+    kelimeli adların kelimeleri de etiket olduğundan "django" ve "react
+    native", "Python Django React Native" yazılmış projeyi de bulur. EXISTS
+    kullanıldığı için distinct gerekmez.
+    """
+    Through = Project.technology_tags.through
+    words = dict.fromkeys(word for phrase in Technology.phrases(text) for word in phrase.split())
+    for token in words:
+        qs = qs.filter(Exists(
+            Through.objects.filter(project__profile_id=OuterRef("pk"), technology__name__istartswith=token)
+        ))
+    return qs
+
+
+def student_queryset(company=None):
+    """Sadece öğrenciler (şirket kullanıcıları hariç)."""
+    qs = Profile.objects.filter(user__company__isnull=True)
+    if company is not None and company.user_id:
+        qs = qs.exclude(user_id=company.user_id)
+    return qs
+
@@ -0,0 +1,190 @@
+# profiles/signals.py
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .completion import refresh_company_completion, refresh_profile_completion
+from .dashboard import refresh_company_dashboards
+from .models import Bookmark, Certification, Company, Position, Profile, Project, Skill
+from .result_cache import bookmarks_version_name
+from .search import refresh_search_documents
+from .versioning import CANDIDATES, SKILLS, bump_version
+
+
+# completion_score'un bağlı olduğu alanlar (profiles.completion)
+PROFILE_COMPLETION_FIELDS = frozenset({"bio", "location"})
+COMPANY_COMPLETION_FIELDS = frozenset({"about", "location"})
+
+# Herkese açık profilde / arama dokümanında görünen User alanları
+USER_PROFILE_FIELDS = frozenset({"username", "first_name", "last_name", "email"})
+
+
+def _touch_profiles(profile_ids) -> None:
+    """Profile.updated_at'i ilerletir (student_profile_view ETag'i ve fragment cache'i)."""
+    profile_ids = [pk for pk in profile_ids if pk]
+    if profile_ids:
+        Profile.objects.filter(pk__in=profile_ids).update(updated_at=timezone.now())
+
+
+def _schedule_search_refresh(profile_ids) -> None:
+    """
+    Doküman commit sonrası yeniden yazılır: cascade silmelerde (Profile ->
+    Project) silinmekte olan profile için doküman tekrar oluşturulmaz.
+    Aday verisinden türetilen cache'ler için sürüm de artırılır.
+    """
+    profile_ids = [pk for pk in profile_ids if pk]
+    if profile_ids:
+        transaction.on_commit(lambda: refresh_search_documents(profile_ids))
+        transaction.on_commit(lambda: bump_version(CANDIDATES))
+
+
+# ---------------------------------
+# Arama dokümanı bakımı
+# ---------------------------------
+@receiver(post_save, sender=Profile)
+def profile_saved(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if update_fields is None or PROFILE_COMPLETION_FIELDS.intersection(update_fields):
+        refresh_profile_completion([instance.pk])
+    _schedule_search_refresh([instance.pk])
+
+
+@receiver(post_delete, sender=Profile)
+def profile_deleted(sender, instance, **kwargs):
+    transaction.on_commit(lambda: bump_version(CANDIDATES))
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    # İsim/kullanıcı adı dokümanın parçası; login'deki last_login kaydı değil
+    if update_fields is not None and not USER_PROFILE_FIELDS.intersection(update_fields):
+        return
+    profile_ids = list(Profile.objects.filter(user_id=instance.pk).values_list("pk", flat=True))
+    _touch_profiles(profile_ids)
+    _schedule_search_refresh(profile_ids)
+
+
+@receiver(m2m_changed, sender=Profile.skills.through)
+def profile_skills_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            refresh_profile_completion([instance.pk])
+            _touch_profiles([instance.pk])
+            _schedule_search_refresh([instance.pk])
+        return
+
+    # skill.profiles.add/remove/clear tarafı
+    if action == "pre_clear":
+        instance._search_cleared_profile_ids = list(instance.profiles.values_list("pk", flat=True))
+    elif action == "post_clear":
+        profile_ids = getattr(instance, "_search_cleared_profile_ids", [])
+        refresh_profile_completion(profile_ids)
+        _touch_profiles(profile_ids)
+        _schedule_search_refresh(profile_ids)
+    elif action in ("post_add", "post_remove"):
+        refresh_profile_completion(pk_set or [])
+        _touch_profiles(pk_set or [])
+        _schedule_search_refresh(pk_set or [])
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def project_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    _touch_profiles([instance.profile_id])
+    _schedule_search_refresh([instance.profile_id])
+
+
+@receiver(post_save, sender=Certification)
+@receiver(post_delete, sender=Certification)
+def certification_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    _touch_profiles([instance.profile_id])
+
+
+@receiver(post_save, sender=Skill)
+def skill_saved(sender, instance, created=False, raw=False, **kwargs):
+    if raw or created:
+        return
+    profile_ids = list(instance.profiles.values_list("pk", flat=True))
+    _touch_profiles(profile_ids)
+    _schedule_search_refresh(profile_ids)
+
+
+@receiver(pre_delete, sender=Skill)
+def skill_deleting(sender, instance, **kwargs):
+    # Through satırları m2m_changed göndermeden silinir
+    profile_ids = list(instance.profiles.values_list("pk", flat=True))
+    _touch_profiles(profile_ids)
+    _schedule_search_refresh(profile_ids)
+
+
+# ---------------------------------
+# Skill kataloğu sürümü (profiles.skill_catalog)
+# ---------------------------------
+@receiver(post_save, sender=Skill)
+@receiver(post_delete, sender=Skill)
+def skill_catalog_changed(sender, raw=False, **kwargs):
+    if raw:
+        return
+    transaction.on_commit(lambda: bump_version(SKILLS))
+
+
+# ---------------------------------
+# Şirket tamamlanma skoru ve panel özeti
+# ---------------------------------
+@receiver(post_save, sender=Company)
+def company_saved(sender, instance, raw=False, created=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if update_fields is None or COMPANY_COMPLETION_FIELDS.intersection(update_fields):
+        refresh_company_completion([instance.pk])
+    if created:
+        refresh_company_dashboards([instance.pk], create=True)
+
+
+@receiver(post_save, sender=Position)
+@receiver(post_delete, sender=Position)
+def position_changed(sender, instance, raw=False, created=True, **kwargs):
+    # Sadece pozisyon eklenip silinmesi skoru ve sayacı etkiler
+    if raw or not created:
+        return
+    refresh_company_completion([instance.company_id])
+    refresh_company_dashboards([instance.company_id])
+
+
+# ---------------------------------
+# Bookmark cache sürümü ve panel sayacı
+# ---------------------------------
+def _bookmarks_changed(company_ids) -> None:
+    refresh_company_dashboards(company_ids)
+    for company_id in set(company_ids):
+        transaction.on_commit(lambda company_id=company_id: bump_version(bookmarks_version_name(company_id)))
+
+
+@receiver(post_save, sender=Bookmark)
+@receiver(post_delete, sender=Bookmark)
+def bookmark_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    _bookmarks_changed([instance.company_id])
+
+
+@receiver(m2m_changed, sender=Bookmark)
+def bookmarked_students_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    # company.bookmarked_students.add/remove/clear (Bookmark bulk insert/delete; post_save yok)
+    if action == "pre_clear" and reverse:
+        instance._cleared_bookmark_company_ids = list(instance.bookmarks.values_list("company_id", flat=True))
+    elif action == "post_clear":
+        _bookmarks_changed(
+            getattr(instance, "_cleared_bookmark_company_ids", []) if reverse else [instance.pk]
+        )
+    elif action in ("post_add", "post_remove"):
+        _bookmarks_changed((pk_set or []) if reverse else [instance.pk])
@@ -0,0 +1,147 @@
+# profiles/skill_catalog.py
+"""
+Süreç içi Skill kataloğu (autocomplete için).
+
+Katalog bir kere yüklenir ve kompakt dizilerde tutulur:
+
+* ``ids`` / ``names``: isme göre sıralı skill'ler (``array('q')`` + tuple),
+* iki prefix indeksi: küçük harfli tam isimler ve ilk kelime dışındaki
+  kelime başlangıçları ("machine learning" -> "learning"); her biri sıralı
+  anahtarlar + anahtarın skill indeksi (``array``) + anahtarların ilk
+  TRIE_DEPTH karakteri üzerinde bir trie. Trie düğümü sıralı anahtarlardaki
+  [lo, hi) aralığını tutar; daha uzun prefix'ler aralık içinde bisect ile
+  daraltılır, eşleşmeler ``limit``'e ulaşınca tarama durur.
+
+Skill satırları değişince (profiles.signals) cache'teki ``SKILLS`` sürümü
+artırılır; katalog sürüm değişince ya da CATALOG_MAX_AGE dolunca yeniden
+kurulur.
+"""
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from itertools import chain
+
+from .models import Skill
+from .versioning import SKILLS, get_version
+
+TRIE_DEPTH = 3
+AUTOCOMPLETE_LIMIT = 10
+AUTOCOMPLETE_MAX_LIMIT = 50
+
+# Çok süreçli kurulumda lokal cache sürüm artışını görmese de katalog bayatlamaz
+CATALOG_MAX_AGE = 300
+
+
+class _PrefixIndex:
+    """Sıralı anahtarlar + anahtarın skill indeksi + ilk TRIE_DEPTH karakterlik trie."""
+
+    def __init__(self, entries):
+        entries = sorted(entries)
+        self.keys = tuple(key for key, _ in entries)
+        self.skill = array("l", (index for _, index in entries))
+        self.trie = self._build_trie(self.keys)
+
+    @staticmethod
+    def _build_trie(keys):
+        """Düğüm: [lo, hi, {karakter: çocuk}]; kök tüm aralığı kapsar."""
+        root = [0, len(keys), {}]
+        for i, key in enumerate(keys):
+            node = root
+            for ch in key[:TRIE_DEPTH]:
+                child = node[2].get(ch)
+                if child is None:
+                    child = node[2][ch] = [i, i, {}]
+                child[1] = i + 1
+                node = child
+        return root
+
+    def matches(self, prefix: str):
+        """``prefix`` ile başlayan anahtarların skill indeksleri, anahtar sırasıyla."""
+        node = self.trie
+        for ch in prefix[:TRIE_DEPTH]:
+            node = node[2].get(ch)
+            if node is None:
+                return
+        lo, hi = node[0], node[1]
+        if len(prefix) > TRIE_DEPTH:
+            lo = bisect_left(self.keys, prefix, lo, hi)
+        for pos in range(lo, hi):
+            if not self.keys[pos].startswith(prefix):
+                return
+            yield self.skill[pos]
+
+
+class SkillCatalog:
+    def __init__(self, rows):
+        rows = sorted(rows, key=lambda row: (row[1].lower(), row[0]))
+        self.ids = array("q", (pk for pk, _ in rows))
+        self.names = tuple(name for _, name in rows)
+        lowered = [name.lower() for name in self.names]
+        self.by_name = _PrefixIndex((key, index) for index, key in enumerate(lowered))
+        self.by_word = _PrefixIndex(
+            (key, index) for index, name in enumerate(lowered) for key in self._word_keys(name)
+        )
+
+    @staticmethod
+    def _word_keys(lowered):
+        """İlk kelime dışındaki kelime başlangıçlarından itibaren anahtarlar."""
+        return [
+            lowered[i:]
+            for i in range(1, len(lowered))
+            if not lowered[i - 1].isalnum() and lowered[i].isalnum()
+        ]
+
+    @classmethod
+    def build(cls):
+        return cls(Skill.objects.values_list("id", "name").iterator(chunk_size=10_000))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def complete(self, prefix: str, limit: int = AUTOCOMPLETE_LIMIT):
+        """
+        ``prefix`` ile başlayan skill'ler: [(id, name), ...]. Önce isim başı
+        eşleşmeleri (alfabetik), sonra kelime başı eşleşmeleri (eşleşen
+        kelimeye göre). En fazla ``limit`` anahtar taranır + tekrarlar.
+        """
+        prefix = " ".join((prefix or "").lower().split())
+        if not prefix or limit <= 0:
+            return []
+        found, seen = [], set()
+        for index in chain(self.by_name.matches(prefix), self.by_word.matches(prefix)):
+            if index in seen:
+                continue
+            seen.add(index)
+            found.append((self.ids[index], self.names[index]))
+            if len(found) >= limit:
+                break
+        return found
+
+
+# ---------------------------------
+# Süreç içi katalog cache'i
+# ---------------------------------
+_lock = threading.Lock()
+_state = {"catalog": None, "version": None, "built_at": 0.0}
+
+
+def get_skill_catalog() -> SkillCatalog:
+    version = get_version(SKILLS)
+    state = _state
+    if state["catalog"] is not None and state["version"] == version \
+            and time.monotonic() - state["built_at"] < CATALOG_MAX_AGE:
+        return state["catalog"]
+    with _lock:
+        if state["catalog"] is None or state["version"] != version \
+                or time.monotonic() - state["built_at"] >= CATALOG_MAX_AGE:
+            state["catalog"] = SkillCatalog.build()
+            state["version"] = version
+            state["built_at"] = time.monotonic()
+        return state["catalog"]
+
+
+def reset_skill_catalog() -> None:
+    with _lock:
+        _state.update(catalog=None, version=None, built_at=0.0)
+
@@ -0,0 +1,109 @@
+# profiles/slugs.py
+"""
+Benzersiz slug üretimi (Company.save, accounts şirket hesabı hazırlığı ve toplu içe aktarma kullanır).
+
+Şema değişmedi: ``acme``, ``acme-2``, ``acme-3``, ... (ilk boş sonek).
+Dolu sonekler tek prefix sorgusuyla okunur; sonek başına ``exists()``
+yapılmaz. Boşluk kontrolü ile kayıt arasında başka bir istek aynı slug'ı
+alabileceği için kayıt savepoint içinde denenir, unique ihlalinde reddedilen
+slug hariç tutularak yeniden seçilir (tekrar denemelerde ilk birkaç boş
+sonekten rastgele biri; atlanan boşlukları sonraki kayıtlar doldurur).
+"""
+import random
+
+from django.db import IntegrityError, router, transaction
+from django.db.models import Q
+from django.utils.text import slugify
+
+# 16 thread aynı ismi art arda kaydederken bile 5 denemeyi nadiren geçer
+MAX_SLUG_ATTEMPTS = 8
+
+# "-<sonek>" için ayrılan yer (``-999999``)
+_SUFFIX_ROOM = 7
+
+
+def slug_base(*candidates, max_length: int = 50, fallback: str = "company") -> str:
+    """Adaylardan boş olmayan ilk slugify sonucu, sonek için kısaltılmış."""
+    for text in candidates:
+        base = slugify(text or "")[: max_length - _SUFFIX_ROOM].strip("-")
+        if base:
+            return base
+    return fallback
+
+
+def _taken_suffixes(slugs, base) -> set[int]:
+    """``base`` -> 1, ``base-N`` -> N; ``base-corp`` gibi slug'lar yok sayılır."""
+    taken = set()
+    prefix = f"{base}-"
+    for slug in slugs:
+        if slug == base:
+            taken.add(1)
+        elif slug.startswith(prefix) and slug[len(prefix):].isdigit():
+            taken.add(int(slug[len(prefix):]))
+    return taken
+
+
+def _first_free(base, taken: set[int], skip: int = 0) -> str:
+    """İlk boş sonek; ``skip`` > 0 ise o kadar boş sonek atlanır."""
+    n = 1
+    while n in taken or skip:
+        if n not in taken:
+            skip -= 1
+        n += 1
+    return base if n == 1 else f"{base}-{n}"
+
+
+def _prefix_query(bases, field):
+    query = Q()
+    for base in bases:
+        query |= Q(**{field: base}) | Q(**{f"{field}__startswith": f"{base}-"})
+    return query
+
+
+def free_slugs(queryset, bases, field: str = "slug") -> list[str]:
+    """
+    Her ``base`` için boş slug; aynı listedeki tekrarlar birbirini görür
+    (toplu insert). Tüm liste için tek sorgu.
+    """
+    unique_bases = set(bases)
+    if not unique_bases:
+        return []
+    existing = list(queryset.filter(_prefix_query(unique_bases, field)).values_list(field, flat=True))
+    taken = {base: _taken_suffixes(existing, base) for base in unique_bases}
+    slugs = []
+    for base in bases:
+        slug = _first_free(base, taken[base])
+        taken[base].update(_taken_suffixes([slug], base))
+        slugs.append(slug)
+    return slugs
+
+
+def save_with_unique_slug(instance, base: str, save, field: str = "slug") -> None:
+    """
+    ``instance.<field>``'ı ``base``'den seçip ``save()``'i çağırır. Unique
+    ihlali slug yüzünden ise (eşzamanlı kayıt) reddedilen slug hariç
+    tutularak yeniden denenir; başka bir ihlal olduğu gibi yükseltilir.
+    """
+    model = type(instance)
+    using = router.db_for_write(model, instance=instance)
+    others = model._default_manager.using(using)
+    if instance.pk is not None:
+        others = others.exclude(pk=instance.pk)
+    # Dış transaction varsa (REPEATABLE READ) rakibin satırı görünmeyebilir
+    in_outer_transaction = transaction.get_connection(using).in_atomic_block
+    rejected = set()
+    for attempt in range(1, MAX_SLUG_ATTEMPTS + 1):
+        existing = others.filter(_prefix_query([base], field)).values_list(field, flat=True)
+        # Yarışı kaybedenler aynı boş soneke yığılmasın: pencere her denemede büyür
+        skip = random.randrange(2 ** (attempt - 1))
+        slug = _first_free(base, _taken_suffixes([*existing, *rejected], base), skip)
+        setattr(instance, field, slug)
+        try:
+            with transaction.atomic(using=using):
+                save()
+            return
+        except IntegrityError:
+            slug_conflict = in_outer_transaction or others.filter(**{field: slug}).exists()
+            if not slug_conflict or attempt == MAX_SLUG_ATTEMPTS:
+                raise
+            rejected.add(slug)
@@ -1,3 +1,1207 @@
-from django.test import TestCase
+import importlib
+import io
+import json
+import os
+import re
+import tempfile
+import threading
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.management import CommandError, call_command
+from django.db import DatabaseError, IntegrityError, OperationalError, connection
+from django.test.utils import CaptureQueriesContext
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.template.loader import get_template, render_to_string
+from django.urls import clear_url_caches, reverse
+from django.utils import timezone
+
+from .models import (
+    Certification,
+    Company,
+    CompanyDashboard,
+    Profile,
+    ProfileViewDaily,
+    ProfileViewEvent,
+    ProfileViewHourly,
+    Project,
+    Position,
+    Skill,
+    Technology,
+)
+from . import urls as profile_urls
+from . import views
+from .async_views import gather_queries
+from .benchmarks import clear_dataset, seed_dataset
+from .cards import CARD_SKILL_LIMIT, StudentCard, load_student_cards
+from .dashboard import company_dashboard
+from .facets import facet_counts
+from .importer import AccountImporter, read_rows
+from .pagination import InvalidCursor, decode_cursor, encode_cursor, keyset_page
+from .result_cache import BOOKMARKS, bookmarked_profile_ids, cached_result, reset_stats, stats
+from .ranking import get_skill_matrix, rank_candidates, ranked_page, reset_skill_matrix, top_k
+from .search import (
+    apply_candidate_filters,
+    apply_search,
+    candidate_filters,
+    filter_project_technologies,
+    refresh_search_documents,
+    student_queryset,
+)
+from .slugs import free_slugs
+from .skill_catalog import SkillCatalog, get_skill_catalog, reset_skill_catalog
+from .versioning import CANDIDATES, bump_version
+from .view_analytics import RollupInProgress, daily_view_series, prune_hourly_buckets, rollup_view_events
+from .view_counter import ViewCountBuffer
+
+
+class BufferedViewCounterTests(TransactionTestCase):
+    def setUp(self):
+        self.profiles = [
+            Profile.objects.create(user=User.objects.create_user(f"viewed{i}", password="x"))
+            for i in range(5)
+        ]
+        # Arka plan thread'i testte araya girmesin
+        self.buffer = ViewCountBuffer(interval=3600)
+
+    def tearDown(self):
+        self.buffer.stop(flush=False)
+
+    def test_concurrent_flushes_do_not_lose_increments(self):
+        writers, views_per_writer = 8, 250
+        done = threading.Event()
+
+        def view():
+            for i in range(views_per_writer):
+                self.buffer.add(self.profiles[i % len(self.profiles)].pk)
+
+        def flush():
+            try:
+                while not done.is_set():
+                    try:
+                        self.buffer.flush()
+                    except DatabaseError:
+                        # Başarısız flush sayıları tampona geri koyar
+                        pass
+            finally:
+                connection.close()
+
+        flushers = [threading.Thread(target=flush) for _ in range(3)]
+        viewers = [threading.Thread(target=view) for _ in range(writers)]
+        for thread in flushers + viewers:
+            thread.start()
+        for thread in viewers:
+            thread.join()
+        done.set()
+        for thread in flushers:
+            thread.join()
+        self.buffer.flush()
+
+        self.assertEqual(self.buffer.pending(), 0)
+        total = sum(Profile.objects.values_list("profile_views", flat=True))
+        self.assertEqual(total, writers * views_per_writer)
+        per_profile = writers * views_per_writer // len(self.profiles)
+        for profile in self.profiles:
+            profile.refresh_from_db()
+            self.assertEqual(profile.profile_views, per_profile)
+
+    def test_failed_flush_restores_counts(self):
+        profile = self.profiles[0]
+        self.buffer.add(profile.pk, 2)
+        with mock.patch.object(Profile.objects, "filter", side_effect=DatabaseError("down")):
+            with self.assertRaises(DatabaseError):
+                self.buffer.flush()
+        self.assertEqual(self.buffer.pending(), 2)
+
+        self.assertEqual(self.buffer.flush(), 2)
+        profile.refresh_from_db()
+        self.assertEqual(profile.profile_views, 2)
+
+    def test_flush_writes_view_events(self):
+        profile = self.profiles[0]
+        company = Company.objects.create(name="Acme")
+        self.buffer.record(profile.pk, company.pk)
+        self.buffer.record(profile.pk)
+        self.assertEqual(self.buffer.flush(), 2)
+        self.assertEqual(ProfileViewEvent.objects.filter(profile=profile).count(), 2)
+        self.assertEqual(ProfileViewEvent.objects.filter(company=company).count(), 1)
+
+
+class ViewRollupTests(TestCase):
+    def setUp(self):
+        self.profile = Profile.objects.create(user=User.objects.create_user("viewed", password="x"))
+        self.company = Company.objects.create(name="Acme")
+
+    def _events(self, *times, company=None):
+        ProfileViewEvent.objects.bulk_create([
+            ProfileViewEvent(profile=self.profile, company=company, viewed_at=t) for t in times
+        ])
+
+    def test_rollup_aggregates_buckets_and_prunes_events(self):
+        base = datetime(2026, 3, 1, 10, 0, tzinfo=dt_timezone.utc)
+        self._events(base, base + timedelta(minutes=5), company=self.company)
+        self._events(base + timedelta(minutes=59), base + timedelta(hours=1), base + timedelta(days=1))
+
+        # Küçük batch: aynı kova birden fazla id aralığından toplanır
+        self.assertEqual(rollup_view_events(batch_size=2), 5)
+        self.assertFalse(ProfileViewEvent.objects.exists())
+
+        hourly = dict(ProfileViewHourly.objects.values_list("bucket", "views"))
+        self.assertEqual(hourly, {
+            base: 3,
+            base + timedelta(hours=1): 1,
+            base + timedelta(days=1): 1,
+        })
+        daily = {d.day.isoformat(): (d.views, d.company_views) for d in ProfileViewDaily.objects.all()}
+        self.assertEqual(daily, {"2026-03-01": (4, 2), "2026-03-02": (1, 0)})
+
+        # Sonraki rollup mevcut kovalara ekler
+        self._events(base + timedelta(minutes=30))
+        self.assertEqual(rollup_view_events(), 1)
+        self.assertEqual(ProfileViewHourly.objects.get(bucket=base).views, 4)
+        self.assertEqual(ProfileViewDaily.objects.get(day=base.date()).views, 5)
+
+        self.assertEqual(prune_hourly_buckets(), 3)
+        self.assertEqual(ProfileViewDaily.objects.count(), 2)
+
+    def test_rollup_stops_on_a_range_claimed_by_another_run(self):
+        base = datetime(2026, 3, 1, 10, 0, tzinfo=dt_timezone.utc)
+        self._events(base, base + timedelta(minutes=5))
+        # NOWAIT kilidi başka süreçteki rollup'ta: aralık sayılmadan bırakılır
+        claimed = mock.patch(
+            "django.db.models.query.QuerySet.select_for_update",
+            side_effect=OperationalError("could not obtain lock"),
+        )
+        with claimed, self.assertRaises(RollupInProgress):
+            rollup_view_events()
+        self.assertEqual(ProfileViewEvent.objects.count(), 2)
+        self.assertFalse(ProfileViewHourly.objects.exists())
+        self.assertFalse(ProfileViewDaily.objects.exists())
+
+        with claimed, self.assertRaisesMessage(CommandError, "already running"):
+            call_command("rollup_profile_views", stdout=io.StringIO())
+
+        # Kilit bırakılınca olaylar bir kez sayılır; tekrar çalıştırma bir şey bulmaz
+        self.assertEqual(rollup_view_events(), 2)
+        self.assertEqual(rollup_view_events(), 0)
+        self.assertEqual(ProfileViewHourly.objects.get(bucket=base).views, 2)
+
+    def test_daily_series_is_zero_filled(self):
+        now = timezone.now()
+        self._events(now, now)
+        rollup_view_events()
+        series = daily_view_series(self.profile.pk, days=7)
+        self.assertEqual(len(series), 7)
+        self.assertEqual(series[-1], (timezone.localdate(), 2))
+        self.assertEqual(sum(views for _, views in series), 2)
+
+
+class ProfileDetailQueryBudgetTests(TestCase):
+    # session + auth user, profile+user, 3 prefetch, görüntülenme serisi
+    QUERY_BUDGET = 7
+
+    def setUp(self):
+        self.user = User.objects.create_user("student", password="x", first_name="Ada")
+        profile = Profile.objects.create(user=self.user, bio="Hi", location="Ankara")
+        self.skills = [Skill.objects.create(name=f"skill-{i}") for i in range(15)]
+        profile.skills.set(self.skills[:6])
+        for i in range(5):
+            Project.objects.create(profile=profile, title=f"P{i}", technologies="python, django")
+            Certification.objects.create(
+                profile=profile, name=f"C{i}", organization="Org", date_obtained="2025-01-01"
+            )
+        self.client.force_login(self.user)
+
+    def test_profile_detail_query_budget(self):
+        url = reverse("profile_detail", kwargs={"username": self.user.username})
+        with self.assertNumQueries(self.QUERY_BUDGET):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["skills_count"], 6)
+        self.assertEqual(response.context["projects_count"], 5)
+        self.assertEqual(response.context["certifications_count"], 5)
+        self.assertEqual(response.context["completion_percent"], 100)
+        self.assertContains(response, 'name="skills" value="%d"' % self.skills[0].pk)
+        self.assertNotContains(response, "skill-14")
+
+    def test_profile_created_on_first_visit(self):
+        other = User.objects.create_user("fresh", password="x")
+        response = self.client.get(reverse("profile_detail", kwargs={"username": other.username}))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(Profile.objects.filter(user=other).exists())
+        self.assertEqual(response.context["skills_count"], 0)
+
+
+class CompletionScoreTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("scored", password="x")
+        self.profile = Profile.objects.create(user=self.user)
+        self.skill = Skill.objects.create(name="python")
+
+    def _score(self, obj):
+        return type(obj).objects.values_list("completion_score", flat=True).get(pk=obj.pk)
+
+    def test_profile_score_follows_fields_and_skills(self):
+        self.assertEqual(self._score(self.profile), 0)
+        self.profile.bio = "Hello"
+        self.profile.save(update_fields=["bio"])
+        self.assertEqual(self._score(self.profile), 30)
+
+        self.profile.skills.add(self.skill)
+        self.assertEqual(self._score(self.profile), 70)
+        self.skill.profiles.remove(self.profile)
+        self.assertEqual(self._score(self.profile), 30)
+        self.skill.profiles.add(self.profile)
+        self.skill.profiles.clear()
+        self.assertEqual(self._score(self.profile), 30)
+
+        self.profile.location = "Izmir"
+        self.profile.save()
+        self.profile.skills.set([self.skill])
+        self.assertEqual(self._score(self.profile), 100)
+
+    def test_company_score_follows_fields_and_positions(self):
+        company = Company.objects.create(name="Acme", about="We build things")
+        self.assertEqual(self._score(company), 30)
+        position = company.positions.create(title="Intern")
+        self.assertEqual(self._score(company), 70)
+        position.delete()
+        self.assertEqual(self._score(company), 30)
+
+    def test_min_completion_filter_and_sort(self):
+        other = Profile.objects.create(
+            user=User.objects.create_user("complete", password="x"), bio="Hi", location="Izmir"
+        )
+        other.skills.add(self.skill)
+
+        filters = candidate_filters({"min_completion": "60"})
+        ids = list(apply_candidate_filters(student_queryset(), filters).values_list("id", flat=True))
+        self.assertEqual(ids, [other.pk])
+        self.assertEqual(candidate_filters({"min_completion": "abc"})["min_completion"], "")
+
+        company_user = User.objects.create_user("recruiter", password="x")
+        company = Company.objects.create(name="Hiring", user=company_user)
+        self.client.force_login(company_user)
+        response = self.client.get(
+            reverse("company_students_page", kwargs={"slug": company.slug}), {"sort": "completion"}
+        )
+        html = response.json()["html"]
+        self.assertLess(html.index("• 100% complete"), html.index("• 0% complete"))
+
+
+class SkillCatalogTests(TestCase):
+    def setUp(self):
+        reset_skill_catalog()
+
+    def test_prefix_matches_name_starts_before_word_starts(self):
+        catalog = SkillCatalog([
+            (1, "Machine Learning"), (2, "Deep Learning"), (3, "Leadership"),
+            (4, "Python"), (5, "PyTorch"), (6, "Learning Design"),
+        ])
+        self.assertEqual([name for _, name in catalog.complete("lea")], [
+            "Leadership", "Learning Design", "Deep Learning", "Machine Learning",
+        ])
+        self.assertEqual(catalog.complete("learning", limit=1), [(6, "Learning Design")])
+        self.assertEqual(catalog.complete("  PY "), [(4, "Python"), (5, "PyTorch")])
+        self.assertEqual(catalog.complete("pyth"), [(4, "Python")])
+        self.assertEqual(catalog.complete("zzz"), [])
+        self.assertEqual(catalog.complete(""), [])
+
+    def test_catalog_rebuilds_when_skills_change(self):
+        Skill.objects.create(name="Django")
+        self.assertEqual(len(get_skill_catalog().complete("dj")), 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            Skill.objects.create(name="Django REST Framework")
+        self.assertEqual(len(get_skill_catalog().complete("dj")), 2)
+        with self.assertNumQueries(0):
+            get_skill_catalog()
+
+    def test_autocomplete_endpoint(self):
+        Skill.objects.create(name="React")
+        Skill.objects.create(name="React Native")
+        self.client.force_login(User.objects.create_user("typer", password="x"))
+        response = self.client.get(reverse("skill_autocomplete"), {"q": "rea", "limit": "1"})
+        self.assertEqual(response.json(), {"results": [{"id": Skill.objects.get(name="React").pk, "name": "React"}]})
+
+
+class StudentProfileConditionalGetTests(TestCase):
+    def setUp(self):
+        self.student = User.objects.create_user("public", password="x", first_name="Grace")
+        self.profile = Profile.objects.create(user=self.student, bio="Compilers")
+        self.url = reverse("student_profile_view", kwargs={"user_id": self.student.pk})
+        self.client.force_login(User.objects.create_user("viewer", password="x"))
+
+    def _get(self, etag=None):
+        headers = {"HTTP_IF_NONE_MATCH": etag} if etag else {}
+        return self.client.get(self.url, **headers)
+
+    def test_unchanged_profile_returns_304(self):
+        first = self._get()
+        self.assertEqual(first.status_code, 200)
+        self.assertIn("private", first["Cache-Control"])
+        etag = first["ETag"]
+        # session, auth user, (pk, updated_at)
+        with self.assertNumQueries(3):
+            self.assertEqual(self._get(etag).status_code, 304)
+
+    def test_related_changes_invalidate_validator_and_fragment(self):
+        etag = self._get()["ETag"]
+        changes = [
+            lambda: Project.objects.create(profile=self.profile, title="Tiny Lisp", technologies="c"),
+            lambda: self.profile.skills.add(Skill.objects.create(name="Rust")),
+            lambda: Certification.objects.create(
+                profile=self.profile, name="Cert X", organization="Org", date_obtained="2025-01-01"
+            ),
+            lambda: User.objects.filter(pk=self.student.pk).first().save(),
+        ]
+        expected = ["Tiny Lisp", "Rust", "Cert X", "Grace"]
+        for change, text in zip(changes, expected):
+            change()
+            response = self._get(etag)
+            self.assertEqual(response.status_code, 200)
+            self.assertContains(response, text)
+            self.assertNotEqual(response["ETag"], etag)
+            etag = response["ETag"]
+
+    def test_full_render_uses_fragment_cache(self):
+        Project.objects.create(profile=self.profile, title="Tiny Lisp", technologies="c")
+        self._get()
+        # session, auth user, (pk, updated_at), profile+user; ilişkiler fragment cache'ten
+        with self.assertNumQueries(4):
+            response = self._get()
+        self.assertContains(response, "Tiny Lisp")
+
+
+class AccountImportTests(TestCase):
+    def setUp(self):
+        Skill.objects.create(name="Python")
+        User.objects.create_user("existing", password="x")
+
+    def _run(self, text, fmt, batch_size=2, **kwargs):
+        importer = AccountImporter(batch_size=batch_size, **kwargs)
+        return importer.run(read_rows(io.StringIO(text), fmt))
+
+    def test_jsonl_import_writes_related_rows_and_derived_data(self):
+        rows = [
+            {"username": f"student{i}", "first_name": "Ada", "bio": "bio", "location": "Izmir",
+             "skills": ["python", "Go"], "graduation_year": "2026",
+             "projects": [{"title": "Bot", "technologies": "Python, Django"}],
+             "certifications": [{"name": "AWS", "organization": "Amazon", "date_obtained": "2025-05-01"}]}
+            for i in range(5)
+        ]
+        rows += [
+            {"username": "existing"},
+            {"username": "student0"},
+            {"username": "bad", "graduation_year": "soon"},
+            {"type": "company", "username": "acme-hr", "name": "Acme", "about": "We build", "location": "Ankara"},
+        ]
+        stats = self._run("\n".join(json.dumps(r) for r in rows) + "\n{not json", "jsonl", create_skills=True)
+
+        self.assertEqual((stats.rows, stats.students, stats.companies, stats.skipped, stats.errors), (10, 5, 1, 2, 2))
+        self.assertEqual([line for line, _ in stats.error_samples], [8, 10])
+        profile = Profile.objects.get(user__username="student3")
+        self.assertEqual(sorted(profile.skills.values_list("name", flat=True)), ["Go", "Python"])
+        self.assertEqual(profile.completion_score, 100)
+        self.assertEqual(profile.graduation_year, 2026)
+        project = profile.projects.get()
+        self.assertEqual(sorted(project.technology_tags.values_list("name", flat=True)), ["django", "python"])
+        self.assertEqual(profile.certifications.count(), 1)
+        self.assertIn("Bot", profile.search_document.document)
+        company = Company.objects.get(user__username="acme-hr")
+        self.assertEqual((company.slug, company.completion_score), ("acme", 60))
+        self.assertFalse(User.objects.get(username="student3").has_usable_password())
+
+    def test_csv_import_skips_unknown_skills_by_default(self):
+        text = (
+            "username,major,skills,projects\n"
+            'csv1,CS,Python;Rust,"[{""title"": ""CLI"", ""technologies"": ""rust""}]"\n'
+            "csv2,EE,,\n"
+        )
+        stats = self._run(text, "csv")
+
+        self.assertEqual((stats.students, stats.unknown_skills, stats.created_skills), (2, 1, 0))
+        self.assertFalse(Skill.objects.filter(name="Rust").exists())
+        self.assertEqual(list(Profile.objects.get(user__username="csv1").skills.values_list("name", flat=True)), ["Python"])
+        self.assertEqual(Project.objects.get(profile__user__username="csv1").title, "CLI")
+
+    def test_queries_per_chunk_do_not_grow_with_rows(self):
+        def queries(prefix, count):
+            text = "\n".join(
+                json.dumps({"username": f"{prefix}{i}", "skills": ["Python"], "projects": [{"title": "P"}]})
+                for i in range(count)
+            )
+            with CaptureQueriesContext(connection) as ctx:
+                self._run(text, "jsonl", batch_size=100)
+            return len(ctx.captured_queries)
+
+        self.assertEqual(queries("few", 3), queries("many", 60))
+
+
+class CompanySlugTests(TestCase):
+    def setUp(self):
+        Company.objects.bulk_create(
+            [Company(name="Acme", slug=slug) for slug in ("acme", "acme-2", "acme-4", "acme-corp")]
+        )
+
+    def test_first_free_suffix_with_single_prefix_query(self):
+        with CaptureQueriesContext(connection) as ctx:
+            company = Company.objects.create(name="ACME")
+        self.assertEqual(company.slug, "acme-3")
+        self.assertEqual(sum("LIKE" in q["sql"] for q in ctx.captured_queries), 1)
+        self.assertEqual(free_slugs(Company.objects.all(), ["acme", "acme", "acme-corp"]), ["acme-5", "acme-6", "acme-corp-2"])
+
+    def test_retries_when_slug_is_taken_concurrently(self):
+        # Prefix sorgusu rakibin satırını görmemiş gibi: ilk deneme unique ihlaline düşer
+        with mock.patch("profiles.slugs._taken_suffixes", side_effect=[set(), {1, 2, 4}]), \
+                mock.patch("profiles.slugs.random.randrange", return_value=0):
+            company = Company.objects.create(name="Acme")
+        self.assertEqual(company.slug, "acme-3")
+
+    def test_other_integrity_errors_are_raised(self):
+        user = User.objects.create_user("owner", password="x")
+        Company.objects.create(name="First", user=user)
+        with self.assertRaises(IntegrityError):
+            Company.objects.create(name="Second", user=user)
+
+    def test_blank_slug_is_filled_on_company_login_path(self):
+        from accounts.views import _get_or_prepare_company_for_user
+
+        user = User.objects.create_user("acme", password="x")
+        company = _get_or_prepare_company_for_user(user)
+        self.assertEqual(company.slug, "acme-3")
+        Company.objects.filter(pk=company.pk).update(slug="")
+        self.assertEqual(_get_or_prepare_company_for_user(user).slug, "acme-3")
+
+
+class CompanyDashboardTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("hr", password="x")
+        self.company = Company.objects.create(name="Acme", user=self.user)
+        self.students = [
+            Profile.objects.create(user=User.objects.create_user(f"bm{i}", password="x")) for i in range(3)
+        ]
+
+    def _counts(self):
+        dashboard = CompanyDashboard.objects.get(company=self.company)
+        return dashboard.open_positions, dashboard.bookmarks
+
+    def test_counts_follow_positions_and_bookmarks(self):
+        self.assertEqual(self._counts(), (0, 0))
+        position = Position.objects.create(company=self.company, title="Intern")
+        Position.objects.create(company=self.company, title="Junior")
+        self.company.bookmarked_students.add(*self.students)
+        self.assertEqual(self._counts(), (2, 3))
+
+        position.delete()
+        self.company.bookmarked_students.remove(self.students[0])
+        self.students[1].delete()
+        self.assertEqual(self._counts(), (1, 1))
+        self.company.bookmarked_students.clear()
+        self.assertEqual(self._counts(), (1, 0))
+
+    def test_company_delete_cascades_without_recreating_summary(self):
+        Position.objects.create(company=self.company, title="Intern")
+        self.company.bookmarked_students.add(self.students[0])
+        self.user.delete()
+        self.assertFalse(CompanyDashboard.objects.exists())
+
+    def test_company_profile_get_reads_summary_without_writes(self):
+        Position.objects.create(company=self.company, title="Intern")
+        self.company.bookmarked_students.add(self.students[0])
+        self.client.force_login(self.user)
+        url = reverse("company_profile", kwargs={"slug": self.company.slug})
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.context["open_positions_count"], response.context["bookmarked_count"]), (1, 1))
+        sql = [q["sql"].lstrip().upper() for q in ctx.captured_queries]
+        self.assertFalse([q for q in sql if q.startswith(("INSERT", "UPDATE", "DELETE"))])
+        dashboard_table = CompanyDashboard._meta.db_table
+        self.assertFalse([q for q in sql if q.startswith(f'SELECT "{dashboard_table.upper()}"')])
+
+    def test_missing_summary_is_computed_not_written(self):
+        Position.objects.create(company=self.company, title="Intern")
+        CompanyDashboard.objects.all().delete()
+        company = Company.objects.select_related("dashboard").get(pk=self.company.pk)
+        self.assertEqual(company_dashboard(company).open_positions, 1)
+        self.assertFalse(CompanyDashboard.objects.exists())
+
+
+def _reload_profile_urls():
+    # include() aynı modül nesnesini tutar; reload urlpatterns'i yerinde değiştirir
+    importlib.reload(profile_urls)
+    clear_url_caches()
+
+
+class AsyncReadViewTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        with override_settings(ASYNC_VIEWS=True):
+            _reload_profile_urls()
+        cls.addClassCleanup(_reload_profile_urls)
+
+    def setUp(self):
+        self.hr = User.objects.create_user("hr", password="x")
+        self.company = Company.objects.create(name="Acme", user=self.hr)
+        Position.objects.create(company=self.company, title="Intern")
+        self.students = [
+            Profile.objects.create(
+                user=User.objects.create_user(f"stu{i}", password="x"),
+                major="Computer Science" if i % 2 else "Physics",
+            )
+            for i in range(5)
+        ]
+        self.company.bookmarked_students.add(self.students[1])
+        self.client.force_login(self.hr)
+        self.async_client.force_login(self.hr)
+
+    def _sync_request(self, url, query):
+        request = RequestFactory().get(url, query)
+        request.user = User.objects.select_related("company").get(pk=self.hr.pk)
+        return request
+
+    @sync_to_async
+    def _sync_context(self, url, query):
+        with mock.patch.object(views, "render") as render:
+            views.company_profile(self._sync_request(url, query), slug=self.company.slug)
+        ctx = render.call_args.args[2]
+        expected = {key: ctx[key] for key in ("filtered_count", "total_count", "bookmarked_ids",
+                                              "open_positions_count", "bookmarked_count")}
+        expected["ids"] = [card.id for card in ctx["students"] or ctx["bookmarked_students"]]
+        return expected
+
+    @sync_to_async
+    def _sync_json(self, url, query):
+        return json.loads(views.candidate_search(self._sync_request(url, query)).content)
+
+    def test_urls_use_async_views(self):
+        self.assertEqual(profile_urls.read_views.__name__, "profiles.async_views")
+
+    async def test_company_profile_matches_sync_context(self):
+        url = reverse("company_profile", kwargs={"slug": self.company.slug})
+        for query in ({}, {"major": "computer"}, {"tab": "bookmarked"}, {"cursor": "bogus"}):
+            response = await self.async_client.get(url, query)
+            self.assertEqual(response.status_code, 200)
+            ctx = response.context
+            page = ctx["students"] or ctx["bookmarked_students"]
+            expected = await self._sync_context(url, query)
+            self.assertEqual([card.id for card in page], expected["ids"])
+            for key in ("filtered_count", "total_count", "bookmarked_ids", "open_positions_count", "bookmarked_count"):
+                self.assertEqual(ctx[key], expected[key], key)
+            self.assertEqual([p.title for p in ctx["positions"]], ["Intern"])
+
+        missing = await self.async_client.get(reverse("company_profile", kwargs={"slug": "nope"}))
+        self.assertEqual(missing.status_code, 404)
+
+    async def test_company_profile_post_uses_sync_form_handling(self):
+        url = reverse("company_profile", kwargs={"slug": self.company.slug})
+        response = await self.async_client.post(url, {"social_submit": "1", "linkedin": "https://li/acme"})
+        self.assertEqual(response.status_code, 302)
+        company = await Company.objects.aget(pk=self.company.pk)
+        self.assertEqual(company.linkedin, "https://li/acme")
+
+    async def test_candidate_search_matches_sync(self):
+        url = reverse("candidate_search")
+        response = await self.async_client.get(url, {"major": "computer", "limit": 10})
+        self.assertEqual(response.json(), await self._sync_json(url, {"major": "computer", "limit": 10}))
+        self.assertEqual(len(response.json()["results"]), 2)
+
+        await self.async_client.alogout()
+        student = self.students[0].user
+        await self.async_client.aforce_login(student)
+        self.assertEqual((await self.async_client.get(url)).status_code, 403)
+
+    async def test_student_profile_conditional_get(self):
+        url = reverse("student_profile_view", kwargs={"user_id": self.students[0].user_id})
+        response = await self.async_client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("ETag", response)
+        response = await self.async_client.get(url, headers={"if-none-match": response["ETag"]})
+        self.assertEqual(response.status_code, 304)
+        missing = await self.async_client.get(reverse("student_profile_view", kwargs={"user_id": 999999}))
+        self.assertEqual(missing.status_code, 404)
+
+
+@override_settings(ASYNC_PARALLEL_QUERIES=True)
+class GatherQueriesTests(SimpleTestCase):
+    async def test_independent_calls_run_concurrently_in_order(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def wait(value):
+            barrier.wait()  # üçü aynı anda çalışmıyorsa BrokenBarrierError
+            return value
+
+        with mock.patch("profiles.async_views.close_old_connections") as closed:
+            self.assertEqual(await gather_queries((wait, 1), (wait, 2), (wait, 3)), [1, 2, 3])
+        self.assertEqual(closed.call_count, 3)
+
+
+class SyntheticDatasetTests(TestCase):
+    def test_seed_dataset_builds_derived_rows(self):
+        dataset = seed_dataset(30, 3, "syn-", positions_per_company=2, bookmarks_per_company=5)
+        self.assertEqual(len(dataset["profile_ids"]), 30)
+        self.assertEqual(Profile.objects.filter(user__username__startswith="syn-student-").count(), 30)
+        self.assertEqual(Position.objects.filter(company_id__in=dataset["company_ids"]).count(), 6)
+        for dashboard in CompanyDashboard.objects.filter(company_id__in=dataset["company_ids"]):
+            self.assertEqual((dashboard.open_positions, dashboard.bookmarks), (2, 5))
+        # bulk_create sinyalleri atlar; türetilmiş satırlar sonda toplu yazılmış olmalı
+        self.assertFalse(Profile.objects.filter(pk__in=dataset["profile_ids"], search_document=None).exists())
+        self.assertTrue(Profile.objects.filter(pk__in=dataset["profile_ids"], completion_score__gt=0).exists())
+
+        self.assertGreater(clear_dataset("syn-"), 0)
+        self.assertFalse(Company.objects.filter(pk__in=dataset["company_ids"]).exists())
+
+    def test_bench_views_writes_comparable_json(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bench.json")
+            call_command(
+                "bench_views", sizes=[12], companies=2, repeat=2, warmup=0,
+                json_path=path, stdout=io.StringIO(),
+            )
+            with open(path, encoding="utf-8") as fh:
+                report = json.load(fh)
+            # Kendisiyle karşılaştırma gerileme bulmaz
+            call_command("bench_views", sizes=[12], companies=2, repeat=2, warmup=0,
+                         only=["login_view"], compare=path, threshold=1000, stdout=io.StringIO())
+
+        views_run = {row["view"] for row in report["results"]}
+        self.assertEqual(
+            views_run, {"company_profile", "profile_detail", "student_profile_view", "toggle_bookmark", "login_view"}
+        )
+        for row in report["results"]:
+            self.assertGreater(row["queries"], 0, row)
+            self.assertLessEqual(row["p50_ms"], row["p95_ms"])
+        # Veri geri alındı
+        self.assertFalse(User.objects.filter(username__startswith="bench-views-").exists())
+
+
+class CandidateSearchTests(TestCase):
+    def setUp(self):
+        self.hr = User.objects.create_user("search-hr", password="x")
+        self.company = Company.objects.create(name="Search Co", user=self.hr)
+        python, django_skill = Skill.objects.create(name="Python"), Skill.objects.create(name="Django")
+
+        def student(username, major, location, bio, skills, technologies):
+            profile = Profile.objects.create(
+                user=User.objects.create_user(username, first_name=username.title()),
+                major=major, location=location, bio=bio,
+            )
+            profile.skills.add(*skills)
+            Project.objects.create(profile=profile, title="Project", technologies=technologies)
+            return profile
+
+        self.ada = student("ada", "Computer Science", "Istanbul", "Computer vision and computer graphics",
+                           [python, django_skill], "Go, Docker")
+        self.bob = student("bob", "Computer Engineering", "Ankara", "", [django_skill], "Django")
+        self.cem = student("cem", "Physics", "Istanbul", "", [python], "Fortran")
+        refresh_search_documents([self.ada.pk, self.bob.pk, self.cem.pk])
+
+    def _search(self, **params):
+        return list(apply_candidate_filters(student_queryset(self.company), candidate_filters(params)))
+
+    def test_every_term_must_match_as_prefix(self):
+        self.assertEqual(self._search(q="comput istanbul"), [self.ada])
+        self.assertEqual(self._search(q="physics"), [self.cem])
+        self.assertEqual(self._search(q="nonexistent"), [])
+
+    def test_results_are_ordered_by_relevance(self):
+        results = list(apply_search(student_queryset(self.company), "computer"))
+        self.assertEqual(results, [self.ada, self.bob])
+        self.assertGreater(results[0].search_rank, results[1].search_rank)
+
+    def test_search_combines_with_filters(self):
+        self.assertEqual(self._search(q="computer", location="istanbul"), [self.ada])
+        self.assertEqual(self._search(q="computer", skill="django"), [self.ada, self.bob])
+        self.assertEqual(self._search(q="computer", project_skill="go"), [self.ada])
+        self.assertEqual(self._search(skill="python", project_skill="fortran"), [self.cem])
+        self.assertEqual(self._search(q="istanbul", major="physics", skill="python"), [self.cem])
+
+    def test_search_queryset_can_be_used_as_subquery(self):
+        qs = apply_search(student_queryset(self.company), "computer")
+        self.assertEqual(
+            set(Profile.objects.filter(pk__in=qs.values("pk"))), {self.ada, self.bob}
+        )
+
+    def test_search_api(self):
+        self.client.force_login(self.hr)
+        url = reverse("candidate_search")
+        payload = self.client.get(url, {"q": "Computer!"}).json()
+        self.assertEqual(payload["query"], "computer")
+        self.assertEqual([row["id"] for row in payload["results"]], [self.ada.pk, self.bob.pk])
+        self.assertGreater(payload["results"][0]["score"], payload["results"][1]["score"])
+
+        payload = self.client.get(url, {"q": "computer", "location": "ankara", "limit": 1}).json()
+        self.assertEqual([row["name"] for row in payload["results"]], ["Bob"])
+
+        self.client.force_login(self.ada.user)
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        self.hr = User.objects.create_user("pager-hr", password="x")
+        self.company = Company.objects.create(name="Pager Co", user=self.hr)
+        self.students = [
+            Profile.objects.create(user=User.objects.create_user(f"pager-{i:02d}"), major="Computer Science")
+            for i in range(45)
+        ]
+        # Üç skor değeri: sayfa sınırları eşit anahtarlı satırların ortasına düşer
+        for i, profile in enumerate(self.students):
+            Profile.objects.filter(pk=profile.pk).update(completion_score=(i % 3) * 10)
+        self.client.force_login(self.hr)
+        self._clear_caches()
+
+    @staticmethod
+    def _clear_caches():
+        for alias in caches:
+            caches[alias].clear()
+
+    def _all_pages(self, tab="all", sort=""):
+        ids, cursor = [], None
+        while True:
+            page, cursor = views._company_students_page(
+                self.company, tab, candidate_filters({}), cursor, sort=sort
+            )
+            ids += [card.id for card in page]
+            if cursor is None:
+                return ids
+
+    def test_invalid_cursor_is_rejected(self):
+        for token in ("bogus", encode_cursor([1, 2]), encode_cursor(["1"]), encode_cursor([{"id": 1}]),
+                      encode_cursor([True])):
+            with self.assertRaises(InvalidCursor, msg=token):
+                decode_cursor(token, 1)
+        self.assertEqual(decode_cursor(encode_cursor([0.5, 7]), 2), [0.5, 7])
+
+    def test_keyset_page_with_equal_sort_keys(self):
+        qs = Profile.objects.filter(user__username__startswith="pager-").values("id", "completion_score")
+        ordering = ["-completion_score", "id"]
+        ids, cursor = [], None
+        while True:
+            rows, cursor = keyset_page(qs, ordering, cursor, 7)
+            ids += [row["id"] for row in rows]
+            if cursor is None:
+                break
+        self.assertEqual(ids, list(qs.order_by(*ordering).values_list("id", flat=True)))
+
+    def test_pages_have_no_duplicates_or_gaps(self):
+        expected = list(
+            student_queryset(self.company).order_by("-completion_score", "id").values_list("id", flat=True)
+        )
+        self.assertEqual(self._all_pages(sort="completion"), expected)
+        # Sonuç cache'e sığmadığında DB keyset yolu aynı sırayı verir
+        self._clear_caches()
+        with mock.patch("profiles.result_cache.MAX_CACHED_IDS", 0):
+            self.assertEqual(self._all_pages(sort="completion"), expected)
+            self.assertEqual(self._all_pages(), sorted(expected))
+
+    def test_cursor_on_bookmarked_tab(self):
+        bookmarked = self.students[::2]
+        self.company.bookmarked_students.add(*bookmarked)
+        self.assertEqual(self._all_pages(tab="bookmarked"), sorted(p.id for p in bookmarked))
+        expected = list(
+            Profile.objects.filter(id__in=[p.id for p in bookmarked])
+            .order_by("-completion_score", "id").values_list("id", flat=True)
+        )
+        self.assertEqual(self._all_pages(tab="bookmarked", sort="completion"), expected)
+
+    def test_tampered_cursor_falls_back_to_first_page(self):
+        page_url = reverse("company_profile", kwargs={"slug": self.company.slug})
+        json_url = reverse("company_students_page", kwargs={"slug": self.company.slug})
+        for cursor in ("bogus", encode_cursor(["abc"]), encode_cursor([{"id": 1}]), encode_cursor([1, 2, 3])):
+            for params in ({}, {"sort": "completion"}, {"q": "computer"}, {"tab": "bookmarked"}):
+                query = {**params, "cursor": cursor}
+                self.assertEqual(self.client.get(page_url, query).status_code, 200, query)
+
+    def test_tampered_cursor_is_rejected_by_the_json_endpoint(self):
+        # Sonsuz kaydırma yanıtı listeye ekler: ilk sayfa kartları tekrarlardı
+        json_url = reverse("company_students_page", kwargs={"slug": self.company.slug})
+        for cursor in ("bogus", encode_cursor(["abc"]), encode_cursor([{"id": 1}]), encode_cursor([1, 2, 3])):
+            for params in ({}, {"sort": "completion"}, {"q": "computer"}, {"tab": "bookmarked"}):
+                query = {**params, "cursor": cursor}
+                response = self.client.get(json_url, query)
+                self.assertEqual(response.status_code, 400, query)
+                self.assertEqual(response.json(), {"error": "invalid_cursor"})
+        # Önbelleksiz DB keyset yolunda da 500 değil 400
+        self._clear_caches()
+        with mock.patch("profiles.result_cache.MAX_CACHED_IDS", 0):
+            response = self.client.get(json_url, {"cursor": encode_cursor(["abc"])})
+            self.assertEqual(response.status_code, 400)
+
+
+class StudentCardTests(TestCase):
+    def setUp(self):
+        self.skills = [Skill.objects.create(name=f"card-skill-{i:02d}") for i in range(12)]
+        self.full = Profile.objects.create(
+            user=User.objects.create_user("card-full", first_name="Ada", last_name="Lovelace"),
+            major="Mathematics", location="London", graduation_year=2027,
+        )
+        self.full.skills.add(*reversed(self.skills))
+        self.bare = Profile.objects.create(user=User.objects.create_user("card-bare"))
+        self.bare.skills.add(self.skills[5], self.skills[1])
+
+    def _cards(self, **kwargs):
+        return {card.id: card for card in load_student_cards(Profile.objects.order_by("id"), **kwargs)}
+
+    def test_skill_limit_is_applied_in_name_order(self):
+        with self.assertNumQueries(2):
+            cards = self._cards()
+        names = [skill.name for skill in self.skills]
+        self.assertEqual(cards[self.full.id].skills, tuple(names[:CARD_SKILL_LIMIT]))
+        self.assertEqual(cards[self.bare.id].skills, (names[1], names[5]))
+        self.assertEqual(self._cards(skill_limit=3)[self.full.id].skills, tuple(names[:3]))
+
+    def test_card_fields(self):
+        cards = self._cards()
+        full, bare = cards[self.full.id], cards[self.bare.id]
+        self.assertEqual(
+            (full.user_id, full.name, full.major, full.location, full.graduation_year, full.score),
+            (self.full.user_id, "Ada Lovelace", "Mathematics", "London", 2027, None),
+        )
+        self.assertEqual(full.completion, Profile.objects.get(pk=self.full.pk).completion_score)
+        # İsim yoksa kullanıcı adı
+        self.assertEqual(bare.name, "card-bare")
+
+    def test_template_reads_only_card_fields(self):
+        source = get_template("profiles/_student_cards.html").template.source
+        used = set(re.findall(r"\bs\.(\w+)", source))
+        self.assertTrue(used)
+        self.assertLessEqual(used, set(StudentCard.__slots__))
+
+        html = render_to_string("profiles/_student_cards.html", {"students": list(self._cards().values())})
+        self.assertIn("Ada Lovelace", html)
+        self.assertIn("Mathematics • London • 2027", html)
+        self.assertIn(reverse("student_profile_view", kwargs={"user_id": self.full.user_id}), html)
+        self.assertIn(reverse("toggle_bookmark", kwargs={"student_id": self.full.id}), html)
+        self.assertEqual(html.count("card-skill-"), CARD_SKILL_LIMIT + 2)
+
+
+class PositionRankingTests(TestCase):
+    def setUp(self):
+        reset_skill_matrix()
+        self.addCleanup(reset_skill_matrix)
+        py, sql, dj = (Skill.objects.create(name=name) for name in ("python", "sql", "django"))
+        Skill.objects.create(name="go")
+
+        def student(username, skills, technologies=""):
+            profile = Profile.objects.create(user=User.objects.create_user(username))
+            profile.skills.add(*skills)
+            if technologies:
+                Project.objects.create(profile=profile, title="P", technologies=technologies)
+            return profile
+
+        # Ağırlıklar: python, sql zorunlu (2), django tercih (1); toplam 5
+        self.a = student("rank-a", [py, dj])                  # 3 / 5
+        self.b = student("rank-b", [py], "SQL")               # 2 + 0.5 * 2 = 3 / 5
+        self.c = student("rank-c", [])                        # 0
+        self.d = student("rank-d", [py, sql, dj])             # 5 / 5
+        self.e = student("rank-e", [sql], "sql")              # hücre 1.0'da kesilir: 2 / 5
+        hr = User.objects.create_user("rank-hr")
+        Profile.objects.create(user=hr).skills.add(py, sql, dj)  # şirket kullanıcısı: sıralanmaz
+        self.company = Company.objects.create(user=hr, name="Rank Co")
+        self.position = Position.objects.create(company=self.company, title="Backend Intern")
+        self.position.required_skills.add(py, sql)
+        self.position.nice_to_have_skills.add(dj)
+
+    def test_recruiter_opens_a_position_with_skills_from_the_dashboard(self):
+        self.client.force_login(self.company.user)
+        url = reverse("company_profile", kwargs={"slug": self.company.slug})
+        html = self.client.get(url).content.decode()
+        # Seçiciler autocomplete'ten doldurulur; skill tablosu sayfaya basılmaz
+        self.assertIn('name="position_submit"', html)
+        self.assertIn('data-name="required_skills"', html)
+        self.assertIn('data-name="nice_to_have_skills"', html)
+        self.assertNotIn('value="%d"' % Skill.objects.get(name="go").pk, html)
+
+        py, sql, go = (Skill.objects.get(name=name) for name in ("python", "sql", "go"))
+        response = self.client.post(url, {
+            "position_submit": "1", "title": "Data Intern",
+            "required_skills": [py.pk, sql.pk], "nice_to_have_skills": [go.pk],
+        })
+        self.assertRedirects(response, url, fetch_redirect_response=False)
+        position = Position.objects.get(title="Data Intern")
+        self.assertEqual(set(position.required_skills.all()), {py, sql})
+        self.assertEqual(list(position.nice_to_have_skills.all()), [go])
+
+    def test_overlap_scores(self):
+        ids, scores = rank_candidates(self.position)
+        self.assertEqual(
+            list(zip(ids.tolist(), scores.round(3).tolist())),
+            [(self.d.id, 1.0), (self.a.id, 0.6), (self.b.id, 0.6), (self.e.id, 0.4), (self.c.id, 0.0)],
+        )
+        self.assertEqual([pk for pk, _ in top_k(self.position, k=2)], [self.d.id, self.a.id])
+
+    def test_missing_skills_count_in_denominator(self):
+        self.position.required_skills.add(Skill.objects.get(name="go"))
+        _, scores = rank_candidates(self.position, [self.d.id])
+        self.assertAlmostEqual(float(scores[0]), 5 / 7)
+
+    def test_cosine_scores_are_normalized(self):
+        ids, scores = rank_candidates(self.position, method="cosine")
+        self.assertEqual(ids[0], self.d.id)
+        self.assertTrue(((scores >= 0) & (scores <= 1 + 1e-9)).all())
+
+    def test_cursor_paging(self):
+        seen, cursor = [], None
+        while True:
+            items, cursor = ranked_page(self.position, cursor, 2)
+            seen += [pk for pk, _ in items]
+            if cursor is None:
+                break
+        self.assertEqual(seen, [self.d.id, self.a.id, self.b.id, self.e.id, self.c.id])
+
+        items, cursor = ranked_page(self.position, None, 1, candidate_ids=[self.b.id, self.c.id, self.a.id])
+        self.assertEqual(items, [(self.a.id, 0.6)])
+        items, cursor = ranked_page(self.position, cursor, 1, candidate_ids=[self.b.id, self.c.id, self.a.id])
+        self.assertEqual(items, [(self.b.id, 0.6)])
+        with self.assertRaises(InvalidCursor):
+            ranked_page(self.position, encode_cursor(["x", 1]), 2)
+
+    def test_stale_matrix_is_served_while_rebuilt_in_background(self):
+        first = get_skill_matrix()
+        self.c.skills.add(Skill.objects.get(name="python"))
+        bump_version(CANDIDATES)
+        with mock.patch("profiles.ranking._in_transaction", return_value=False), \
+                mock.patch("profiles.ranking.MATRIX_MIN_REBUILD_INTERVAL", 0), \
+                mock.patch("profiles.ranking.threading.Thread") as thread:
+            with self.assertNumQueries(0):
+                self.assertIs(get_skill_matrix(), first)
+                self.assertIs(get_skill_matrix(), first)
+            thread.assert_called_once()  # tek kurulum
+            # Thread gövdesi burada çalıştırılır; test bağlantısı kapatılmaz
+            with mock.patch("profiles.ranking.connections"):
+                thread.call_args.kwargs["target"](*thread.call_args.kwargs["args"])
+            rebuilt = get_skill_matrix()
+        self.assertIsNot(rebuilt, first)
+        ids, scores = rank_candidates(self.position, [self.c.id])
+        self.assertAlmostEqual(float(scores[0]), 0.4)
+
+
+class FacetCountTests(TestCase):
+    def setUp(self):
+        for alias in caches:
+            caches[alias].clear()
+        python, sql = Skill.objects.create(name="python"), Skill.objects.create(name="sql")
+        rows = [
+            ("fa", "Computer Science", "Istanbul", 2026, "remote", [python, sql], "Django"),
+            ("fb", "Computer Science", "Ankara", 2026, "", [python], ""),
+            ("fc", "Physics", "Istanbul", 2027, "part_time", [sql], "Fortran"),
+            ("fd", "Physics", "", None, None, [], ""),
+        ]
+        self.profiles = []
+        for username, major, location, year, kind, skills, technologies in rows:
+            profile = Profile.objects.create(
+                user=User.objects.create_user(username), major=major, location=location,
+                graduation_year=year, internship_type=kind,
+            )
+            profile.skills.add(*skills)
+            if technologies:
+                Project.objects.create(profile=profile, title="P", technologies=technologies)
+            self.profiles.append(profile)
+        hr = User.objects.create_user("facet-hr")
+        Profile.objects.create(user=hr, major="Computer Science")  # şirket kullanıcısı sayılmaz
+        Company.objects.create(user=hr, name="Facet Co")
+        refresh_search_documents(p.pk for p in self.profiles)
+
+    def test_counts_without_filters(self):
+        facets = facet_counts({})
+        self.assertEqual(facets["total"], 4)
+        self.assertEqual(facets["major"], [("Computer Science", 2), ("Physics", 2)])
+        self.assertEqual(facets["location"], [("Istanbul", 2), ("Ankara", 1)])
+        self.assertEqual(facets["graduation_year"], [(2027, 1), (2026, 2)])
+        self.assertEqual(facets["internship_type"], [("part_time", 1), ("remote", 1)])
+        self.assertEqual(facets["skill"], [("python", 2), ("sql", 2)])
+        self.assertEqual(facets["project_skill"], [("django", 1), ("fortran", 1)])
+
+    def test_counts_follow_filters(self):
+        facets = facet_counts({"major": "physics", "location": "istanbul"})
+        self.assertEqual(facets["total"], 1)
+        self.assertEqual(facets["skill"], [("sql", 1)])
+
+    def test_counts_with_search_query(self):
+        # Arama queryset'i alt sorgu olarak kullanılır
+        facets = facet_counts({"q": "computer"})
+        self.assertEqual(facets["total"], 2)
+        self.assertEqual(facets["location"], [("Ankara", 1), ("Istanbul", 1)])
+        self.assertEqual(facets["skill"], [("python", 2), ("sql", 1)])
+
+        facets = facet_counts({"q": "istanbul", "skill": "sql"})
+        self.assertEqual(facets["total"], 2)
+        self.assertEqual(facets["major"], [("Computer Science", 1), ("Physics", 1)])
+
+    def test_skill_facet_count_matches_its_filter(self):
+        # "java" facet'ine tıklamak javascript bilenleri getirmemeli
+        java, javascript = Skill.objects.create(name="java"), Skill.objects.create(name="javascript")
+        self.profiles[0].skills.add(java)
+        self.profiles[1].skills.add(javascript)
+        self.profiles[2].skills.add(javascript)
+        refresh_search_documents(p.pk for p in self.profiles)
+
+        counts = dict(facet_counts({})["skill"])
+        self.assertEqual((counts["java"], counts["javascript"]), (1, 2))
+        for name in ("java", "javascript"):
+            filtered = facet_counts({"skill": name.upper()})
+            self.assertEqual(filtered["total"], counts[name])
+            self.assertIn((name, counts[name]), filtered["skill"])
+        self.assertEqual(
+            list(apply_candidate_filters(student_queryset(), {"skill": "java"})), [self.profiles[0]]
+        )
+
+    def test_cached_until_candidates_version_bump(self):
+        self.assertEqual(facet_counts({"major": "Physics"})["total"], 2)
+        # Büyük-küçük harf farkı aynı girdiyi kullanır
+        with self.assertNumQueries(0):
+            self.assertEqual(facet_counts({"major": "physics "})["total"], 2)
+
+        Profile.objects.filter(pk=self.profiles[0].pk).update(major="Physics")
+        self.assertEqual(facet_counts({"major": "physics"})["total"], 2)
+        bump_version(CANDIDATES)
+        self.assertEqual(facet_counts({"major": "physics"})["total"], 3)
+
+
+class ProjectTechnologyTests(TestCase):
+    def test_tokenize(self):
+        self.assertEqual(
+            Technology.tokenize(" Python, Django / React  Native;GO|python\nC++ "),
+            ["python", "django", "react native", "react", "native", "go", "c++"],
+        )
+        self.assertEqual(
+            Technology.phrases(" Python, Django / React  Native;GO|python\nC++ "),
+            ["python", "django", "react native", "go", "c++"],
+        )
+        # Ayraçsız serbest metin: ad korunur, kelimeler de token olur
+        self.assertEqual(
+            Technology.tokenize("Python Django React"),
+            ["python django react", "python", "django", "react"],
+        )
+        self.assertEqual(Technology.tokenize(""), [])
+        self.assertEqual(Technology.tokenize(None), [])
+        self.assertEqual(Technology.tokenize(" , ;/ "), [])
+        self.assertEqual(len(Technology.tokenize("x" * 150)[0]), 100)
+
+    def test_tags_follow_technologies_field(self):
+        profile = Profile.objects.create(user=User.objects.create_user("tech-a"))
+        project = Project.objects.create(profile=profile, title="P", technologies="Go, Docker")
+        self.assertEqual(sorted(project.technology_tags.values_list("name", flat=True)), ["docker", "go"])
+
+        project.technologies = "docker; Kubernetes"
+        project.save()
+        self.assertEqual(sorted(project.technology_tags.values_list("name", flat=True)), ["docker", "kubernetes"])
+        # Aynı token tek Technology satırı
+        Project.objects.create(profile=profile, title="Q", technologies="DOCKER")
+        self.assertEqual(Technology.objects.filter(name="docker").count(), 1)
+
+    def test_project_technology_filter_matches_token_prefix(self):
+        def student(username, *technologies):
+            profile = Profile.objects.create(user=User.objects.create_user(username))
+            for tech in technologies:
+                Project.objects.create(profile=profile, title="P", technologies=tech)
+            return profile
+
+        go = student("tech-go", "Go, Docker")
+        golang = student("tech-golang", "Golang")
+        django = student("tech-django", "Django, Python")
+        both = student("tech-both", "Django", "go")
+        student("tech-none")
+
+        def matching(text):
+            return set(filter_project_technologies(Profile.objects.all(), text))
+
+        # "go" bir token öneki olarak eşleşir; "django" içindeki "go" eşleşmez
+        self.assertEqual(matching("go"), {go, golang, both})
+        self.assertEqual(matching("GO "), {go, golang, both})
+        self.assertEqual(matching("django"), {django, both})
+        # Her token ayrı ayrı sağlanmalı; farklı projelerden gelebilir
+        self.assertEqual(matching("go, django"), {both})
+        self.assertEqual(matching("go, docker"), {go})
+        self.assertEqual(matching("rust"), set())
+
+        # Boşlukla ayrılmış liste (form biçim dayatmaz)
+        spaced = student("tech-spaced", "Python Django React Native")
+        self.assertEqual(matching("django"), {django, both, spaced})
+        self.assertEqual(matching("react native"), {spaced})
+        self.assertEqual(matching("go"), {go, golang, both})
+        self.assertEqual(filter_project_technologies(Profile.objects.all(), "go").count(), 3)
+
+
+class ResultCacheTests(TestCase):
+    def setUp(self):
+        for alias in caches:
+            caches[alias].clear()
+        reset_stats()
+        self.compute = mock.Mock(return_value=[(3, 0.9), (1, 0.5)])
+
+    def test_hits_and_misses_are_counted(self):
+        self.assertEqual(cached_result({"major": "Computer"}, self.compute), ((3, 1), (0.9, 0.5)))
+        # Normalize edilmiş filtre aynı anahtardır
+        self.assertEqual(cached_result({"major": "computer ", "skill": ""}, self.compute), ((3, 1), (0.9, 0.5)))
+        self.compute.assert_called_once()
+        self.assertEqual(stats(), {"hits": 1, "misses": 1, "hit_ratio": 0.5})
+
+        out = io.StringIO()
+        call_command("result_cache_stats", reset=True, stdout=out)
+        self.assertIn("results: hits=1 misses=1 hit_ratio=50.00%", out.getvalue())
+        self.assertIn("bookmarks: hits=0 misses=0", out.getvalue())
+        self.assertEqual(stats()["hits"], 0)
+
+    def test_sort_and_filters_use_separate_keys(self):
+        cached_result({"major": "computer"}, self.compute)
+        cached_result({"major": "computer"}, self.compute, "completion")
+        cached_result({"major": "physics"}, self.compute)
+        self.assertEqual(self.compute.call_count, 3)
+
+    def test_candidates_version_bump_invalidates(self):
+        cached_result({}, self.compute)
+        bump_version(CANDIDATES)
+        cached_result({}, self.compute)
+        self.assertEqual(self.compute.call_count, 2)
+        self.assertEqual(stats()["misses"], 2)
+
+    def test_too_large_results_are_remembered(self):
+        with mock.patch("profiles.result_cache.MAX_CACHED_IDS", 1):
+            self.assertIsNone(cached_result({}, self.compute))
+            self.assertIsNone(cached_result({}, self.compute))
+        self.compute.assert_called_once_with(2)
+
+    def test_bookmark_changes_invalidate_bookmarked_ids(self):
+        company = Company.objects.create(user=User.objects.create_user("cache-hr"), name="Cache Co")
+        profile = Profile.objects.create(user=User.objects.create_user("cache-student"))
+        self.assertEqual(bookmarked_profile_ids(company.id), frozenset())
+        with self.captureOnCommitCallbacks(execute=True):
+            company.bookmarked_students.add(profile)
+        with self.assertNumQueries(1):
+            self.assertEqual(bookmarked_profile_ids(company.id), {profile.id})
+            self.assertEqual(bookmarked_profile_ids(company.id), {profile.id})
+        with self.captureOnCommitCallbacks(execute=True):
+            company.bookmarked_students.remove(profile)
+        self.assertEqual(bookmarked_profile_ids(company.id), frozenset())
+
+    def test_bookmark_lookups_have_their_own_counters(self):
+        company = Company.objects.create(user=User.objects.create_user("count-hr"), name="Count Co")
+        cached_result({}, self.compute)
+        bookmarked_profile_ids(company.id)
+        bookmarked_profile_ids(company.id)
+        bookmarked_profile_ids(company.id)
+        self.assertEqual(stats(), {"hits": 0, "misses": 1, "hit_ratio": 0.0})
+        self.assertEqual(stats(BOOKMARKS), {"hits": 2, "misses": 1, "hit_ratio": 2 / 3})
+
+        reset_stats()
+        self.assertEqual(stats(BOOKMARKS)["misses"], 0)
+
+    def test_company_profile_reads_ids_from_cache(self):
+        hr = User.objects.create_user("cache-view-hr")
+        company = Company.objects.create(user=hr, name="Cache View Co")
+        Profile.objects.create(user=User.objects.create_user("cache-view-s"), major="Computer Science")
+        self.client.force_login(hr)
+        url = reverse("company_profile", kwargs={"slug": company.slug})
+        self.client.get(url, {"major": "computer"})
+        misses = stats()["misses"]
+        response = self.client.get(url, {"major": "Computer"})
+        self.assertEqual(stats()["misses"], misses)
+        self.assertGreater(stats()["hits"], 0)
+        self.assertContains(response, "cache-view-s")
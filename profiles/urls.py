@@ -1,5 +1,9 @@
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import async_views, views
+
+# ASGI altında (ASYNC_VIEWS) okuma ağırlıklı view'lar async sürümleriyle
+read_views = async_views if settings.ASYNC_VIEWS else views
 
 urlpatterns = [
     path('redirect/', views.profile_redirect, name='profile_redirect'),
@@ -7,10 +11,17 @@ urlpatterns = [
     path('profile/<str:username>/edit/', views.profile_edit, name='profile_edit'),
     path('profile/<str:username>/', views.profile_detail, name='profile_detail'),
 
-    path('company/<slug:slug>/', views.company_profile, name='company_profile'),
+    path('company/<slug:slug>/', read_views.company_profile, name='company_profile'),
+    path('company/<slug:slug>/students/', views.company_students_page, name='company_students_page'),
+
+    # Aday arama (JSON)
+    path('search/', read_views.candidate_search, name='candidate_search'),
+
+    # Skill autocomplete (JSON)
+    path('skills/autocomplete/', views.skill_autocomplete, name='skill_autocomplete'),
 
     # Öğrenci herkese açık profil
-    path('student/<int:user_id>/', views.student_profile_view, name='student_profile_view'),
+    path('student/<int:user_id>/', read_views.student_profile_view, name='student_profile_view'),
 
     # Profil görüntüleme sayacı (POST)
     path('student/<int:user_id>/increment-profile-views/',
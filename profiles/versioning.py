@@ -0,0 +1,34 @@
+# profiles/versioning.py
+"""
+Cache'te tutulan sürüm sayaçları.
+
+Aday verisi (Profile, Profile.skills, Project, Skill) değiştiğinde
+``CANDIDATES`` sayacı artırılır; bu veriden türetilen her şey (skill matrisi,
+cache'lenmiş sonuçlar) anahtarına sürümü katarak kendiliğinden geçersizleşir.
+"""
+from django.core.cache import cache
+
+CANDIDATES = "candidates"
+# Skill kataloğu (profiles.skill_catalog)
+SKILLS = "skills"
+
+_KEY = "profiles:version:{}"
+
+
+def get_version(name: str) -> int:
+    key = _KEY.format(name)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, 1, timeout=None)
+        version = cache.get(key, 1)
+    return version
+
+
+def bump_version(name: str) -> int:
+    key = _KEY.format(name)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # Anahtar yok (ilk kullanım ya da cache temizlendi)
+        cache.add(key, 2, timeout=None)
+        return cache.get(key, 2)
@@ -0,0 +1,146 @@
+# profiles/view_analytics.py
+"""
+Zaman kovalı profil görüntülenme analitiği.
+
+* Her görüntülemede (profiles.view_counter) kompakt bir ProfileViewEvent
+  satırı eklenir: profil, bakan şirket (varsa), zaman.
+* ``rollup_profile_views`` komutu ham olayları id aralıkları halinde
+  saatlik (ProfileViewHourly) ve günlük (ProfileViewDaily) kovalara toplar
+  ve işlenen olayları aynı transaction'da siler. Her aralık önce
+  ``SELECT ... FOR UPDATE NOWAIT`` ile sahiplenilir: ayrı süreçlerde
+  eşzamanlı çalışan ikinci bir rollup ya kilitli aralıkta RollupInProgress
+  alır ya da silinmiş olayları bulamaz; bir olay iki kez sayılmaz. Eski
+  saatlik kovalar HOURLY_RETENTION_DAYS sonra budanır; günlük kovalar kalır.
+* profile_detail serileri (profile, day) benzersiz indeksi üzerinde tek bir
+  aralık sorgusuyla okur. Henüz toplanmamış olaylar seride görünmez;
+  komutun cron ile sık (ör. 5-15 dk) çalıştırılması beklenir.
+"""
+from datetime import timedelta
+
+from django.db import OperationalError, connection, transaction
+from django.db.models import Count
+from django.db.models.functions import TruncDate, TruncHour
+from django.utils import timezone
+
+from .models import ProfileViewDaily, ProfileViewEvent, ProfileViewHourly
+
+HOURLY_RETENTION_DAYS = 14
+ROLLUP_BATCH_SIZE = 50_000
+
+
+class RollupInProgress(Exception):
+    pass
+
+
+# ---------------------------------
+# Rollup
+# ---------------------------------
+def _merge_buckets(model, field, rows):
+    """rows: [(profile_id, bucket, views, company_views)] -> mevcut kovalara eklenir."""
+    if not rows:
+        return
+    existing = {
+        (profile_id, bucket): (views, company_views)
+        for profile_id, bucket, views, company_views in (
+            model.objects.select_for_update()
+            .filter(profile_id__in={r[0] for r in rows}, **{f"{field}__in": {r[1] for r in rows}})
+            .values_list("profile_id", field, "views", "company_views")
+        )
+    }
+    objs = []
+    for profile_id, bucket, views, company_views in rows:
+        old_views, old_company_views = existing.get((profile_id, bucket), (0, 0))
+        objs.append(model(
+            profile_id=profile_id,
+            views=old_views + views,
+            company_views=old_company_views + company_views,
+            **{field: bucket},
+        ))
+    # MySQL ON DUPLICATE KEY UPDATE hedef kolon kabul etmez
+    unique_fields = ["profile", field] if connection.features.supports_update_conflicts_with_target else None
+    model.objects.bulk_create(
+        objs,
+        update_conflicts=True,
+        unique_fields=unique_fields,
+        update_fields=["views", "company_views"],
+    )
+
+
+def _aggregate(events, trunc):
+    return [
+        (row["profile_id"], row["bucket"], row["views"], row["company_views"])
+        for row in (
+            events.annotate(bucket=trunc("viewed_at"))
+            .values("profile_id", "bucket")
+            .annotate(views=Count("id"), company_views=Count("company_id"))
+            .order_by()
+        )
+    ]
+
+
+def rollup_view_events(batch_size: int = ROLLUP_BATCH_SIZE, stdout=None) -> int:
+    """
+    Ham olayları kovalara toplar ve siler; işlenen olay sayısını döner.
+    Her id aralığı tek transaction: sahiplenme (satır kilidi) + toplama +
+    kovalara ekleme + silme, yani bir olay ya hiç ya da tam bir kez sayılır.
+    Aralığı başka bir rollup tutuyorsa RollupInProgress yükselir. SQLite
+    satır kilidi desteklemez; orada yazarları veritabanı kilidi sıralar.
+    """
+    # Komut çalışırken gelen olaylar bir sonraki çalıştırmaya kalır
+    max_id = ProfileViewEvent.objects.order_by("-id").values_list("id", flat=True).first()
+    last_id = 0
+    total = 0
+    while max_id is not None and last_id < max_id:
+        boundary = list(
+            ProfileViewEvent.objects.filter(id__gt=last_id, id__lte=max_id)
+            .order_by("id").values_list("id", flat=True)[batch_size - 1:batch_size]
+        )
+        upper = boundary[0] if boundary else max_id
+        with transaction.atomic():
+            events = ProfileViewEvent.objects.filter(id__gt=last_id, id__lte=upper)
+            try:
+                claimed = len(events.select_for_update(nowait=True).values_list("id", flat=True))
+            except OperationalError as exc:
+                raise RollupInProgress() from exc
+            # Başka bir çalıştırma bu aralığı zaten toplayıp sildi
+            if claimed:
+                _merge_buckets(ProfileViewHourly, "bucket", _aggregate(events, TruncHour))
+                _merge_buckets(ProfileViewDaily, "day", _aggregate(events, TruncDate))
+                processed, _ = events.delete()
+                total += processed
+        last_id = upper
+        if stdout is not None:
+            stdout.write(f"{total} events rolled up")
+    return total
+
+
+def prune_hourly_buckets(retention_days: int = HOURLY_RETENTION_DAYS) -> int:
+    cutoff = timezone.now() - timedelta(days=retention_days)
+    deleted, _ = ProfileViewHourly.objects.filter(bucket__lt=cutoff).delete()
+    return deleted
+
+
+# ---------------------------------
+# Okuma
+# ---------------------------------
+def daily_view_series(profile_id, days: int = 30) -> list:
+    """Bugün dahil son ``days`` gün için [(date, views), ...]; boş günler 0."""
+    today = timezone.localdate()
+    start = today - timedelta(days=days - 1)
+    counts = dict(
+        ProfileViewDaily.objects.filter(profile_id=profile_id, day__gte=start, day__lte=today)
+        .values_list("day", "views")
+    )
+    return [(day, counts.get(day, 0)) for day in (start + timedelta(days=i) for i in range(days))]
+
+
+def hourly_view_series(profile_id, hours: int = 48) -> list:
+    """Son ``hours`` saat için [(saat başı, views), ...]; boş saatler 0."""
+    end = timezone.localtime().replace(minute=0, second=0, microsecond=0)
+    start = end - timedelta(hours=hours - 1)
+    counts = dict(
+        ProfileViewHourly.objects.filter(profile_id=profile_id, bucket__gte=start, bucket__lte=end)
+        .values_list("bucket", "views")
+    )
+    counts = {timezone.localtime(bucket): views for bucket, views in counts.items()}
+    return [(hour, counts.get(hour, 0)) for hour in (start + timedelta(hours=i) for i in range(hours))]
@@ -0,0 +1,166 @@
+# profiles/view_counter.py
+"""
+Profil görüntülenme sayacı.
+
+``PROFILE_VIEW_COUNTER_MODE`` ayarı:
+
+* ``"sync"`` (varsayılan): her görüntülemede ``profile_views + 1`` UPDATE'i.
+* ``"buffered"``: artışlar worker içi, thread-safe bir tamponda birikir; bir
+  arka plan thread'i her ``PROFILE_VIEW_FLUSH_INTERVAL`` saniyede bir
+  (ve süreç kapanırken) bunları toplu UPDATE'lerle yazar. Popüler
+  profillerde satır kilidi çekişmesi ve istek başına yazma ortadan kalkar.
+
+Her görüntüleme ayrıca analitik için bir ProfileViewEvent olarak kaydedilir
+(profiles.view_analytics); tamponlu modda olaylar da sayaçla aynı flush'ta
+tek bir bulk_create ile yazılır. Flush başarısız olursa boşaltılan sayılar
+ve olaylar tampona geri eklenir; artış kaybolmaz.
+"""
+import atexit
+import logging
+import threading
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Company, Profile, ProfileViewEvent
+
+logger = logging.getLogger(__name__)
+
+SYNC = "sync"
+BUFFERED = "buffered"
+
+
+def counter_mode() -> str:
+    return getattr(settings, "PROFILE_VIEW_COUNTER_MODE", SYNC)
+
+
+class ViewCountBuffer:
+    def __init__(self, interval: float | None = None):
+        self._lock = threading.Lock()
+        self._counts = Counter()
+        self._events = []
+        self._interval = interval
+        self._thread = None
+        self._stop = threading.Event()
+
+    def add(self, profile_id, n: int = 1) -> None:
+        with self._lock:
+            self._counts[profile_id] += n
+        self._ensure_thread()
+
+    def record(self, profile_id, company_id=None, viewed_at=None) -> None:
+        """Sayaç artışı + analitik olayı."""
+        event = ProfileViewEvent(
+            profile_id=profile_id, company_id=company_id, viewed_at=viewed_at or timezone.now()
+        )
+        with self._lock:
+            self._counts[profile_id] += 1
+            self._events.append(event)
+        self._ensure_thread()
+
+    def pending(self) -> int:
+        with self._lock:
+            return sum(self._counts.values())
+
+    def _drain(self):
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+            events, self._events = self._events, []
+        return counts, events
+
+    def _restore(self, counts: Counter, events: list) -> None:
+        with self._lock:
+            self._counts.update(counts)
+            self._events[:0] = events
+
+    def flush(self) -> int:
+        """
+        Biriken artışları yazar; yazılan toplam artışı döner. Aynı artış
+        miktarına sahip profiller tek ``UPDATE ... WHERE id IN (...)`` ile
+        güncellenir.
+        """
+        counts, events = self._drain()
+        if not counts and not events:
+            return 0
+        by_increment = defaultdict(list)
+        for profile_id, n in counts.items():
+            by_increment[n].append(profile_id)
+        try:
+            with transaction.atomic():
+                for n, ids in by_increment.items():
+                    Profile.objects.filter(pk__in=ids).update(profile_views=F("profile_views") + n)
+                ProfileViewEvent.objects.bulk_create(_live_events(events), batch_size=1000)
+        except Exception:
+            self._restore(counts, events)
+            raise
+        return sum(counts.values())
+
+    # --- arka plan flush ---
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="profile-view-flusher", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        from django.db import connection
+
+        interval = self._interval or getattr(settings, "PROFILE_VIEW_FLUSH_INTERVAL", 5.0)
+        while not self._stop.wait(interval):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("profile view counter flush failed; will retry")
+            finally:
+                connection.close_if_unusable_or_obsolete()
+        connection.close()
+
+    def stop(self, flush: bool = True) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        if flush:
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("profile view counter final flush failed")
+
+
+def _live_events(events):
+    """Flush'a kadar silinen profil/şirketlere ait olaylar FK hatasıyla tüm flush'ı düşürmesin."""
+    if not events:
+        return []
+    profile_ids = set(
+        Profile.objects.filter(pk__in={e.profile_id for e in events}).values_list("pk", flat=True)
+    )
+    company_ids = {e.company_id for e in events if e.company_id is not None}
+    if company_ids:
+        company_ids = set(Company.objects.filter(pk__in=company_ids).values_list("pk", flat=True))
+    live = []
+    for event in events:
+        if event.profile_id not in profile_ids:
+            continue
+        if event.company_id is not None and event.company_id not in company_ids:
+            event.company_id = None
+        live.append(event)
+    return live
+
+
+buffer = ViewCountBuffer()
+atexit.register(buffer.stop)
+
+
+def record_profile_view(profile_id, company_id=None) -> None:
+    """``company_id``: görüntüleyen şirket (recruiter), öğrenciler için None."""
+    if counter_mode() == BUFFERED:
+        buffer.record(profile_id, company_id)
+    else:
+        Profile.objects.filter(pk=profile_id).update(profile_views=F("profile_views") + 1)
+        ProfileViewEvent.objects.create(profile_id=profile_id, company_id=company_id, viewed_at=timezone.now())
@@ -1,12 +1,35 @@
+from bisect import bisect_right
+
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
-from django.views.decorators.http import require_POST
-from django.contrib.auth.models import User
-from django.utils.text import slugify
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_POST
 from django.urls import reverse
-from django.db.models import F
-
-from .models import Profile, Skill, Company
+from django.http import JsonResponse
+from django.template.loader import render_to_string
+
+from accounts.identity import user_company
+from core.replicas import use_replica
+
+from .cards import build_cards, card_rows
+from .dashboard import company_dashboard
+from .models import Profile, Company
+from .pagination import InvalidCursor, decode_cursor, encode_cursor, keyset_page
+from .ranking import ranked_page
+from .result_cache import bookmarked_profile_ids, cached_result
+from .facets import facet_counts
+from .loaders import load_profile_page, profile_page_counts
+from .skill_catalog import AUTOCOMPLETE_LIMIT, AUTOCOMPLETE_MAX_LIMIT, get_skill_catalog
+from .search import (
+    FILTER_KEYS,
+    SORT_COMPLETION,
+    apply_candidate_filters,
+    candidate_filters,
+    candidate_sort,
+    student_queryset,
+)
+from .view_analytics import daily_view_series
+from .view_counter import record_profile_view
 from .forms import (
     ProfileForm,
     ProjectForm,
@@ -18,38 +41,9 @@ from .forms import (
 # ---------------------------------
 # Yardımcılar
 # ---------------------------------
-def calculate_completion_percent(profile: Profile) -> int:
-    percent = 0
-    if getattr(profile, "bio", None):
-        percent += 30
-    if getattr(profile, "location", None):
-        percent += 30
-    if hasattr(profile, "skills") and profile.skills.exists():
-        percent += 40
-    return percent
-
-
-def calculate_company_completion(company: Company) -> int:
-    percent = 0
-    if getattr(company, "about", None):
-        percent += 30
-    if getattr(company, "location", None):
-        percent += 30
-    if hasattr(company, "positions") and company.positions.exists():
-        percent += 40
-    return percent
-
-
 def ensure_company_slug(company: Company) -> None:
-    """slug boşsa güvenli bir şekilde üretip kaydet."""
+    """slug boşsa Company.save üretip kaydeder (profiles.slugs)."""
     if not company.slug:
-        base = slugify(company.name or f"company-{company.pk}") or f"company-{company.pk}"
-        slug = base
-        i = 2
-        while Company.objects.filter(slug=slug).exclude(pk=company.pk).exists():
-            slug = f"{base}-{i}"
-            i += 1
-        company.slug = slug
         company.save(update_fields=["slug"])
 
 
@@ -59,22 +53,23 @@ def ensure_company_slug(company: Company) -> None:
 @login_required
 def profile_redirect(request):
     """Kullanıcı company’e bağlıysa şirket paneline, değilse öğrenci profiline gönder."""
-    try:
-        if hasattr(request.user, "company") and request.user.company:
-            ensure_company_slug(request.user.company)
-            return redirect("company_profile", slug=request.user.company.slug)
-    except Company.DoesNotExist:
-        pass
+    company = user_company(request.user)
+    if company:
+        ensure_company_slug(company)
+        return redirect("company_profile", slug=company.slug)
     return redirect("profile_detail", username=request.user.username)
 
 
 # ---------------------------------
 # Öğrenci profili (detay + formlar)
 # ---------------------------------
+VIEW_SERIES_DAYS = 30
+
+
 @login_required
 def profile_detail(request, username):
-    user = get_object_or_404(User, username=username)
-    profile, _ = Profile.objects.get_or_create(user=user)
+    profile = load_profile_page(username)
+    user = profile.user
     years = list(range(2020, 2036))
 
     profile_form = ProfileForm(instance=profile)
@@ -134,6 +129,9 @@ def profile_detail(request, username):
             profile.skills.set(skills_ids)
             return redirect("profile_detail", username=username)
 
+    related = profile_page_counts(profile)
+    view_series = daily_view_series(profile.pk, VIEW_SERIES_DAYS)
+
     context = {
         "profile_user": user,
         "profile": profile,
@@ -143,17 +141,20 @@ def profile_detail(request, username):
         "certification_form": certification_form,
         "years": years,
 
-        "projects": profile.projects.all() if hasattr(profile, "projects") else [],
-        "certifications": profile.certifications.all() if hasattr(profile, "certifications") else [],
+        "projects": related["projects"],
+        "certifications": related["certifications"],
 
-        "skills_count": profile.skills.count(),
-        "projects_count": profile.projects.count() if hasattr(profile, "projects") else 0,
-        "certifications_count": profile.certifications.count() if hasattr(profile, "certifications") else 0,
+        "skills_count": related["skills_count"],
+        "projects_count": related["projects_count"],
+        "certifications_count": related["certifications_count"],
         "profile_views": getattr(profile, "profile_views", 0),
-        "completion_percent": calculate_completion_percent(profile),
+        "views_last_7_days": sum(views for _, views in view_series[-7:]),
+        "views_last_30_days": sum(views for _, views in view_series),
+        "view_series": view_series,
+        "view_series_max": max((views for _, views in view_series), default=0),
+        "completion_percent": profile.completion_score,
 
-        "all_skills": Skill.objects.all(),
-        "skills": profile.skills.all(),
+        "skills": related["skills"],
     }
     return render(request, "profiles/profile_detail.html", context)
 
@@ -162,9 +163,11 @@ def profile_detail(request, username):
 # Şirket profili (liste + filtre + bookmark)
 # ---------------------------------
 @login_required
+@use_replica
 def company_profile(request, slug):
-    company = get_object_or_404(Company, slug=slug)
-    ensure_company_slug(company)
+    # slug ile bulunduğu için ensure_company_slug gerekmez; GET yazmaz
+    company = get_object_or_404(Company.objects.select_related("dashboard"), slug=slug)
+    dashboard = company_dashboard(company)
 
     company_form = CompanyForm(instance=company)
     position_form = PositionForm()
@@ -182,6 +185,7 @@ def company_profile(request, slug):
                 pos = position_form.save(commit=False)
                 pos.company = company
                 pos.save()
+                position_form.save_m2m()
                 return redirect("company_profile", slug=slug)
 
         elif "social_submit" in request.POST:
@@ -192,63 +196,329 @@ def company_profile(request, slug):
             return redirect("company_profile", slug=slug)
 
     # ---- Filtre parametreleri ----
-    tab = request.GET.get("tab", "all")
-    major = (request.GET.get("major") or "").strip()
-    skill = (request.GET.get("skill") or "").strip()
-    project_skill = (request.GET.get("project_skill") or "").strip()
-    location = (request.GET.get("location") or "").strip()
-    graduation_year = (request.GET.get("graduation_year") or "").strip()
-    internship_type = (request.GET.get("internship_type") or "").strip()
-
-    # SADECE ÖĞRENCİLER
-    base_students = (
-        Profile.objects.select_related("user")
-        .prefetch_related("skills", "projects")
-        .filter(user__company__isnull=True)
-        .exclude(user=getattr(company, "user", None))
+    tab = _normalize_tab(request.GET.get("tab"))
+    filters = candidate_filters(request.GET)
+    sort = candidate_sort(request.GET)
+
+    # Facet sayıları (cache'li); sonuç ve toplam sayıları da buradan gelir
+    facets = facet_counts(filters)
+    total_count = facet_counts({})["total"] if any(filters.values()) else facets["total"]
+
+    # Position'a göre sıralama (opsiyonel)
+    positions = list(company.positions.only("id", "title", "company")) if dashboard.open_positions else []
+    position = _ranking_position(positions, request.GET.get("position"))
+
+    # Sadece aktif sekmenin ilk sayfası render edilir
+    page, next_cursor = _company_students_page_or_first(
+        company, tab, filters, request.GET.get("cursor"), position, sort
     )
 
-    students_qs = base_students
-    if major:
-        students_qs = students_qs.filter(major__icontains=major)
-    if location:
-        students_qs = students_qs.filter(location__icontains=location)
-    if graduation_year:
-        students_qs = students_qs.filter(graduation_year=graduation_year)
-    if internship_type:
-        students_qs = students_qs.filter(internship_type__iexact=internship_type)
-    if skill:
-        students_qs = students_qs.filter(skills__name__icontains=skill).distinct()
-    if project_skill:
-        students_qs = students_qs.filter(projects__technologies__icontains=project_skill).distinct()
-
-    filtered_students = students_qs
-    filtered_count = filtered_students.count()
-    total_count = base_students.count()
-
-    # Bookmark’lar
-    bookmarked_students = company.bookmarked_students.select_related("user").prefetch_related("skills").all()
-    bookmarked_ids = set(bookmarked_students.values_list("id", flat=True))
+    context = _company_profile_context(
+        request, company, dashboard,
+        company_form=company_form,
+        position_form=position_form,
+        tab=tab,
+        sort=sort,
+        facets=facets,
+        total_count=total_count,
+        positions=positions,
+        position=position,
+        page=page,
+        next_cursor=next_cursor,
+        bookmarked_ids=_bookmarked_ids(company, page),
+    )
+    return render(request, "profiles/company_profile.html", context)
 
-    context = {
+
+def _company_profile_context(request, company, dashboard, *, company_form, position_form, tab, sort,
+                             facets, total_count, positions, position, page, next_cursor, bookmarked_ids):
+    """company_profile şablon context'i (sync ve async view ortak)."""
+    return {
         "company": company,
         "profile_views": 0,
-        "open_positions_count": company.positions.count(),
+        "open_positions_count": dashboard.open_positions,
         "applicants_count": 0,
-        "completion_percent": calculate_company_completion(company),
+        "completion_percent": company.completion_score,
         "company_form": company_form,
         "position_form": position_form,
 
-        "students": filtered_students,
-        "filtered_students": filtered_students,
-        "bookmarked_students": bookmarked_students,
+        "students": page if tab == "all" else [],
+        "bookmarked_students": page if tab == "bookmarked" else [],
         "bookmarked_ids": bookmarked_ids,
         "active_tab": tab,
+        "positions": positions,
+        "ranking_position": position,
+        "sort": sort,
+        "next_page_query": _next_page_query(request, next_cursor),
 
-        "filtered_count": filtered_count,
+        "facets": _facet_links(request, facets),
+        "filtered_count": facets["total"],
         "total_count": total_count,
+        "bookmarked_count": dashboard.bookmarks,
     }
-    return render(request, "profiles/company_profile.html", context)
+
+
+# ---------------------------------
+# Öğrenci listesi: sonraki sayfa (JSON + HTML parça, infinite scroll)
+# ---------------------------------
+STUDENTS_PAGE_SIZE = 20
+
+
+def _normalize_tab(tab) -> str:
+    return "bookmarked" if tab == "bookmarked" else "all"
+
+
+def _facet_links(request, facets) -> dict:
+    """Her facet değeri için o filtreyi uygulayan querystring."""
+    links = {}
+    for key in FILTER_KEYS:
+        items = []
+        for value, count in facets.get(key, []):
+            params = request.GET.copy()
+            params.pop("cursor", None)
+            params[key] = value
+            items.append({
+                "value": value,
+                "count": count,
+                "query": params.urlencode(),
+                "active": str(value).lower() == (request.GET.get(key) or "").strip().lower(),
+            })
+        links[key] = items
+    return links
+
+
+def _ranking_position(positions, position_id):
+    for pos in positions:
+        if str(pos.pk) == (position_id or "").strip():
+            return pos
+    return None
+
+
+def _company_students_page(company, tab, filters, cursor, position=None, sort=""):
+    """
+    Aktif sekme için keyset sayfası: (StudentCard listesi, next_cursor).
+    Position seçiliyse eşleşme puanı, değilse ``sort`` (tamamlanma skoru),
+    o da yoksa arama alakası / id sırası kullanılır.
+    """
+    if tab == "bookmarked":
+        ids = sorted(bookmarked_profile_ids(company.id))
+        if sort == SORT_COMPLETION:
+            rows = (
+                Profile.objects.filter(id__in=ids)
+                .order_by("-completion_score", "id")
+                .values_list("id", "completion_score")
+            )
+            ids, scores = tuple(zip(*rows)) or ((), ())
+            return _cached_students_page(ids, scores, cursor)
+        return _cached_students_page(ids, None, cursor)
+
+    if position is not None:
+        return _ranked_students_page(company, filters, cursor, position)
+
+    cached = _cached_filtered_ids(company, filters, sort)
+    if cached is not None:
+        ids, ranks = cached
+        ranked = bool(filters["q"]) or sort == SORT_COMPLETION
+        return _cached_students_page(ids, ranks if ranked else None, cursor)
+
+    # Sonuç cache'e sığmayacak kadar büyük: DB üzerinde keyset
+    extra, ordering = _students_ordering(filters, sort)
+    qs = apply_candidate_filters(student_queryset(company), filters)
+    rows, next_cursor = keyset_page(card_rows(qs, *extra), ordering, cursor, STUDENTS_PAGE_SIZE)
+    return build_cards(rows), next_cursor
+
+
+def _company_students_page_or_first(company, tab, filters, cursor, position=None, sort=""):
+    """Geçersiz cursor'da ilk sayfa (HTML sayfası hata vermez)."""
+    try:
+        return _company_students_page(company, tab, filters, cursor, position, sort)
+    except InvalidCursor:
+        return _company_students_page(company, tab, filters, None, position, sort)
+
+
+def _students_ordering(filters, sort):
+    """(sıralama kolonu, ordering): kolon keyset cursor'ının ilk değeridir."""
+    if sort == SORT_COMPLETION:
+        return ("completion_score",), ["-completion_score", "id"]
+    if filters["q"]:
+        return ("search_rank",), ["-search_rank", "id"]
+    return (), ["id"]
+
+
+def _cached_filtered_ids(company, filters, sort=""):
+    """Filtre sonucunun sıralı (ids, ranks) çifti, result cache üzerinden."""
+    def compute(limit):
+        qs = apply_candidate_filters(student_queryset(company), filters)
+        extra, ordering = _students_ordering(filters, sort)
+        if extra:
+            return list(qs.order_by(*ordering).values_list("id", *extra)[:limit])
+        return [(pk, None) for pk in qs.order_by(*ordering).values_list("id", flat=True)[:limit]]
+
+    return cached_result(filters, compute, sort)
+
+
+def _cached_students_page(ids, ranks, cursor):
+    """
+    Cache'ten gelen sıralı id listesinden sayfa. Cursor biçimi DB keyset
+    yoluyla aynıdır: ``[id]`` ya da ``[rank, id]``.
+    """
+    start = 0
+    if cursor:
+        values = decode_cursor(cursor, 2 if ranks else 1)
+        last_id = values[-1]
+        if ranks:
+            try:
+                start = ids.index(last_id) + 1
+            except ValueError:
+                raise InvalidCursor(cursor)
+        else:
+            if not isinstance(last_id, int):
+                raise InvalidCursor(cursor)
+            start = bisect_right(ids, last_id)
+
+    page_ids = ids[start:start + STUDENTS_PAGE_SIZE]
+    next_cursor = None
+    if start + STUDENTS_PAGE_SIZE < len(ids):
+        last = start + STUDENTS_PAGE_SIZE - 1
+        next_cursor = encode_cursor([ranks[last], ids[last]] if ranks else [ids[last]])
+    return _cards_in_order(page_ids), next_cursor
+
+
+def _cards_in_order(ids, scores=None):
+    cards = {card.id: card for card in build_cards(card_rows(Profile.objects.filter(id__in=ids)))}
+    page = []
+    for profile_id in ids:
+        card = cards.get(profile_id)
+        if card is not None:
+            if scores is not None:
+                card.score = scores[profile_id]
+            page.append(card)
+    return page
+
+
+def _ranked_students_page(company, filters, cursor, position):
+    """Position skill eşleşmesine göre sıralı sayfa (profiles.ranking)."""
+    candidate_ids = None
+    if any(filters.values()):
+        cached = _cached_filtered_ids(company, filters)
+        if cached is not None:
+            candidate_ids = cached[0]
+        else:
+            candidate_ids = apply_candidate_filters(student_queryset(company), filters).values_list("id", flat=True)
+    items, next_cursor = ranked_page(position, cursor, STUDENTS_PAGE_SIZE, candidate_ids)
+    return _cards_in_order([pk for pk, _ in items], dict(items)), next_cursor
+
+
+def _bookmarked_ids(company, profiles) -> set:
+    """Sayfadaki profillerden bookmark'lı olanlar (cache'li id kümesinden)."""
+    return bookmarked_profile_ids(company.id).intersection(p.id for p in profiles)
+
+
+def _next_page_query(request, next_cursor):
+    """Mevcut filtreler + cursor; hem sayfa hem JSON uç noktası için querystring."""
+    if not next_cursor:
+        return None
+    params = request.GET.copy()
+    params["cursor"] = next_cursor
+    return params.urlencode()
+
+
+@login_required
+@use_replica
+def company_students_page(request, slug):
+    company = get_object_or_404(Company, slug=slug)
+    tab = _normalize_tab(request.GET.get("tab"))
+    filters = candidate_filters(request.GET)
+    sort = candidate_sort(request.GET)
+    position = _ranking_position(company.positions.only("id", "title", "company"), request.GET.get("position"))
+
+    # Sayfa 1'e düşmek sonsuz kaydırmada zaten eklenmiş kartları tekrarlar
+    try:
+        page, next_cursor = _company_students_page(
+            company, tab, filters, request.GET.get("cursor"), position, sort
+        )
+    except InvalidCursor:
+        return JsonResponse({"error": "invalid_cursor"}, status=400)
+
+    html = render_to_string(
+        "profiles/_student_cards.html",
+        {
+            "students": page,
+            "bookmarked_ids": _bookmarked_ids(company, page),
+            "active_tab": tab,
+            "next_url": request.GET.get("next") or reverse("company_profile", kwargs={"slug": slug}),
+        },
+        request=request,
+    )
+    next_query = _next_page_query(request, next_cursor)
+    return JsonResponse({
+        "html": html,
+        "count": len(page),
+        "next_cursor": next_cursor,
+        "next_page_url": f"{request.path}?{next_query}" if next_query else None,
+    })
+
+
+# ---------------------------------
+# Aday arama API'si (JSON)
+# ---------------------------------
+SEARCH_API_MAX_LIMIT = 50
+
+
+@login_required
+@use_replica
+def candidate_search(request):
+    """company_profile ile aynı filtreler + ``q`` (alaka sıralı) üzerinden JSON sonuç."""
+    company = user_company(request.user)
+    if not company:
+        return JsonResponse({"error": "company_required"}, status=403)
+    return JsonResponse(_candidate_search_payload(company, request.GET))
+
+
+def _candidate_search_payload(company, params) -> dict:
+    filters = candidate_filters(params)
+    try:
+        limit = min(max(int(params.get("limit", 20)), 1), SEARCH_API_MAX_LIMIT)
+    except ValueError:
+        limit = 20
+
+    qs = apply_candidate_filters(student_queryset(company), filters)
+    if candidate_sort(params) == SORT_COMPLETION:
+        qs = qs.order_by("-completion_score", "id")
+    fields = ["id", "user_id", "user__username", "user__first_name", "user__last_name",
+              "major", "university", "location", "graduation_year", "completion_score"]
+    if filters["q"]:
+        fields.append("search_rank")
+
+    results = []
+    for row in qs.values(*fields)[:limit]:
+        full_name = f"{row['user__first_name']} {row['user__last_name']}".strip()
+        results.append({
+            "id": row["id"],
+            "user_id": row["user_id"],
+            "name": full_name or row["user__username"],
+            "major": row["major"],
+            "university": row["university"],
+            "location": row["location"],
+            "graduation_year": row["graduation_year"],
+            "completion": row["completion_score"],
+            "score": row.get("search_rank"),
+        })
+    return {"query": filters["q"], "results": results}
+
+
+# ---------------------------------
+# Skill autocomplete (JSON, süreç içi katalogdan)
+# ---------------------------------
+@login_required
+@use_replica
+def skill_autocomplete(request):
+    try:
+        limit = min(max(int(request.GET.get("limit", AUTOCOMPLETE_LIMIT)), 1), AUTOCOMPLETE_MAX_LIMIT)
+    except ValueError:
+        limit = AUTOCOMPLETE_LIMIT
+    matches = get_skill_catalog().complete(request.GET.get("q", ""), limit)
+    return JsonResponse({"results": [{"id": pk, "name": name} for pk, name in matches]})
 
 
 # ---------------------------------
@@ -257,7 +527,7 @@ def company_profile(request, slug):
 @login_required
 @require_POST
 def toggle_bookmark(request, student_id: int):
-    company = getattr(request.user, "company", None)
+    company = user_company(request.user)
     if not company:
         return redirect("profile_redirect")
 
@@ -282,8 +552,9 @@ def toggle_bookmark(request, student_id: int):
 @login_required
 @require_POST
 def increment_profile_views(request, user_id: int):
-    profile = get_object_or_404(Profile, user_id=user_id)
-    Profile.objects.filter(pk=profile.pk).update(profile_views=F("profile_views") + 1)
+    profile = get_object_or_404(Profile.objects.only("id"), user_id=user_id)
+    company = user_company(request.user)
+    record_profile_view(profile.pk, company.pk if company else None)
 
     next_url = request.POST.get("next") or reverse(
         "student_profile_view", kwargs={"user_id": user_id}
@@ -294,27 +565,58 @@ def increment_profile_views(request, user_id: int):
 # ---------------------------------
 # Öğrenci herkese açık profil (Recruiter "View Profile")
 # ---------------------------------
+PUBLIC_PROFILE_FRAGMENT_TIMEOUT = 60 * 60
+
+
+def _public_profile_stamp(request, user_id):
+    """
+    (profile pk, updated_at) tek sorguyla; ETag ve Last-Modified aynı
+    istek içinde tekrar sorgulamasın diye request üzerinde tutulur.
+    """
+    cache_attr = "_public_profile_stamp"
+    if not hasattr(request, cache_attr):
+        setattr(request, cache_attr, Profile.objects.filter(user_id=user_id).values_list("pk", "updated_at").first())
+    return getattr(request, cache_attr)
+
+
+def _public_profile_etag(request, user_id):
+    stamp = _public_profile_stamp(request, user_id)
+    if stamp is None:
+        return None
+    pk, updated_at = stamp
+    return f'"profile-{pk}-{updated_at.timestamp():.6f}"'
+
+
+def _public_profile_last_modified(request, user_id):
+    stamp = _public_profile_stamp(request, user_id)
+    return stamp[1] if stamp else None
+
+
 @login_required
+@use_replica
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=_public_profile_etag, last_modified_func=_public_profile_last_modified)
 def student_profile_view(request, user_id: int):
-    profile = get_object_or_404(
-        Profile.objects.select_related("user").prefetch_related(
-            "skills", "projects", "certifications"
-        ),
-        user_id=user_id,
-    )
-    return render(
-        request,
-        "profiles/student_public_profile.html",
-        {
-            "profile": profile,
-            "profile_user": profile.user,
-            "skills": profile.skills.all(),
-            "projects": profile.projects.all() if hasattr(profile, "projects") else [],
-            "certifications": profile.certifications.all()
-            if hasattr(profile, "certifications")
-            else [],
-        },
-    )
+    """
+    Değişmemiş profil için 304 (tek sorgu). Tam render'da skill / proje /
+    sertifika bölümü ``updated_at``'e bağlı fragment cache'ten gelir; ilişkiler
+    sadece cache ıskasında sorgulanır.
+    """
+    profile = get_object_or_404(Profile.objects.select_related("user"), user_id=user_id)
+    return render(request, "profiles/student_public_profile.html", _public_profile_context(profile))
+
+
+def _public_profile_context(profile) -> dict:
+    # İlişkiler lazy: yalnızca fragment cache ıskasında sorgulanır
+    return {
+        "profile": profile,
+        "profile_user": profile.user,
+        "fragment_version": f"{profile.updated_at.timestamp():.6f}",
+        "fragment_timeout": PUBLIC_PROFILE_FRAGMENT_TIMEOUT,
+        "skills": profile.skills.all(),
+        "projects": profile.projects.all(),
+        "certifications": profile.certifications.all(),
+    }
 
 
 # ---------------------------------
@@ -21,6 +21,14 @@ def env_list(key: str, default: list[str] | None = None) -> list[str]:
         return default or []
     return [item.strip() for item in raw.split(",") if item.strip()]
 
+def replica_databases(primary: dict, targets: list[str]) -> dict:
+    """primary'nin kopyası olarak "replica1", "replica2", ... (SQLite'ta hedef dosya yolu, diğerlerinde HOST)."""
+    field = "NAME" if primary["ENGINE"].endswith("sqlite3") else "HOST"
+    return {
+        f"replica{i}": {**primary, field: target, "TEST": {"MIRROR": "default"}}
+        for i, target in enumerate(targets, start=1)
+    }
+
 # --------- Security ----------
 SECRET_KEY = os.getenv("DJANGO_SECRET_KEY", "django-insecure-change-me")
 DEBUG = env_bool("DJANGO_DEBUG", True)
@@ -55,6 +63,9 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",  # static for prod
+    "core.instrumentation.RequestMetricsMiddleware",  # örneklenmiş Server-Timing + log
+    "core.nplusone.QueryAuditMiddleware",  # N+1 / sorgu bütçesi (DEBUG ve testler)
+    "core.replicas.ReplicaPinMiddleware",  # yazımdan sonra primary'ye sabitleme
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -65,10 +76,56 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = "smartintern.urls"
 
+# ASGI (smartintern.asgi) altında arama / liste / herkese açık profil async
+# view'larla sunulur (profiles.async_views). ASYNC_PARALLEL_QUERIES bağımsız
+# sorguları ayrı bağlantılarda aynı anda çalıştırır; her çağrı bir bağlantı
+# açtığı için yalnızca kalıcı bağlantılarla (CONN_MAX_AGE > 0) açılmalıdır.
+# Varsayılan dağıtım WSGI'dir (Procfile web, main.py); ASYNC_VIEWS açılırken
+# Procfile'daki web komutu da ASGI'ye çevrilmelidir:
+#   web: gunicorn smartintern.asgi:application -k uvicorn_worker.UvicornWorker --log-file -
+# WSGI altında async view'lar istek başına async_to_sync ile çalışır; kazanç olmaz.
+ASYNC_VIEWS = env_bool("ASYNC_VIEWS", False)
+ASYNC_PARALLEL_QUERIES = env_bool("ASYNC_PARALLEL_QUERIES", False)
+
+# --------- Performans ölçümü (core.instrumentation) ----------
+# Örneklenen isteklerde sorgu sayısı/süresi, en yavaş sorgular, şablon ve toplam
+# süre Server-Timing başlığı ve JSON log satırı olarak yazılır. DEBUG'da
+# varsayılan kapalı (0); üretimde isteklerin %5'i.
+PERF_SAMPLE_RATE = float(os.getenv("PERF_SAMPLE_RATE", "0" if DEBUG else "0.05"))
+PERF_SLOW_REQUEST_MS = float(os.getenv("PERF_SLOW_REQUEST_MS", "500"))
+PERF_SLOW_QUERY_COUNT = int(os.getenv("PERF_SLOW_QUERY_COUNT", "5"))
+# Server-Timing sorgu sayısı ve süreleri her istemciye açar: üretimde kapalı
+PERF_SERVER_TIMING = env_bool("PERF_SERVER_TIMING", DEBUG)
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {"console": {"class": "logging.StreamHandler"}},
+    "loggers": {
+        "core.instrumentation": {
+            "handlers": ["console"],
+            "level": os.getenv("PERF_LOG_LEVEL", "INFO"),
+            "propagate": False,
+        },
+        "core.nplusone": {"handlers": ["console"], "level": "WARNING", "propagate": False},
+    },
+}
+
+# --------- Sorgu denetimi (core.nplusone) ----------
+# Aynı SELECT bir istekte NPLUSONE_THRESHOLD'dan fazla çalışırsa ya da view
+# core.query_budgets'taki bütçesini aşarsa: DEBUG'da WARNING log, testlerde
+# (QueryAuditRunner) hata.
+NPLUSONE_DETECT = env_bool("NPLUSONE_DETECT", DEBUG)
+NPLUSONE_RAISE = env_bool("NPLUSONE_RAISE", False)
+NPLUSONE_THRESHOLD = int(os.getenv("NPLUSONE_THRESHOLD", "5"))
+TEST_RUNNER = "core.testing.QueryAuditRunner"
+
 # --------- Templates ----------
 TEMPLATES = [
     {
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        # DjangoTemplates + örneklenen isteklerde render süresi (core.instrumentation)
+        "BACKEND": "core.instrumentation.TimedDjangoTemplates",
+        "NAME": "django",
         # İstersen global templates klasörü kullan:
         "DIRS": [BASE_DIR / "templates"],
         "APP_DIRS": True,
@@ -105,6 +162,59 @@ DATABASES = {
     }
 }
 
+# Okuma replikaları: DB_REPLICAS=host1,host2 -> "replica1", "replica2".
+# Arama / liste / herkese açık profil GET'leri replikadan okur (core.replicas);
+# yazım yapan istemci REPLICA_PIN_SECONDS boyunca primary'den okur.
+# Yerelde iki SQLite ile: DATABASES = {"default": <sqlite a>};
+# DATABASES.update(replica_databases(DATABASES["default"], ["b.sqlite3"]))
+# ve DATABASE_REPLICAS'ı yeniden hesapla.
+DATABASES.update(replica_databases(DATABASES["default"], env_list("DB_REPLICAS")))
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != "default"]
+DATABASE_ROUTERS = ["core.replicas.PrimaryReplicaRouter"]
+REPLICA_PIN_SECONDS = int(os.getenv("REPLICA_PIN_SECONDS", "10"))
+
+# --------- Cache ----------
+# REDIS_URL verilirse (redis paketi gerekir) cache'ler worker'lar arasında
+# paylaşılır; sürüm sayaçları (profiles.versioning) tüm süreçlerde geçerli
+# olur. Redis'te LRU tahliyesi için sunucuda maxmemory-policy=allkeys-lru.
+REDIS_URL = os.getenv("REDIS_URL")
+CANDIDATE_RESULTS_CACHE_TIMEOUT = int(os.getenv("CANDIDATE_RESULTS_CACHE_TIMEOUT", "300"))
+CANDIDATE_RESULTS_CACHE_MAX_ENTRIES = int(os.getenv("CANDIDATE_RESULTS_CACHE_MAX_ENTRIES", "500"))
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        },
+        "candidate_results": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+            "KEY_PREFIX": "results",
+            "TIMEOUT": CANDIDATE_RESULTS_CACHE_TIMEOUT,
+        },
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "default",
+        },
+        # LocMem en az kullanılanı atar (LRU); MAX_ENTRIES üst sınır
+        "candidate_results": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "candidate-results",
+            "TIMEOUT": CANDIDATE_RESULTS_CACHE_TIMEOUT,
+            "OPTIONS": {"MAX_ENTRIES": CANDIDATE_RESULTS_CACHE_MAX_ENTRIES},
+        },
+    }
+
+# --------- Profil görüntülenme sayacı ----------
+# "sync": her görüntülemede UPDATE. "buffered": worker içinde biriktirilip
+# PROFILE_VIEW_FLUSH_INTERVAL saniyede bir toplu yazılır (profiles.view_counter).
+PROFILE_VIEW_COUNTER_MODE = os.getenv("PROFILE_VIEW_COUNTER_MODE", "sync")
+PROFILE_VIEW_FLUSH_INTERVAL = float(os.getenv("PROFILE_VIEW_FLUSH_INTERVAL", "5"))
+
 # --------- Password validation ----------
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
@@ -123,7 +233,22 @@ USE_TZ = True
 STATIC_URL = "/static/"
 STATICFILES_DIRS = [BASE_DIR / "static"]  # klasör yoksa kaldır
 STATIC_ROOT = BASE_DIR / "staticfiles"
-STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
+
+# Üretimde (collectstatic sonrası) css/js içerik hash'li adlarla ve hazır
+# .gz/.br kopyalarıyla yayınlanır; WhiteNoise hash'li dosyalara 10 yıllık
+# "immutable" Cache-Control verir. Manifest collectstatic'le oluşur: DEBUG'da
+# ve testlerde yoksa {% static %} hata verir, bu yüzden orada düz storage.
+STATIC_MANIFEST = env_bool("STATIC_MANIFEST", not DEBUG)
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {
+        "BACKEND": (
+            "whitenoise.storage.CompressedManifestStaticFilesStorage"
+            if STATIC_MANIFEST
+            else "django.contrib.staticfiles.storage.StaticFilesStorage"
+        ),
+    },
+}
 
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
@@ -144,6 +269,25 @@ EMAIL_TIMEOUT = int(os.getenv("EMAIL_TIMEOUT", "30"))
 DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL", EMAIL_HOST_USER or "no-reply@lazyintern.local")
 SERVER_EMAIL = DEFAULT_FROM_EMAIL
 
+# Uygulama mailleri istekte gönderilmez: accounts.outbox kuyruğuna yazılır,
+# `manage.py send_outbox` worker'ı tek SMTP bağlantısıyla gönderir.
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", "6"))
+# App Engine'de worker süreci yok: cron.yaml kuyruğu /accounts/outbox/drain/
+# ile boşaltır. Uç nokta yalnız açıkken X-Appengine-Cron başlığına güvenir.
+EMAIL_OUTBOX_CRON = env_bool("EMAIL_OUTBOX_CRON", os.getenv("GAE_ENV", "").startswith("standard"))
+
+# --------- Authentication ----------
+# E-posta ile giriş (tek sorgu, LOWER(email) index'i); kullanıcı adı yolu ModelBackend'den.
+# ModelBackend listede kalır: oturum backend yolunu saklar, EmailBackend'den
+# önce açılmış oturumlar onunla doğrulanmaya devam eder (yeniden giriş gerekmez)
+AUTHENTICATION_BACKENDS = [
+    "accounts.backends.EmailBackend",
+    "django.contrib.auth.backends.ModelBackend",
+]
+# request.user şirket/profil ile tek sorguda yüklenir; >0 ise bu kadar saniye
+# cache'te tutulur (kayıtta silinir, accounts.identity). 0: her istekte sorgu.
+IDENTITY_CACHE_TIMEOUT = int(os.getenv("IDENTITY_CACHE_TIMEOUT", "0"))
+
 # --------- Auth redirects ----------
 LOGIN_REDIRECT_URL = "/profiles/redirect/"
 LOGOUT_REDIRECT_URL = "/accounts/login/"
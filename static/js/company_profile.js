@@ -0,0 +1,40 @@
+function switchTab(tab){
+  const url = new URL(window.location);
+  url.searchParams.set('tab', tab);
+  url.searchParams.delete('cursor');
+  window.location = url.toString();
+}
+
+// Infinite scroll: sentinel görünür olunca sonraki sayfa eklenir
+(function(){
+  const sentinel = document.getElementById('load-more');
+  const list = document.getElementById('student-list');
+  if (!sentinel || !list || !('IntersectionObserver' in window)) return;
+
+  let loading = false;
+  const observer = new IntersectionObserver(async (entries) => {
+    if (!entries[0].isIntersecting || loading) return;
+    const nextUrl = sentinel.dataset.nextUrl;
+    if (!nextUrl) return;
+    loading = true;
+    try {
+      const url = new URL(nextUrl, window.location);
+      url.searchParams.set('next', window.location.pathname + window.location.search);
+      const resp = await fetch(url, {headers: {'X-Requested-With': 'XMLHttpRequest'}});
+      if (!resp.ok) throw new Error(resp.status);
+      const data = await resp.json();
+      list.insertAdjacentHTML('beforeend', data.html);
+      if (data.next_page_url) {
+        sentinel.dataset.nextUrl = data.next_page_url;
+      } else {
+        observer.disconnect();
+        sentinel.remove();
+      }
+    } catch (e) {
+      observer.disconnect();  // fallback: "Load more" linki
+    } finally {
+      loading = false;
+    }
+  }, {rootMargin: '400px'});
+  observer.observe(sentinel);
+})();
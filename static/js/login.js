@@ -0,0 +1,5 @@
+function updateButtonText() {
+  const select = document.getElementById('loginAs');
+  const button = document.getElementById('loginButton');
+  button.textContent = select.value === 'student' ? 'Login as Student' : 'Login as Company';
+}
@@ -0,0 +1,28 @@
+// Herkese açık profil: görüntülenme sayacı (URL script etiketinin data-url'inden)
+(function () {
+  // CSRF helper (Django docs)
+  function getCookie(name) {
+    let cookieValue = null;
+    if (document.cookie && document.cookie !== '') {
+      const cookies = document.cookie.split(';');
+      for (let i = 0; i < cookies.length; i++) {
+        const cookie = cookies[i].trim();
+        if (cookie.substring(0, name.length + 1) === (name + '=')) {
+          cookieValue = decodeURIComponent(cookie.substring(name.length + 1));
+          break;
+        }
+      }
+    }
+    return cookieValue;
+  }
+
+  const url = document.currentScript.dataset.url;
+  const csrftoken = getCookie('csrftoken');
+
+  window.addEventListener('load', () => {
+    fetch(url, {
+      method: "POST",
+      headers: {"X-CSRFToken": csrftoken}
+    }).catch(() => {});
+  });
+})();
@@ -0,0 +1,74 @@
+// Skill seçici: [data-skill-picker] kapsayıcısı başına bir arama kutusu.
+// Seçilenler data-name adlı gizli input'lar olarak forma eklenir; katalog
+// sayfaya gömülmez, yazdıkça data-url'den (skill_autocomplete) gelir.
+(function () {
+  document.querySelectorAll('[data-skill-picker]').forEach((picker) => {
+    const input = picker.querySelector('.skill-search');
+    const list = picker.querySelector('.skill-suggestions');
+    const selected = picker.querySelector('.selected-skills');
+    const name = picker.dataset.name;
+    let timer = null;
+    let seq = 0;
+
+    function selectedIds() {
+      return new Set(Array.from(selected.querySelectorAll('.skill-chip')).map(el => el.dataset.id));
+    }
+
+    function addSkill(id, label) {
+      if (selectedIds().has(String(id))) return;
+      const chip = document.createElement('span');
+      chip.className = 'skill-chip';
+      chip.dataset.id = id;
+      chip.append(document.createTextNode(label + ' '));
+      const hidden = document.createElement('input');
+      hidden.type = 'hidden'; hidden.name = name; hidden.value = id;
+      const remove = document.createElement('button');
+      remove.type = 'button'; remove.className = 'btn-close btn-close-sm'; remove.setAttribute('aria-label', 'Remove');
+      chip.append(hidden, remove);
+      selected.append(chip);
+    }
+
+    selected.addEventListener('click', (e) => {
+      if (e.target.classList.contains('btn-close')) e.target.closest('.skill-chip').remove();
+    });
+
+    function render(results) {
+      list.innerHTML = '';
+      const taken = selectedIds();
+      results.filter(r => !taken.has(String(r.id))).forEach(r => {
+        const item = document.createElement('button');
+        item.type = 'button';
+        item.className = 'list-group-item list-group-item-action';
+        item.textContent = r.name;
+        item.addEventListener('click', () => {
+          addSkill(r.id, r.name);
+          list.innerHTML = '';
+          input.value = '';
+          input.focus();
+        });
+        list.append(item);
+      });
+    }
+
+    input.addEventListener('input', () => {
+      clearTimeout(timer);
+      const q = input.value.trim();
+      if (!q) { list.innerHTML = ''; return; }
+      timer = setTimeout(() => {
+        const current = ++seq;
+        fetch(picker.dataset.url + '?q=' + encodeURIComponent(q), {headers: {'Accept': 'application/json'}})
+          .then(r => r.json())
+          .then(data => { if (current === seq) render(data.results || []); })
+          .catch(() => {});
+      }, 150);
+    });
+
+    input.addEventListener('keydown', (e) => {
+      if (e.key === 'Enter') {
+        e.preventDefault();
+        const first = list.querySelector('button');
+        if (first) first.click();
+      }
+    });
+  });
+})();